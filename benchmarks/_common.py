@@ -0,0 +1,64 @@
+import gc
+import logging
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Tuple
+
+BENCH_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = BENCH_DIR.parent
+SRC_DIR = PROJECT_ROOT / "src"
+
+# Make the scraper's namespace packages importable, mirroring src/main.py
+for path in (SRC_DIR, BENCH_DIR):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+def quiet_logger(name: str = "bench") -> logging.Logger:
+    logger = logging.getLogger(name)
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+    return logger
+
+def standin_scraper(server, cls=None, **options):
+    """
+    A scraper (YouTubeScraper unless cls is given) with a quiet logger,
+    pointed at a running StandinServer. options go to the constructor.
+    """
+    if cls is None:
+        # Imported here so benchmarks that never scrape stay light
+        from parsers.youtube_parser import YouTubeScraper  # type: ignore
+
+        cls = YouTubeScraper
+    scraper = cls(api_key="bench", logger=quiet_logger(), **options)
+    server.configure_scraper(scraper)
+    return scraper
+
+class Stopwatch:
+    """Wall and CPU time since construction."""
+
+    def __init__(self) -> None:
+        self._wall = time.perf_counter()
+        self._cpu = time.process_time()
+
+    @property
+    def wall(self) -> float:
+        return time.perf_counter() - self._wall
+
+    def elapsed(self) -> Dict[str, float]:
+        return {"wall": self.wall, "cpu": time.process_time() - self._cpu}
+
+@contextmanager
+def traced_memory() -> Iterator[Callable[[], Tuple[int, int]]]:
+    """
+    Trace allocations in the block, after a collection; yields a function
+    returning (bytes held now, peak bytes) since the block started.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        yield tracemalloc.get_traced_memory
+    finally:
+        tracemalloc.stop()
@@ -0,0 +1,78 @@
+"""
+Synthetic YouTube About pages for extraction benchmarks.
+
+Pages mimic the real layout: several hundred KB dominated by inline
+scripts (ytcfg, ytInitialData), a little visible markup, entities,
+comments and styles. Saved real pages can be used instead by pointing the
+benchmarks at a directory of .html files.
+"""
+
+import json
+import random
+from pathlib import Path
+from typing import List, Optional
+
+VISIBLE_SNIPPETS = [
+    "Business inquiries: {name}@gmail.com",
+    "Call &amp; WhatsApp: +1 (555) {a:03d}-{b:04d}",
+    "Booking &lt;{name}.booking@yahoo.com&gt;",
+    "Office: 020 {a:04d} {b:04d}",
+    "New videos every Friday &nbsp;&mdash; subscribe!",
+    "Sponsorships {name}@agency.co.uk or call 91 76750 {b:05d}",
+    "We are 100% independent, est. 2015",
+]
+
+def make_about_page(index: int, script_kb: int = 400, seed: Optional[int] = None) -> str:
+    rng = random.Random(index if seed is None else seed)
+    name = f"creator{index}"
+    visible = [
+        rng.choice(VISIBLE_SNIPPETS).format(
+            name=name, a=rng.randrange(1000), b=rng.randrange(10000)
+        )
+        for _ in range(rng.randint(1, 4))
+    ]
+
+    initial_data = {
+        "contents": {
+            "aboutRenderer": {
+                "description": {"simpleText": " ".join(visible) + f" | extra {name}@hotmail.com"},
+                "links": [{"title": {"simpleText": "Website"}, "url": f"https://{name}.example"}],
+            }
+        },
+        "padding": ["x" * 80 for _ in range(script_kb * 1024 // 200)],
+    }
+    script_noise = json.dumps(
+        {"ytcfg": {"EMAIL_HINT": "noreply@youtube.com", "blob": "y" * (script_kb * 1024 // 2)}}
+    )
+
+    body_paragraphs = "\n".join(
+        f'<p class="about-line" data-i="{i}">{line}</p>' for i, line in enumerate(visible)
+    )
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>Channel {index} - YouTube</title>
+<style>.about-line {{ color: #333; }} a > b {{ margin: 0 }}</style>
+<script nonce="abc">var ytcfg = {script_noise};</script>
+<!-- contact: hidden@comment.example 555 123 4567 -->
+</head>
+<body>
+<div id="header"><h1>Channel &#8220;{index}&#8221;</h1></div>
+<div id="about">
+{body_paragraphs}
+<span>Joined Mar 3, 2015</span> <span>{rng.randrange(10**6):,} views</span>
+</div>
+<script>var ytInitialData = {json.dumps(initial_data)};</script>
+<template><p>template@hidden.example</p></template>
+</body>
+</html>
+"""
+
+def load_pages(fixtures_dir: Optional[Path], count: int, script_kb: int) -> List[str]:
+    if fixtures_dir is not None:
+        return [
+            p.read_text(encoding="utf-8", errors="replace")
+            for p in sorted(fixtures_dir.glob("*.html"))
+        ]
+    return [make_about_page(i, script_kb=script_kb) for i in range(count)]
@@ -0,0 +1,65 @@
+"""
+Per-page About extraction time for each backend, with a parity check.
+
+Every backend's text is run through the contact extractors; the fast
+backend must find exactly the emails and phones the BeautifulSoup
+backend finds.
+
+    python benchmarks/bench_about_extract.py --pages 50
+    python benchmarks/bench_about_extract.py --fixtures path/to/saved/about/pages
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import _common  # noqa: F401 - sets up sys.path
+from about_fixtures import load_pages
+
+from parsers.about_extract import BACKENDS  # type: ignore
+from parsers.utils_extract import extract_emails, extract_phones  # type: ignore
+
+def contacts_of(text: str):
+    return extract_emails(text), extract_phones(text)
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, default=50)
+    parser.add_argument("--script-kb", type=int, default=400)
+    parser.add_argument("--fixtures", type=Path, default=None)
+    args = parser.parse_args()
+
+    pages = load_pages(args.fixtures, args.pages, args.script_kb)
+    if not pages:
+        print("No fixture pages found.")
+        return 1
+    avg_kb = sum(len(p) for p in pages) / len(pages) / 1024
+    print(f"{len(pages)} pages, {avg_kb:.0f} KB average")
+
+    results = {}
+    for name, backend in BACKENDS.items():
+        timings = []
+        found = []
+        for page in pages:
+            start = time.perf_counter()
+            text = backend(page)
+            timings.append(time.perf_counter() - start)
+            found.append(contacts_of(text))
+        results[name] = found
+        print(
+            f"{name:<13} median {statistics.median(timings) * 1000:8.2f} ms/page  "
+            f"max {max(timings) * 1000:8.2f} ms/page"
+        )
+
+    mismatches = sum(1 for a, b in zip(results["fast"], results["soup"]) if a != b)
+    extra = sum(
+        len(set(a[0]) - set(b[0])) for a, b in zip(results["initial_data"], results["soup"])
+    )
+    print(f"fast vs soup: {mismatches} pages with different emails/phones")
+    print(f"initial_data: {extra} additional emails found beyond visible text")
+    return 1 if mismatches else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+"""
+About-page download: buffered `resp.text` vs the streaming AboutStreamer.
+
+Pages from the local stand-in end with a large trailing script after
+</body> (--tail-kb), like the player scripts on real About pages. The
+buffered side downloads and decodes every page whole, as the scraper used
+to; the streamed side stops once </body> has been read. Reports bytes
+downloaded, CPU time, wall time and peak traced memory per page, checks
+that both give the same About text for every chunk size (including tiny
+ones, so stop markers straddle chunk boundaries), and runs a concurrent
+pass under a small in-flight byte budget to show it applies backpressure
+without deadlocking.
+
+    python benchmarks/bench_about_stream.py --pages 200 --tail-kb 300
+"""
+
+import argparse
+import multiprocessing
+import statistics
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List
+
+import _common  # noqa: F401 - sets up sys.path
+from _common import Stopwatch, quiet_logger, traced_memory
+from standin_server import StandinConfig, StandinServer, channel_id_for
+
+import requests
+
+from parsers.about_extract import STOP_MARKERS, about_text_fast  # type: ignore
+from parsers.about_stream import AboutStreamer  # type: ignore
+
+def serve(config: StandinConfig, ready) -> None:
+    """Stand-in in its own process, so its work is not measured as ours."""
+    with StandinServer(config) as server:
+        ready.put(server.base_url)
+        server.thread.join()
+
+def buffered(session: requests.Session, url: str) -> str:
+    return session.get(url, timeout=15).text
+
+def streamed(session: requests.Session, url: str, streamer: AboutStreamer) -> str:
+    with session.get(url, timeout=15, stream=True) as resp:
+        resp.raise_for_status()
+        return streamer.read(resp, STOP_MARKERS["fast"])
+
+def run_pass(urls: List[str], fetch: Callable[[str], str]) -> dict:
+    clock = Stopwatch()
+    texts = [about_text_fast(fetch(url)) for url in urls]
+    elapsed = clock.elapsed()
+    cpu, wall = elapsed["cpu"], elapsed["wall"]
+    peaks = []
+    for url in urls[:20]:
+        with traced_memory() as memory:
+            about_text_fast(fetch(url))
+            peaks.append(memory()[1])
+    return {
+        "texts": texts,
+        "cpu_ms": cpu / len(urls) * 1000,
+        "wall_ms": wall / len(urls) * 1000,
+        "peak_kb": statistics.median(peaks) / 1024,
+    }
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--tail-kb", type=int, default=300)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--budget-kb", type=int, default=1)
+    args = parser.parse_args()
+
+    config = StandinConfig(total_channels=args.pages, tail_padding=args.tail_kb * 1024)
+    ready = multiprocessing.Queue()
+    server = multiprocessing.Process(target=serve, args=(config, ready), daemon=True)
+    server.start()
+    try:
+        base_url = ready.get(timeout=30)
+        urls = [f"{base_url}/channel/{channel_id_for(i)}/about" for i in range(args.pages)]
+        session = requests.Session()
+        full_bytes = len(session.get(urls[0]).content)
+
+        old = run_pass(urls, lambda url: buffered(session, url))
+        streamer = AboutStreamer(logger=quiet_logger())
+        new = run_pass(urls, lambda url: streamed(session, url, streamer))
+        read_kb = streamer.bytes_read / streamer.pages / 1024
+
+        same = new["texts"] == old["texts"]
+        for chunk_size in (1, 7, 64, 4096):
+            tiny = AboutStreamer(chunk_size=chunk_size, logger=quiet_logger())
+            for url in urls[:3]:
+                same = same and about_text_fast(streamed(session, url, tiny)) == about_text_fast(
+                    buffered(session, url)
+                )
+
+        # Small chunks under a tiny budget, so pages in flight contend for it
+        budgeted = AboutStreamer(
+            chunk_size=256, inflight_bytes=args.budget_kb * 1024, logger=quiet_logger()
+        )
+        with ThreadPoolExecutor(args.threads) as pool:
+            thread_session = requests.Session()
+            concurrent = list(
+                pool.map(lambda url: about_text_fast(streamed(thread_session, url, budgeted)), urls)
+            )
+        same = same and concurrent == old["texts"]
+    finally:
+        server.terminate()
+
+    print(f"{args.pages} pages of {full_bytes / 1024:.1f} KB ({args.tail_kb} KB after </body>)")
+    print(f"{'mode':<9} {'KB/page':>8} {'cpu ms':>7} {'wall ms':>8} {'peak KB':>8}")
+    print(
+        f"{'buffered':<9} {full_bytes / 1024:>8.1f} {old['cpu_ms']:>7.2f} "
+        f"{old['wall_ms']:>8.2f} {old['peak_kb']:>8.1f}"
+    )
+    print(
+        f"{'streamed':<9} {read_kb:>8.1f} {new['cpu_ms']:>7.2f} "
+        f"{new['wall_ms']:>8.2f} {new['peak_kb']:>8.1f}"
+    )
+    print(
+        f"{args.threads} threads under a {args.budget_kb} KB in-flight budget: "
+        f"{budgeted.budget.waits} waits, {budgeted.budget.wait_seconds:.2f}s waiting"
+    )
+    print(f"same About text: {same}")
+    return 0 if same and read_kb < full_bytes / 1024 else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+"""
+About-page enrichment speedup versus worker count.
+
+Runs YouTubeScraper.scrape_contacts against the local stand-in with a
+fixed About-page latency and checks that output is identical to the
+sequential path while wall-clock drops close to linearly with workers.
+
+    python benchmarks/bench_concurrency.py --channels 200 --latency 0.05
+"""
+
+import argparse
+import sys
+
+import _common  # noqa: F401 - sets up sys.path
+from _common import Stopwatch, standin_scraper
+from standin_server import StandinConfig, StandinServer
+
+def run_once(server: StandinServer, channels: int, workers: int):
+    scraper = standin_scraper(server, concurrency=workers)
+    clock = Stopwatch()
+    contacts = scraper.scrape_contacts("bench", max_results=channels)
+    return clock.wall, contacts
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--channels", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument(
+        "--min-efficiency",
+        type=float,
+        default=0.6,
+        help="Fail if speedup / workers falls below this (default: 0.6)",
+    )
+    args = parser.parse_args()
+
+    config = StandinConfig(
+        total_channels=args.channels, latency={"about": args.latency}
+    )
+    with StandinServer(config) as server:
+        baseline_time, baseline = run_once(server, args.channels, 1)
+        print(f"workers={1:>3}  {baseline_time:7.2f}s  speedup=1.00x")
+        failed = False
+        for workers in args.workers:
+            if workers == 1:
+                continue
+            elapsed, contacts = run_once(server, args.channels, workers)
+            speedup = baseline_time / elapsed
+            efficiency = speedup / workers
+            same = [c.to_dict() for c in contacts] == [c.to_dict() for c in baseline]
+            print(
+                f"workers={workers:>3}  {elapsed:7.2f}s  speedup={speedup:.2f}x  "
+                f"efficiency={efficiency:.0%}  identical={same}"
+            )
+            if not same or efficiency < args.min_efficiency:
+                failed = True
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
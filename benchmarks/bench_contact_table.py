@@ -0,0 +1,153 @@
+"""
+Memory and export time of a large contact dataset: dataclass list vs ContactTable.
+
+Three variants hold the same synthetic rows and export them to json and csv:
+
+  original   list of dataclasses, to_dict via dataclasses.asdict and a
+             full list of row dicts per format (reference copy of the
+             original ExportManager)
+  dataclass  list of ChannelContact streamed through ExportManager
+  table      ContactTable streamed through ExportManager as row views
+
+Dataset size and peak come from tracemalloc in a separate pass from the
+timing, so tracing does not skew the times. Exports must be identical.
+
+    python benchmarks/bench_contact_table.py --rows 500000
+"""
+
+import argparse
+import csv
+import gc
+import json
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping
+
+import _common  # noqa: F401 - sets up sys.path
+from _common import quiet_logger, traced_memory
+
+from outputs.contact_table import ContactTable  # type: ignore
+from outputs.export_manager import ExportManager  # type: ignore
+from parsers.youtube_parser import ChannelContact  # type: ignore
+
+DOMAINS = ["@gmail.com", "@yahoo.com", "@outlook.com", "@agency.co.uk", "@studio.io"]
+FORMATS = ["json", "csv"]
+
+# --- reference copy of the original record and exporter -------------------
+
+@dataclass
+class OriginalContact:
+    Channel_url: str
+    Channel_name: str
+    Email: str
+    Domain_email: str
+    Phone: str
+    Description: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+def original_export(contacts: List[OriginalContact], out_dir: Path) -> None:
+    def contacts_to_dicts() -> List[Mapping]:
+        return [c.to_dict() for c in contacts]
+
+    data = contacts_to_dicts()
+    with (out_dir / "contacts.json").open("w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+    rows = contacts_to_dicts()
+    with (out_dir / "contacts.csv").open("w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+
+# --------------------------------------------------------------------------
+
+def make_fields(rows: int, description_chars: int) -> Iterator[tuple]:
+    filler = "Weekly videos about cooking, travel and tech. " * (description_chars // 46 + 1)
+    for i in range(rows):
+        # Fresh string objects per row, as parsing produces them
+        domain = "".join(DOMAINS[i % len(DOMAINS)])
+        email = f"creator{i}{domain}" if i % 3 else ""
+        yield (
+            f"https://www.youtube.com/channel/UC{i:022d}",
+            f"Creator {i}",
+            email,
+            domain[:] if email else "",
+            f"+1 555 {i % 1000:03d} {i % 10000:04d}" if i % 4 == 0 else "",
+            f"#{i} " + filler[: description_chars],
+        )
+
+def build(variant: str, rows: int, description_chars: int):
+    fields = make_fields(rows, description_chars)
+    if variant == "original":
+        return [OriginalContact(*values) for values in fields]
+    contacts = (ChannelContact(*values) for values in fields)
+    if variant == "table":
+        return ContactTable.from_contacts(contacts)
+    return list(contacts)
+
+def export(variant: str, dataset, out_dir: Path) -> None:
+    if variant == "original":
+        original_export(dataset, out_dir)
+    else:
+        ExportManager(out_dir, quiet_logger()).export(dataset, FORMATS)
+
+def measure(variant: str, rows: int, description_chars: int, out_dir: Path) -> dict:
+    gc.collect()
+    start = time.perf_counter()
+    dataset = build(variant, rows, description_chars)
+    build_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    export(variant, dataset, out_dir)
+    export_seconds = time.perf_counter() - start
+    del dataset
+
+    with traced_memory() as memory:
+        dataset = build(variant, rows, description_chars)
+        held = memory()[0]
+        export(variant, dataset, out_dir)
+        peak = memory()[1]
+    del dataset
+
+    return {
+        "build_s": build_seconds,
+        "export_s": export_seconds,
+        "held_mb": held / 2**20,
+        "peak_mb": peak / 2**20,
+        "outputs": {fmt: (out_dir / f"contacts.{fmt}").read_bytes() for fmt in FORMATS},
+    }
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--description-chars", type=int, default=300)
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for variant in ("original", "dataclass", "table"):
+            out_dir = Path(tmp) / variant
+            out_dir.mkdir()
+            results[variant] = measure(variant, args.rows, args.description_chars, out_dir)
+
+    reference = results["original"]["outputs"]
+    identical = all(r["outputs"] == reference for r in results.values())
+    print(f"{args.rows} rows, {args.description_chars}-char descriptions, formats: {', '.join(FORMATS)}")
+    print(f"{'variant':<10} {'build s':>8} {'export s':>9} {'held MB':>8} {'peak MB':>8}")
+    for variant, r in results.items():
+        print(
+            f"{variant:<10} {r['build_s']:>8.2f} {r['export_s']:>9.2f} "
+            f"{r['held_mb']:>8.1f} {r['peak_mb']:>8.1f}"
+        )
+    print(f"identical exports: {identical}")
+    table, original = results["table"], results["original"]
+    better = table["peak_mb"] < original["peak_mb"] and table["export_s"] < original["export_s"]
+    return 0 if identical and better else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
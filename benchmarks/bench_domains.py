@@ -0,0 +1,73 @@
+"""
+Whitelist lookup cost versus whitelist size.
+
+Times choose_best_email_for_domains with a linear scan (the original
+implementation, kept below as the reference) and with a precompiled
+DomainMatcher for 10 to 100k domains, and checks both pick the same email.
+
+    python benchmarks/bench_domains.py
+"""
+
+import argparse
+import random
+import sys
+import time
+from typing import List
+
+import _common  # noqa: F401 - sets up sys.path
+
+from parsers.utils_extract import (  # type: ignore
+    DomainMatcher,
+    choose_best_email_for_domains,
+    extract_domain,
+)
+
+def reference_choose(emails: List[str], domain_whitelist: List[str]):
+    normalized_whitelist = [d.lower() for d in domain_whitelist]
+    for email in emails:
+        domain = extract_domain(email)
+        if not domain:
+            continue
+        if any(domain == d or domain.endswith(d) for d in normalized_whitelist):
+            return email, domain
+    return None, None
+
+def make_domains(count: int, rng: random.Random) -> List[str]:
+    return [f"@corp{i}-{rng.randrange(10**6)}.com" for i in range(count)]
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000, 100000])
+    parser.add_argument("--lookups", type=int, default=2000)
+    args = parser.parse_args()
+
+    rng = random.Random(3)
+    failed = False
+    print(f"{'domains':>8}  {'linear us/call':>15}  {'matcher us/call':>16}")
+    for size in args.sizes:
+        domains = make_domains(size, rng)
+        matcher = DomainMatcher(domains)
+        email_sets = []
+        for i in range(args.lookups):
+            emails = [f"user{i}@gmail.com", f"info{i}@other{i}.org"]
+            if i % 4 == 0:
+                emails.append("sales" + rng.choice(domains))
+            email_sets.append(emails)
+
+        # The linear scan gets slow; sample fewer calls for large lists
+        linear_sets = email_sets[: max(20, args.lookups * 100 // size)]
+        start = time.perf_counter()
+        expected = [reference_choose(e, domains) for e in linear_sets]
+        linear = (time.perf_counter() - start) / len(linear_sets)
+
+        start = time.perf_counter()
+        got = [choose_best_email_for_domains(e, matcher) for e in email_sets]
+        compiled = (time.perf_counter() - start) / len(email_sets)
+
+        same = got[: len(expected)] == expected
+        failed = failed or not same
+        print(f"{size:>8}  {linear * 1e6:>15.1f}  {compiled * 1e6:>16.2f}  identical={same}")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,275 @@
+"""
+End-to-end throughput benchmark: search, details, About pages and export.
+
+Drives YouTubeScraper.scrape_contacts and ExportManager.export against the
+local stand-in at several run sizes and reports channels/sec, p50/p95
+latency per stage, peak RSS and CPU time. Each size runs in a fresh child
+process so peak RSS is not inflated by earlier sizes or by the server.
+Results are checked against thresholds.json; any regression fails the run.
+
+    python benchmarks/bench_e2e.py
+    python benchmarks/bench_e2e.py --sizes 100 1000 --workers 16
+    python benchmarks/bench_e2e.py --write-thresholds   # re-baseline
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import _common  # noqa: F401 - sets up sys.path
+from _common import BENCH_DIR, quiet_logger
+from standin_server import StandinConfig, StandinServer
+
+THRESHOLDS_PATH = BENCH_DIR / "thresholds.json"
+STAGES = ("search", "channels", "about_fetch", "about_parse")
+# Headroom applied by --write-thresholds so normal machine noise passes
+HEADROOM = 2.0
+
+def percentile(samples: List[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+def _timed(samples: List[float], fn: Callable) -> Callable:
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            samples.append(time.perf_counter() - start)
+
+    return wrapper
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def run_child(args: argparse.Namespace) -> int:
+    """Run one size against an already running stand-in and print JSON."""
+    from outputs.export_manager import ExportManager  # type: ignore
+    from parsers.quota_scheduler import QuotaScheduler  # type: ignore
+    from parsers.youtube_async import AsyncYouTubeScraper  # type: ignore
+    from parsers.youtube_parser import YouTubeScraper  # type: ignore
+
+    logger = quiet_logger()
+    # No pacing and a budget that never runs out; only the retries matter here
+    scheduler = QuotaScheduler(
+        daily_budget=10**9,
+        requests_per_second=0,
+        max_retries=5,
+        backoff_base=0.01,
+        logger=logger,
+    )
+    cls = AsyncYouTubeScraper if args.engine == "async" else YouTubeScraper
+    scraper = cls(
+        api_key="bench",
+        logger=logger,
+        concurrency=args.workers,
+        scheduler=scheduler,
+    )
+    scraper.search_url = f"{args.base_url}/youtube/v3/search"
+    scraper.channels_url = f"{args.base_url}/youtube/v3/channels"
+    scraper.channel_base_url = f"{args.base_url}/channel/"
+
+    samples: Dict[str, List[float]] = {stage: [] for stage in STAGES}
+    scraper._request_search_page = _timed(samples["search"], scraper._request_search_page)
+    scraper._request_channel_batch = _timed(
+        samples["channels"], scraper._request_channel_batch
+    )
+    scraper._fetch_about_html = _timed(samples["about_fetch"], scraper._fetch_about_html)
+    scraper._about_text = _timed(samples["about_parse"], scraper._about_text)
+
+    cpu_start = time.process_time()
+    start = time.perf_counter()
+    contacts = scraper.scrape_contacts("bench", max_results=args.channels)
+    scrape_seconds = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as out_dir:
+        exporter = ExportManager(Path(out_dir), logger)
+        export_start = time.perf_counter()
+        exporter.export(contacts, args.formats)
+        export_seconds = time.perf_counter() - export_start
+    total_seconds = time.perf_counter() - start
+    cpu_seconds = time.process_time() - cpu_start
+
+    result = {
+        "channels": args.channels,
+        "contacts": len(contacts),
+        "seconds": round(total_seconds, 3),
+        "scrape_seconds": round(scrape_seconds, 3),
+        "export_seconds": round(export_seconds, 4),
+        "channels_per_sec": round(args.channels / total_seconds, 1),
+        "cpu_seconds": round(cpu_seconds, 2),
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+        "retries": scheduler.retries,
+        "failed_batches": len(scraper.failed_batches),
+        "stages": {
+            stage: {
+                "count": len(values),
+                "p50_ms": round(percentile(values, 50) * 1000, 2),
+                "p95_ms": round(percentile(values, 95) * 1000, 2),
+            }
+            for stage, values in samples.items()
+        },
+    }
+    print(json.dumps(result))
+    return 0
+
+def run_size(args: argparse.Namespace, base_url: str, channels: int) -> dict:
+    cmd = [
+        sys.executable,
+        str(Path(__file__).resolve()),
+        "--child",
+        "--base-url",
+        base_url,
+        "--channels",
+        str(channels),
+        "--workers",
+        str(args.workers),
+        "--engine",
+        args.engine,
+        "--formats",
+        *args.formats,
+    ]
+    proc = subprocess.run(cmd, capture_output=True, text=True, check=False)
+    if proc.returncode != 0:
+        raise RuntimeError(f"Benchmark child failed for {channels} channels:\n{proc.stderr}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+def print_report(results: List[dict]) -> None:
+    print(
+        f"{'channels':>8} {'ch/s':>8} {'total s':>8} {'cpu s':>7} {'rss MB':>7} "
+        f"{'retries':>7} {'export s':>8}"
+    )
+    for r in results:
+        print(
+            f"{r['channels']:>8} {r['channels_per_sec']:>8.1f} {r['seconds']:>8.2f} "
+            f"{r['cpu_seconds']:>7.2f} {r['peak_rss_mb']:>7.1f} {r['retries']:>7} "
+            f"{r['export_seconds']:>8.3f}"
+        )
+    print()
+    print(f"{'channels':>8} {'stage':<12} {'calls':>6} {'p50 ms':>8} {'p95 ms':>8}")
+    for r in results:
+        for stage in STAGES:
+            s = r["stages"][stage]
+            print(
+                f"{r['channels']:>8} {stage:<12} {s['count']:>6} "
+                f"{s['p50_ms']:>8.2f} {s['p95_ms']:>8.2f}"
+            )
+
+def check_thresholds(results: List[dict], thresholds: dict) -> List[str]:
+    failures: List[str] = []
+    for r in results:
+        limits = thresholds.get(str(r["channels"]))
+        if not limits:
+            continue
+        size = r["channels"]
+        if r["channels_per_sec"] < limits.get("min_channels_per_sec", 0):
+            failures.append(
+                f"{size}: {r['channels_per_sec']} channels/sec is below "
+                f"{limits['min_channels_per_sec']}"
+            )
+        for key in ("cpu_seconds", "peak_rss_mb"):
+            limit = limits.get(f"max_{key}")
+            if limit is not None and r[key] > limit:
+                failures.append(f"{size}: {key} {r[key]} exceeds {limit}")
+        for stage, limit in (limits.get("max_p95_ms") or {}).items():
+            value = r["stages"][stage]["p95_ms"]
+            if value > limit:
+                failures.append(f"{size}: {stage} p95 {value}ms exceeds {limit}ms")
+        if r["failed_batches"] > limits.get("max_failed_batches", 0):
+            failures.append(f"{size}: {r['failed_batches']} detail batches failed")
+    return failures
+
+def thresholds_from(results: List[dict]) -> dict:
+    return {
+        str(r["channels"]): {
+            "min_channels_per_sec": round(r["channels_per_sec"] / HEADROOM, 1),
+            "max_cpu_seconds": round(max(r["cpu_seconds"] * HEADROOM, 1.0), 1),
+            "max_peak_rss_mb": round(r["peak_rss_mb"] * 1.5, 0),
+            "max_p95_ms": {
+                stage: round(max(r["stages"][stage]["p95_ms"] * HEADROOM, 1.0), 1)
+                for stage in STAGES
+            },
+            "max_failed_batches": 0,
+        }
+        for r in results
+    }
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--engine", choices=("sync", "async"), default="sync")
+    parser.add_argument("--formats", nargs="+", default=["json", "csv"])
+    parser.add_argument("--search-latency", type=float, default=0.05)
+    parser.add_argument("--channels-latency", type=float, default=0.02)
+    parser.add_argument("--about-latency", type=float, default=0.005)
+    parser.add_argument("--error-rate", type=float, default=0.01)
+    parser.add_argument("--thresholds", type=Path, default=THRESHOLDS_PATH)
+    parser.add_argument("--write-thresholds", action="store_true")
+    parser.add_argument("--json", action="store_true", help="print raw results as JSON")
+    # Internal: run a single size in this process against --base-url
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--base-url", help=argparse.SUPPRESS)
+    parser.add_argument("--channels", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        return run_child(args)
+
+    results = []
+    for size in args.sizes:
+        config = StandinConfig(
+            total_channels=size,
+            latency={
+                "search": args.search_latency,
+                "channels": args.channels_latency,
+                "about": args.about_latency,
+            },
+            error_rate={
+                "search": args.error_rate,
+                "channels": args.error_rate,
+                "about": args.error_rate,
+            },
+        )
+        with StandinServer(config) as server:
+            results.append(run_size(args, server.base_url, size))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_report(results)
+
+    if args.write_thresholds:
+        args.thresholds.write_text(
+            json.dumps(thresholds_from(results), indent=2) + "\n", encoding="utf-8"
+        )
+        print(f"\nWrote thresholds to {args.thresholds}")
+        return 0
+
+    if not args.thresholds.exists():
+        print(f"\nNo thresholds file at {args.thresholds}; skipping regression check")
+        return 0
+    failures = check_thresholds(
+        results, json.loads(args.thresholds.read_text(encoding="utf-8"))
+    )
+    if failures:
+        print("\nREGRESSION:")
+        for failure in failures:
+            print(f"  {failure}")
+        return 1
+    print("\nAll thresholds met.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+"""
+Sync versus async engine wall-clock on a large max_results run.
+
+Both engines are driven against the local stand-in with the same latency
+on every endpoint; the async engine should overlap search paging, detail
+batches and About fetches and finish sooner with identical output.
+
+    python benchmarks/bench_engines.py --channels 500
+"""
+
+import argparse
+import sys
+
+import _common  # noqa: F401 - sets up sys.path
+from _common import Stopwatch, standin_scraper
+from standin_server import StandinConfig, StandinServer
+
+from parsers.youtube_async import AsyncYouTubeScraper  # type: ignore
+from parsers.youtube_parser import YouTubeScraper  # type: ignore
+
+def run_engine(server: StandinServer, cls, channels: int, workers: int):
+    scraper = standin_scraper(server, cls, concurrency=workers)
+    clock = Stopwatch()
+    contacts = scraper.scrape_contacts("bench", max_results=channels)
+    return clock.wall, contacts
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--channels", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--search-latency", type=float, default=0.2)
+    parser.add_argument("--channels-latency", type=float, default=0.1)
+    parser.add_argument("--about-latency", type=float, default=0.03)
+    args = parser.parse_args()
+
+    config = StandinConfig(
+        total_channels=args.channels,
+        latency={
+            "search": args.search_latency,
+            "channels": args.channels_latency,
+            "about": args.about_latency,
+        },
+    )
+    with StandinServer(config) as server:
+        sync_time, sync_contacts = run_engine(
+            server, YouTubeScraper, args.channels, args.workers
+        )
+        async_time, async_contacts = run_engine(
+            server, AsyncYouTubeScraper, args.channels, args.workers
+        )
+
+    same = [c.to_dict() for c in sync_contacts] == [c.to_dict() for c in async_contacts]
+    print(f"sync   {sync_time:7.2f}s  contacts={len(sync_contacts)}")
+    print(f"async  {async_time:7.2f}s  contacts={len(async_contacts)}  identical={same}")
+    print(f"speedup {sync_time / async_time:.2f}x")
+    return 0 if same and async_time < sync_time else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
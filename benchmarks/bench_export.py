@@ -0,0 +1,313 @@
+"""
+Export time and memory for json, csv, xml and html together:
+the original ExportManager vs the current single-pass streaming one.
+
+The original converts every contact to a dict (dataclasses.asdict) once
+per format and builds each XML/HTML document as one big string list.
+The current exporter converts each contact once, fans the row out to all
+writers and writes buffered chunks, optionally gzip/zstd compressed.
+Uncompressed outputs must be byte-identical to the original; compressed
+ones must decompress to the same bytes.
+
+    python benchmarks/bench_export.py --rows 50000
+"""
+
+import argparse
+import csv
+import gc
+import gzip
+import html
+import importlib.util
+import json
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping
+
+import _common  # noqa: F401 - sets up sys.path
+from _common import quiet_logger, traced_memory
+
+from outputs.export_manager import ExportManager  # type: ignore
+from parsers.youtube_parser import ChannelContact  # type: ignore
+
+FORMATS = ["json", "csv", "xml", "html"]
+
+# --- reference copy of the original record and exporter -------------------
+
+@dataclass
+class OriginalContact:
+    Channel_url: str
+    Channel_name: str
+    Email: str
+    Domain_email: str
+    Phone: str
+    Description: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+class OriginalExportManager:
+    """
+    Handles multi-format export of scraped contact data.
+    Supported formats: json, csv, xml, html
+    """
+
+    def __init__(self, output_dir: Path, logger) -> None:
+        self.output_dir = output_dir
+        self.logger = logger
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+    def export(
+        self,
+        contacts: Iterable[OriginalContact],
+        formats: Iterable[str],
+    ) -> Dict[str, Path]:
+        contacts_list: List[OriginalContact] = list(contacts)
+        results: Dict[str, Path] = {}
+
+        normalized_formats = {fmt.lower().strip() for fmt in formats}
+        if not normalized_formats:
+            normalized_formats = {"json"}
+
+        for fmt in normalized_formats:
+            if fmt == "json":
+                results["json"] = self._export_json(contacts_list)
+            elif fmt == "csv":
+                results["csv"] = self._export_csv(contacts_list)
+            elif fmt == "xml":
+                results["xml"] = self._export_xml(contacts_list)
+            elif fmt == "html":
+                results["html"] = self._export_html(contacts_list)
+            else:
+                self.logger.warning("Unknown export format '%s'; skipping.", fmt)
+
+        return results
+
+    def _contacts_to_dicts(self, contacts: List[OriginalContact]) -> List[Mapping]:
+        return [c.to_dict() for c in contacts]
+
+    def _export_json(self, contacts: List[OriginalContact]) -> Path:
+        path = self.output_dir / "contacts.json"
+        self.logger.debug("Exporting JSON to %s", path)
+        data = self._contacts_to_dicts(contacts)
+        with path.open("w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        return path
+
+    def _export_csv(self, contacts: List[OriginalContact]) -> Path:
+        path = self.output_dir / "contacts.csv"
+        self.logger.debug("Exporting CSV to %s", path)
+        rows = self._contacts_to_dicts(contacts)
+        if not rows:
+            # Still create an empty file with headers
+            headers = [
+                "Channel_url",
+                "Channel_name",
+                "Email",
+                "Domain_email",
+                "Phone",
+                "Description",
+            ]
+        else:
+            headers = list(rows[0].keys())
+        with path.open("w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=headers)
+            writer.writeheader()
+            for row in rows:
+                writer.writerow(row)
+        return path
+
+    def _export_xml(self, contacts: List[OriginalContact]) -> Path:
+        path = self.output_dir / "contacts.xml"
+        self.logger.debug("Exporting XML to %s", path)
+        rows = self._contacts_to_dicts(contacts)
+
+        def esc(value: str) -> str:
+            return html.escape(value or "", quote=True)
+
+        xml_parts: List[str] = ['<?xml version="1.0" encoding="UTF-8"?>', "<contacts>"]
+        for row in rows:
+            xml_parts.append("  <contact>")
+            for key, value in row.items():
+                xml_parts.append(
+                    f"    <{key}>{esc(str(value))}</{key}>"
+                )
+            xml_parts.append("  </contact>")
+        xml_parts.append("</contacts>")
+
+        with path.open("w", encoding="utf-8") as f:
+            f.write("\n".join(xml_parts))
+
+        return path
+
+    def _export_html(self, contacts: List[OriginalContact]) -> Path:
+        path = self.output_dir / "contacts.html"
+        self.logger.debug("Exporting HTML to %s", path)
+        rows = self._contacts_to_dicts(contacts)
+
+        headers = [
+            "Channel_url",
+            "Channel_name",
+            "Email",
+            "Domain_email",
+            "Phone",
+            "Description",
+        ]
+
+        def esc(value: str) -> str:
+            return html.escape(value or "", quote=True)
+
+        lines: List[str] = [
+            "<!DOCTYPE html>",
+            "<html>",
+            "<head>",
+            '  <meta charset="utf-8" />',
+            "  <title>YouTube Contacts Export</title>",
+            "  <style>",
+            "    table { border-collapse: collapse; width: 100%; }",
+            "    th, td { border: 1px solid #ddd; padding: 8px; font-family: Arial, sans-serif; font-size: 14px; }",
+            "    th { background-color: #f4f4f4; text-align: left; }",
+            "    tr:nth-child(even) { background-color: #fbfbfb; }",
+            "  </style>",
+            "</head>",
+            "<body>",
+            "  <h1>YouTube Contacts Export</h1>",
+            "  <table>",
+            "    <thead>",
+            "      <tr>",
+        ]
+        for h in headers:
+            lines.append(f"        <th>{esc(h)}</th>")
+        lines.extend(
+            [
+                "      </tr>",
+                "    </thead>",
+                "    <tbody>",
+            ]
+        )
+
+        for row in rows:
+            lines.append("      <tr>")
+            for h in headers:
+                value = str(row.get(h, ""))
+                if h == "Channel_url" and value:
+                    cell = f'<a href="{esc(value)}" target="_blank">{esc(value)}</a>'
+                else:
+                    cell = esc(value)
+                lines.append(f"        <td>{cell}</td>")
+            lines.append("      </tr>")
+
+        lines.extend(
+            [
+                "    </tbody>",
+                "  </table>",
+                "</body>",
+                "</html>",
+            ]
+        )
+
+        with path.open("w", encoding="utf-8") as f:
+            f.write("\n".join(lines))
+
+        return path
+
+# --------------------------------------------------------------------------
+
+def make_values(rows: int) -> List[tuple]:
+    values = []
+    for i in range(rows):
+        values.append(
+            (
+                f"https://www.youtube.com/channel/UC{i:022d}",
+                f"Creator {i} & Friends",
+                f"creator{i}@gmail.com" if i % 3 else "",
+                "@gmail.com" if i % 3 else "",
+                f"+1 555 {i % 1000:03d} {i % 10000:04d}" if i % 4 == 0 else "",
+                f"#{i} Weekly <videos> about cooking, travel & tech. " * 6,
+            )
+        )
+    return values
+
+def run_variant(variant: str, values: List[tuple], out_dir: Path) -> None:
+    if variant == "original":
+        contacts = [OriginalContact(*v) for v in values]
+        OriginalExportManager(out_dir, quiet_logger()).export(contacts, FORMATS)
+        return
+    compression = None if variant == "streaming" else variant.split("+")[1]
+    contacts = [ChannelContact(*v) for v in values]
+    exporter = ExportManager(out_dir, quiet_logger(), compression=compression)
+    exporter.export(contacts, FORMATS)
+
+def read_output(out_dir: Path, fmt: str) -> bytes:
+    for path in out_dir.glob(f"contacts.{fmt}*"):
+        if path.suffix == ".gz":
+            return gzip.decompress(path.read_bytes())
+        if path.suffix == ".zst":
+            try:
+                from compression import zstd  # type: ignore
+            except ImportError:
+                import zstandard as zstd  # type: ignore
+            return zstd.decompress(path.read_bytes())
+        return path.read_bytes()
+    raise FileNotFoundError(f"no {fmt} output in {out_dir}")
+
+def measure(variant: str, values: List[tuple], out_dir: Path) -> dict:
+    gc.collect()
+    start = time.perf_counter()
+    run_variant(variant, values, out_dir)
+    seconds = time.perf_counter() - start
+
+    with traced_memory() as memory:
+        run_variant(variant, values, out_dir)
+        peak = memory()[1]
+
+    size = sum(p.stat().st_size for p in out_dir.iterdir())
+    return {"seconds": seconds, "peak_mb": peak / 2**20, "disk_mb": size / 2**20}
+
+def zstd_available() -> bool:
+    # Python 3.14's compression.zstd, else the zstandard package
+    for name in ("compression.zstd", "zstandard"):
+        try:
+            if importlib.util.find_spec(name) is not None:
+                return True
+        except ImportError:  # no compression package before 3.14
+            continue
+    return False
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=50_000)
+    args = parser.parse_args()
+
+    variants = ["original", "streaming", "streaming+gzip"]
+    if zstd_available():
+        variants.append("streaming+zstd")
+
+    values = make_values(args.rows)
+    results = {}
+    outputs = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for variant in variants:
+            out_dir = Path(tmp) / variant.replace("+", "_")
+            out_dir.mkdir()
+            results[variant] = measure(variant, values, out_dir)
+            outputs[variant] = {fmt: read_output(out_dir, fmt) for fmt in FORMATS}
+
+    identical = all(out == outputs["original"] for out in outputs.values())
+    base = results["original"]
+    print(f"{args.rows} rows -> {', '.join(FORMATS)}")
+    print(f"{'variant':<16} {'seconds':>8} {'speedup':>8} {'peak MB':>8} {'disk MB':>8}")
+    for variant, r in results.items():
+        print(
+            f"{variant:<16} {r['seconds']:>8.2f} {base['seconds'] / r['seconds']:>7.2f}x "
+            f"{r['peak_mb']:>8.1f} {r['disk_mb']:>8.1f}"
+        )
+    print(f"identical output: {identical}")
+    stream = results["streaming"]
+    better = stream["seconds"] < base["seconds"] and stream["peak_mb"] < base["peak_mb"]
+    return 0 if identical and better else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
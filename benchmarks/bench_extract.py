@@ -0,0 +1,124 @@
+"""
+Micro-benchmark of contact extraction over a corpus of channel descriptions.
+
+Compares scan_contacts against the original extract_emails/extract_phones
+pair (kept verbatim below as the reference) and fails if any blob yields
+different emails or phones.
+
+    python benchmarks/bench_extract.py
+    python benchmarks/bench_extract.py --corpus descriptions.jsonl
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+import _common  # noqa: F401 - sets up sys.path
+from _common import PROJECT_ROOT
+
+from parsers.utils_extract import EMAIL_REGEX, PHONE_REGEX, scan_contacts  # type: ignore
+
+def reference_extract_emails(text: str) -> List[str]:
+    if not text:
+        return []
+    emails = EMAIL_REGEX.findall(text)
+    seen = set()
+    result = []
+    for email in emails:
+        e = email.strip()
+        if not e:
+            continue
+        if e not in seen:
+            seen.add(e)
+            result.append(e)
+    return result
+
+def reference_extract_phones(text: str) -> List[str]:
+    if not text:
+        return []
+    phones = PHONE_REGEX.findall(text)
+    cleaned: List[str] = []
+    seen = set()
+    for phone in phones:
+        p = re.sub(r"\s+", " ", phone).strip()
+        if len(re.sub(r"\D", "", p)) < 7:
+            continue
+        if p not in seen:
+            seen.add(p)
+            cleaned.append(p)
+    return cleaned
+
+FILLER = [
+    "New videos every week about gear, editing and lighting.",
+    "Subscribe and hit the bell so you never miss an upload!",
+    "Shot on a 2019 camera, edited in 4K, uploaded at 60fps.",
+    "Follow us on Instagram and TikTok for behind the scenes.",
+    "Top 10 tips for growing your channel in 2024",
+]
+
+def build_corpus(size: int) -> List[str]:
+    sample = json.loads((PROJECT_ROOT / "data" / "output.sample.json").read_text("utf-8"))
+    real = [row["Description"] for row in sample]
+    rng = random.Random(7)
+    corpus = list(real)
+    while len(corpus) < size:
+        parts = rng.sample(FILLER, k=rng.randint(1, 4))
+        roll = rng.random()
+        if roll < 0.15:
+            parts.append(f"Business: team{rng.randrange(10**4)}@gmail.com")
+        elif roll < 0.25:
+            parts.append(f"Call +{rng.randint(1, 99)} {rng.randrange(10**3):03d} {rng.randrange(10**6):06d}")
+        elif roll < 0.35:
+            parts.append(rng.choice(real))
+        corpus.append("\n".join(parts))
+    return corpus
+
+def load_corpus(path: Path) -> List[str]:
+    texts = []
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                row = json.loads(line)
+                texts.append(row["Description"] if isinstance(row, dict) else str(row))
+    return texts
+
+def time_it(fn, corpus, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in corpus:
+            fn(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--corpus", type=Path, default=None, help="JSONL of descriptions")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus) if args.corpus else build_corpus(args.size)
+
+    def reference(text):
+        return reference_extract_emails(text), reference_extract_phones(text)
+
+    mismatches = sum(1 for text in corpus if scan_contacts(text) != reference(text))
+    ref_time = time_it(reference, corpus, args.repeat)
+    new_time = time_it(scan_contacts, corpus, args.repeat)
+
+    per_blob = 1e6 / len(corpus)
+    print(f"{len(corpus)} descriptions")
+    print(f"reference     {ref_time * per_blob:7.2f} us/blob")
+    print(f"scan_contacts {new_time * per_blob:7.2f} us/blob  ({ref_time / new_time:.2f}x)")
+    print(f"mismatches    {mismatches}")
+    return 1 if mismatches else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
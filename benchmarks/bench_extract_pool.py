@@ -0,0 +1,76 @@
+"""
+Scaling of About parsing and contact scanning across extraction processes.
+
+Search and channel details come from the local stand-in. About fetches
+are answered from in-memory fixture pages, so extraction CPU is the only
+cost left and the run measures how it scales with extract_workers.
+Output must match the in-thread path (extract_workers=0) exactly.
+
+    python benchmarks/bench_extract_pool.py --channels 400 --workers 0 1 2 4 8
+"""
+
+import argparse
+import os
+import sys
+
+import _common  # noqa: F401 - sets up sys.path
+from _common import Stopwatch, standin_scraper
+from about_fixtures import make_about_page
+from standin_server import StandinConfig, StandinServer, channel_index_from_id
+
+def run_once(server: StandinServer, args, extract_workers: int, pages):
+    scraper = standin_scraper(
+        server,
+        concurrency=args.threads,
+        about_backend=args.backend,
+        extract_workers=extract_workers,
+    )
+
+    def fixture_about_html(channel_url: str) -> str:
+        index = channel_index_from_id(channel_url.rstrip("/").split("/")[-1])
+        return pages[index % len(pages)]
+
+    scraper._fetch_about_html = fixture_about_html
+    clock = Stopwatch()
+    contacts = scraper.scrape_contacts("bench", max_results=args.channels)
+    return clock.wall, [c.to_dict() for c in contacts]
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--channels", type=int, default=400)
+    parser.add_argument("--workers", type=int, nargs="+", default=[0, 1, 2, 4, 8])
+    parser.add_argument(
+        "--threads", type=int, default=16, help="I/O threads (scraper concurrency)"
+    )
+    parser.add_argument("--backend", default="soup", help="About backend to parse with")
+    parser.add_argument("--pages", type=int, default=50, help="distinct fixture pages")
+    parser.add_argument("--script-kb", type=int, default=300)
+    args = parser.parse_args()
+
+    pages = [make_about_page(i, script_kb=args.script_kb) for i in range(args.pages)]
+    print(
+        f"{os.cpu_count()} CPUs | {args.channels} channels | backend={args.backend} | "
+        f"{args.threads} I/O threads | pages ~{len(pages[0]) // 1024} KB"
+    )
+
+    results = {}
+    with StandinServer(StandinConfig(total_channels=args.channels)) as server:
+        for workers in args.workers:
+            results[workers] = run_once(server, args, workers, pages)
+
+    baseline_workers = args.workers[0]
+    baseline_time, baseline_rows = results[baseline_workers]
+    identical = True
+    print(f"{'workers':>8} {'seconds':>8} {'ch/s':>8} {'speedup':>8}  identical")
+    for workers, (elapsed, rows) in results.items():
+        same = rows == baseline_rows
+        identical = identical and same
+        label = "in-thread" if workers == 0 else str(workers)
+        print(
+            f"{label:>8} {elapsed:>8.2f} {args.channels / elapsed:>8.1f} "
+            f"{baseline_time / elapsed:>7.2f}x  {same}"
+        )
+    return 0 if identical else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+"""
+About-page fetch policies: always vs when_needed vs never.
+
+Enriches the same channels from the local stand-in, where a fraction of
+descriptions (--complete) already list an email and a phone. `always`
+fetches every About page, as the scraper used to; `when_needed` skips the
+pages whose description fills the record; `never` skips them all. Reports
+About requests, bytes, CPU and wall time and contacts per policy, and
+checks that when_needed gives the same contacts as always.
+
+    python benchmarks/bench_fetch_policy.py --channels 1000 --complete 0.7
+"""
+
+import argparse
+import sys
+
+import _common  # noqa: F401 - sets up sys.path
+from _common import Stopwatch, standin_scraper
+from standin_server import StandinConfig, StandinServer, channel_id_for
+
+from parsers.youtube_parser import FETCH_POLICIES  # type: ignore
+from telemetry.metrics import RunMetrics  # type: ignore
+
+def run_policy(server: StandinServer, policy: str, ids, domains, concurrency: int) -> dict:
+    scraper = standin_scraper(
+        server, concurrency=concurrency, metrics=RunMetrics(), fetch_policy=policy
+    )
+    clock = Stopwatch()
+    contacts = [c.to_dict() for c in scraper.iter_channel_contacts(ids, domains)]
+    counters = scraper.metrics.snapshot()["counters"]
+    return {
+        "policy": policy,
+        "contacts": contacts,
+        "about": scraper.request_counts.get("about", 0),
+        "avoided": scraper.about_fetches_avoided,
+        "kb": counters.get("bytes", {}).get("about", 0) / 1024,
+        **clock.elapsed(),
+    }
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--channels", type=int, default=1000)
+    parser.add_argument(
+        "--complete", type=float, default=0.7, help="fraction with email and phone"
+    )
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--about-latency", type=float, default=0.005)
+    args = parser.parse_args()
+
+    config = StandinConfig(
+        total_channels=args.channels,
+        latency={"about": args.about_latency},
+        complete_descriptions=args.complete,
+    )
+    ids = [channel_id_for(i) for i in range(args.channels)]
+    domains = ["@gmail.com", "@yahoo.com"]
+    with StandinServer(config) as server:
+        results = [
+            run_policy(server, policy, ids, domains, args.concurrency)
+            for policy in FETCH_POLICIES
+        ]
+
+    print(
+        f"{args.channels} channels, {args.complete:.0%} with email and phone "
+        "in the description"
+    )
+    print(
+        f"{'policy':<12} {'about':>6} {'avoided':>8} {'KB':>9} {'cpu s':>7} "
+        f"{'wall s':>7} {'contacts':>9}"
+    )
+    for r in results:
+        print(
+            f"{r['policy']:<12} {r['about']:>6} {r['avoided']:>8} {r['kb']:>9.1f} "
+            f"{r['cpu']:>7.2f} {r['wall']:>7.2f} {len(r['contacts']):>9}"
+        )
+    always, when_needed = results[0], results[1]
+    same = when_needed["contacts"] == always["contacts"]
+    print(f"when_needed contacts identical to always: {same}")
+    return 0 if same and when_needed["about"] < always["about"] else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
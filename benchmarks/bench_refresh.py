@@ -0,0 +1,99 @@
+"""
+Re-validating an existing dataset: full re-scrape vs `refresh`.
+
+Scrapes a dataset from the local stand-in, refreshes it once to record
+etags, then edits a fraction of the channels (new snippet) and removes a
+few. Both sides then bring the dataset up to date: the full re-scrape
+re-fetches every channel's details and About page, the refresh re-queries
+details and fetches About pages only for the edited channels. Reports
+requests, bytes, CPU and wall time per side and checks that both produce
+the same dataset.
+
+    python benchmarks/bench_refresh.py --channels 2000 --changed 0.05
+"""
+
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+
+import _common  # noqa: F401 - sets up sys.path
+from _common import Stopwatch, quiet_logger, standin_scraper
+from standin_server import StandinConfig, StandinServer, channel_id_for
+
+from outputs.contact_table import ContactTable  # type: ignore
+from parsers.refresh import DatasetRefresher  # type: ignore
+from parsers.youtube_parser import YouTubeScraper  # type: ignore
+from storage.refresh_state import RefreshState  # type: ignore
+from telemetry.metrics import RunMetrics  # type: ignore
+
+def make_scraper(server: StandinServer, concurrency: int) -> YouTubeScraper:
+    return standin_scraper(server, concurrency=concurrency, metrics=RunMetrics())
+
+def measure(label: str, scraper: YouTubeScraper, run) -> dict:
+    clock = Stopwatch()
+    contacts = [contact.to_dict() for contact in run()]
+    counters = scraper.metrics.snapshot()["counters"]
+    return {
+        "label": label,
+        "contacts": contacts,
+        "channels": scraper.request_counts.get("channels", 0),
+        "about": scraper.request_counts.get("about", 0),
+        "kb": sum(counters.get("bytes", {}).values()) / 1024,
+        **clock.elapsed(),
+    }
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--channels", type=int, default=2000)
+    parser.add_argument("--changed", type=float, default=0.05, help="fraction edited")
+    parser.add_argument("--removed", type=int, default=5)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--about-latency", type=float, default=0.005)
+    args = parser.parse_args()
+
+    config = StandinConfig(
+        total_channels=args.channels, latency={"about": args.about_latency}
+    )
+    ids = [channel_id_for(i) for i in range(args.channels)]
+    with tempfile.TemporaryDirectory() as tmp, StandinServer(config) as server:
+        table = ContactTable.from_contacts(
+            make_scraper(server, args.concurrency).iter_channel_contacts(ids)
+        )
+        state = RefreshState(Path(tmp) / "refresh_state.sqlite", logger=quiet_logger())
+        # Seed the stored etags, as an earlier refresh would have
+        seed = DatasetRefresher(make_scraper(server, args.concurrency), state)
+        table = ContactTable.from_contacts(seed.refresh(table))
+
+        step = max(1, round(1 / args.changed)) if args.changed > 0 else args.channels + 1
+        for index in range(0, args.channels, step):
+            config.revisions[index] = 1
+        config.removed.update(range(1, args.channels, max(1, args.channels // max(args.removed, 1))))
+
+        full_scraper = make_scraper(server, args.concurrency)
+        full = measure("full", full_scraper, lambda: full_scraper.iter_channel_contacts(ids))
+        refresh_scraper = make_scraper(server, args.concurrency)
+        refresher = DatasetRefresher(refresh_scraper, state)
+        refreshed = measure("refresh", refresh_scraper, lambda: refresher.refresh(table))
+        state.close()
+
+    print(
+        f"{args.channels} channels, {len(config.revisions)} edited, "
+        f"{len(config.removed)} removed"
+    )
+    print(f"{'mode':<8} {'channels':>8} {'about':>6} {'KB':>9} {'cpu s':>7} {'wall s':>7}")
+    for r in (full, refreshed):
+        print(
+            f"{r['label']:<8} {r['channels']:>8} {r['about']:>6} {r['kb']:>9.1f} "
+            f"{r['cpu']:>7.2f} {r['wall']:>7.2f}"
+        )
+    print(
+        f"refresh: {refreshed['kb'] / full['kb']:.1%} of the bytes, "
+        f"{refreshed['cpu'] / full['cpu']:.1%} of the CPU time"
+    )
+    same = refreshed["contacts"] == full["contacts"]
+    print(f"datasets identical: {same}")
+    return 0 if same and refreshed["kb"] < full["kb"] else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
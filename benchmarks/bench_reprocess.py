@@ -0,0 +1,85 @@
+"""
+Offline reprocessing of a raw archive: one process vs a worker pool.
+
+Scrapes the local stand-in once with a RawArchive attached, then
+re-extracts contacts from the archive with 1 worker and with --workers
+processes. Reports channels/sec and wall/CPU time per pass and checks
+that every pass gives exactly the contacts of the live run. With
+--archive it benchmarks an existing archive instead (no scrape, no
+parity check), so real archived runs double as a benchmark corpus.
+
+    python benchmarks/bench_reprocess.py --channels 2000 --workers 4
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import _common  # noqa: F401 - sets up sys.path
+from _common import Stopwatch, quiet_logger, standin_scraper
+from standin_server import StandinConfig, StandinServer
+
+from parsers.reprocess import ArchiveReprocessor  # type: ignore
+from storage.raw_archive import RawArchive  # type: ignore
+
+def scrape(path: Path, channels: int, about_kb: int, domains, concurrency: int) -> list:
+    config = StandinConfig(total_channels=channels, about_padding=about_kb * 1024)
+    archive = RawArchive(path, logger=quiet_logger())
+    with StandinServer(config) as server:
+        scraper = standin_scraper(server, concurrency=concurrency, raw_archive=archive)
+        contacts = [c.to_dict() for c in scraper.iter_contacts("bench", channels, domains)]
+    archive.close()
+    return contacts
+
+def reprocess(path: Path, workers: int, domains) -> dict:
+    reprocessor = ArchiveReprocessor(path, workers=workers, logger=quiet_logger())
+    clock = Stopwatch()
+    contacts = [c.to_dict() for c in reprocessor.iter_contacts(None, domains)]
+    elapsed = clock.elapsed()
+    wall = elapsed["wall"]
+    return {
+        "workers": workers,
+        "contacts": contacts,
+        "channels": reprocessor.stats.channels,
+        **elapsed,
+        "rate": reprocessor.stats.channels / wall if wall > 0 else 0.0,
+    }
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--channels", type=int, default=2000)
+    parser.add_argument("--about-kb", type=int, default=20, help="About page padding")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--archive", type=Path, default=None, help="existing raw archive")
+    args = parser.parse_args()
+
+    domains = ["@gmail.com", "@yahoo.com"]
+    with tempfile.TemporaryDirectory() as tmp:
+        live = None
+        path = args.archive
+        if path is None:
+            path = Path(tmp) / "raw.sqlite"
+            live = scrape(path, args.channels, args.about_kb, domains, args.concurrency)
+        size_kb = path.stat().st_size / 1024
+        results = [reprocess(path, workers, domains) for workers in (1, args.workers)]
+
+    print(f"{results[0]['channels']} archived channels, {size_kb:.0f} KB archive")
+    print(f"{'workers':>7} {'contacts':>9} {'wall s':>7} {'cpu s':>7} {'channels/s':>11}")
+    for r in results:
+        print(
+            f"{r['workers']:>7} {len(r['contacts']):>9} {r['wall']:>7.2f} "
+            f"{r['cpu']:>7.2f} {r['rate']:>11.0f}"
+        )
+    same = all(r["contacts"] == results[0]["contacts"] for r in results)
+    if live is not None:
+        same = same and results[0]["contacts"] == live
+        print(f"contacts identical to the live run: {same}")
+    else:
+        print(f"contacts identical across worker counts: {same}")
+    return 0 if same else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
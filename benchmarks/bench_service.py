@@ -0,0 +1,157 @@
+"""
+Per-job latency: one CLI process per job vs jobs submitted to `main.py serve`.
+
+Both sides run the same small job against the local stand-in. The CLI
+side starts a fresh interpreter per job, as cron does, so each job pays
+for imports, config loading and a new session. The service side submits
+the job over the HTTP API to one long-running service and polls until it
+is done, so the session, caches and quota state are already warm. The
+stand-in serves plain HTTP, so the TLS handshakes a cold process repeats
+against the real API are not included; real savings are larger.
+
+    python benchmarks/bench_service.py --jobs 10 --max-results 20
+"""
+
+import argparse
+import json
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from pathlib import Path
+
+import _common  # noqa: F401 - sets up sys.path
+from _common import BENCH_DIR
+from standin_server import StandinConfig, StandinServer
+
+def _point_at(base_url: str) -> None:
+    from parsers.youtube_parser import YouTubeScraper  # type: ignore
+
+    YouTubeScraper.search_url = f"{base_url}/youtube/v3/search"
+    YouTubeScraper.channels_url = f"{base_url}/youtube/v3/channels"
+    YouTubeScraper.channel_base_url = f"{base_url}/channel/"
+
+def run_child(args: argparse.Namespace) -> int:
+    """One CLI job in this fresh process, pointed at the stand-in."""
+    import main  # type: ignore
+
+    _point_at(args.base_url)
+    main.run(Path(args.config), Path(args.input), verbosity=0)
+    return 0
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def request(url: str, payload=None) -> dict:
+    data = json.dumps(payload).encode("utf-8") if payload is not None else None
+    req = urllib.request.Request(
+        url, data=data, headers={"Content-Type": "application/json"}
+    )
+    with urllib.request.urlopen(req) as resp:
+        return json.loads(resp.read())
+
+def write_files(tmp: Path, name: str, port: int, job: dict) -> Path:
+    config = {
+        "youtube_api_key": "bench",
+        "default_output_dir": str(tmp / name),
+        "concurrency": 4,
+        "run_journal": False,
+        "quota": {
+            "daily_budget": 10**9,
+            "requests_per_second": 10_000,
+            "burst": 10_000,
+            "state_path": str(tmp / name / "quota_state.json"),
+        },
+        "service": {"port": port, "max_jobs": 1},
+    }
+    config_path = tmp / f"{name}.settings.json"
+    config_path.write_text(json.dumps(config), encoding="utf-8")
+    (tmp / "input.json").write_text(json.dumps(job), encoding="utf-8")
+    return config_path
+
+def time_cli(args, base_url: str, config_path: Path, input_path: Path) -> list:
+    samples = []
+    for _ in range(args.jobs):
+        start = time.perf_counter()
+        subprocess.run(
+            [
+                sys.executable,
+                str(Path(__file__).resolve()),
+                "--child",
+                "--base-url", base_url,
+                "--config", str(config_path),
+                "--input", str(input_path),
+            ],
+            check=True,
+            cwd=str(BENCH_DIR),
+        )
+        samples.append(time.perf_counter() - start)
+    return samples
+
+def time_service(args, base_url: str, config_path: Path, port: int, job: dict) -> list:
+    import main  # type: ignore
+
+    _point_at(base_url)
+    thread = threading.Thread(
+        target=main.run_service, args=(config_path, 0), daemon=True
+    )
+    thread.start()
+    api = f"http://127.0.0.1:{port}"
+    for _ in range(100):
+        try:
+            request(f"{api}/health")
+            break
+        except OSError:
+            time.sleep(0.05)
+
+    samples = []
+    for _ in range(args.jobs):
+        start = time.perf_counter()
+        job_id = request(f"{api}/jobs", job)["job_id"]
+        while request(f"{api}/jobs/{job_id}")["state"] not in ("done", "failed"):
+            time.sleep(0.002)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--jobs", type=int, default=10)
+    parser.add_argument("--max-results", type=int, default=20)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--base-url", help=argparse.SUPPRESS)
+    parser.add_argument("--config", help=argparse.SUPPRESS)
+    parser.add_argument("--input", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        return run_child(args)
+
+    job = {"keyword": "bench", "max_results": args.max_results, "export_formats": ["json"]}
+    with tempfile.TemporaryDirectory() as tmp_name, StandinServer(
+        StandinConfig(total_channels=args.max_results)
+    ) as server:
+        tmp = Path(tmp_name)
+        port = free_port()
+        cli_config = write_files(tmp, "cli", port, job)
+        service_config = write_files(tmp, "service", port, job)
+        cli = time_cli(args, server.base_url, cli_config, tmp / "input.json")
+        service = time_service(args, server.base_url, service_config, port, job)
+
+    cli_median, service_median = statistics.median(cli), statistics.median(service)
+    print(f"{args.jobs} jobs of {args.max_results} channels each")
+    print(f"{'mode':<8} {'median ms':>10} {'min ms':>8} {'max ms':>8}")
+    for label, samples in (("cli", cli), ("service", service)):
+        print(
+            f"{label:<8} {statistics.median(samples) * 1000:>10.1f} "
+            f"{min(samples) * 1000:>8.1f} {max(samples) * 1000:>8.1f}"
+        )
+    print(f"per-job saving: {(cli_median - service_median) * 1000:.1f} ms")
+    return 0 if service_median < cli_median else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,168 @@
+"""
+Cold-start guard for the CLI: import time and wall time of paths that
+should never load the scraper's heavy dependencies.
+
+Each scenario runs src/main.py in a fresh interpreter, once per sample
+under -X importtime (summing the top-level imports) and once plainly for
+wall time. It fails if a scenario imports any module in HEAVY_MODULES,
+or if the medians exceed startup_thresholds.json.
+
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --samples 20 --write-thresholds   # re-baseline
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+import _common  # noqa: F401 - sets up sys.path
+from _common import BENCH_DIR, SRC_DIR
+
+THRESHOLDS_PATH = BENCH_DIR / "startup_thresholds.json"
+# Headroom applied by --write-thresholds so normal machine noise passes
+HEADROOM = 2.0
+# Loaded only once a command actually scrapes, exports or serves
+HEAVY_MODULES = (
+    "requests",
+    "urllib3",
+    "bs4",
+    "sqlite3",
+    "gzip",
+    "multiprocessing",
+    "asyncio",
+    "http.server",
+    "parsers.youtube_parser",
+    "outputs.export_manager",
+)
+
+def scenarios(tmp: Path) -> Dict[str, List[str]]:
+    no_key = tmp / "no_key.json"
+    no_key.write_text(json.dumps({"youtube_api_key": ""}), encoding="utf-8")
+    config = tmp / "settings.json"
+    config.write_text(
+        json.dumps(
+            {
+                "youtube_api_key": "bench",
+                "default_output_dir": str(tmp / "out"),
+                "run_journal": False,
+            }
+        ),
+        encoding="utf-8",
+    )
+    bad_input = tmp / "bad_input.json"
+    bad_input.write_text(json.dumps({"keyword": "bench", "engine": "nope"}), encoding="utf-8")
+    return {
+        "help": ["--help"],
+        "missing_api_key": ["--config", str(no_key)],
+        "invalid_input": ["--config", str(config), "--input", str(bad_input)],
+    }
+
+def run_importtime(args: List[str]) -> Tuple[float, Set[str]]:
+    """Total top-level import time (ms) and every module imported."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", str(SRC_DIR / "main.py"), *args],
+        capture_output=True,
+        text=True,
+    )
+    total_us = 0
+    modules: Set[str] = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        if not cumulative.strip().isdigit():
+            continue  # header line
+        modules.add(name.strip())
+        # Nested imports are indented below their parent; count roots only
+        if not name[1:].startswith(" "):
+            total_us += int(cumulative)
+    return total_us / 1000, modules
+
+def run_wall(command: List[str]) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, *command], capture_output=True)
+    return (time.perf_counter() - start) * 1000
+
+def measure(args: List[str], samples: int) -> dict:
+    import_ms, wall_ms = [], []
+    modules: Set[str] = set()
+    for _ in range(samples):
+        total, seen = run_importtime(args)
+        import_ms.append(total)
+        modules |= seen
+        wall_ms.append(run_wall([str(SRC_DIR / "main.py"), *args]))
+    heavy = [
+        heavy_name
+        for heavy_name in HEAVY_MODULES
+        if any(n == heavy_name or n.startswith(heavy_name + ".") for n in modules)
+    ]
+    return {
+        "import_ms": statistics.median(import_ms),
+        "wall_ms": statistics.median(wall_ms),
+        "heavy_modules": heavy,
+    }
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--samples", type=int, default=10)
+    parser.add_argument("--thresholds", type=Path, default=THRESHOLDS_PATH)
+    parser.add_argument("--write-thresholds", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results = {
+            name: measure(cli_args, args.samples)
+            for name, cli_args in scenarios(Path(tmp)).items()
+        }
+    baseline = statistics.median(run_wall(["-c", "pass"]) for _ in range(args.samples))
+
+    print(f"{args.samples} samples each | bare interpreter start ~{baseline:.1f} ms")
+    print(f"{'scenario':<16} {'imports ms':>10} {'wall ms':>8}  heavy modules")
+    for name, r in results.items():
+        print(
+            f"{name:<16} {r['import_ms']:>10.1f} {r['wall_ms']:>8.1f}  "
+            f"{', '.join(r['heavy_modules']) or '-'}"
+        )
+
+    failures = [
+        f"{name}: imports {', '.join(r['heavy_modules'])}"
+        for name, r in results.items()
+        if r["heavy_modules"]
+    ]
+    if args.write_thresholds:
+        thresholds = {
+            name: {
+                "max_import_ms": round(r["import_ms"] * HEADROOM, 1),
+                "max_wall_ms": round(r["wall_ms"] * HEADROOM, 1),
+            }
+            for name, r in results.items()
+        }
+        args.thresholds.write_text(json.dumps(thresholds, indent=2) + "\n", encoding="utf-8")
+        print(f"\nWrote thresholds to {args.thresholds}")
+    elif args.thresholds.exists():
+        thresholds = json.loads(args.thresholds.read_text(encoding="utf-8"))
+        for name, r in results.items():
+            limits = thresholds.get(name) or {}
+            for key, value in (("import_ms", r["import_ms"]), ("wall_ms", r["wall_ms"])):
+                limit = limits.get(f"max_{key}")
+                if limit is not None and value > limit:
+                    failures.append(f"{name}: {key} {value:.1f} > {limit}")
+    else:
+        print(f"\nNo thresholds file at {args.thresholds}; skipping timing check")
+
+    if failures:
+        print("\nStartup regressions:")
+        for failure in failures:
+            print(f"  {failure}")
+        return 1
+    print("\nStartup within limits.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
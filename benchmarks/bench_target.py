@@ -0,0 +1,84 @@
+"""
+Finding N whitelisted contacts: a generous max_results vs target_contacts.
+
+Without a target, getting N contacts under a strict domainemail whitelist
+means guessing a max_results large enough, and every candidate up to it is
+searched and enriched. target_contacts pages the search only as far as
+needed and enriches the most promising channels of each page first. Runs
+both against the local stand-in and reports search calls, About fetches,
+quota units and wall time per contact found, and checks that the target
+run's contacts are ones the full run also found, unchanged.
+
+    python benchmarks/bench_target.py --channels 2000 --target 50 --guess 1000
+"""
+
+import argparse
+import sys
+
+import _common  # noqa: F401 - sets up sys.path
+from _common import Stopwatch, standin_scraper
+from standin_server import StandinConfig, StandinServer
+
+from parsers.quota_scheduler import ENDPOINT_COSTS  # type: ignore
+from parsers.youtube_parser import YouTubeScraper  # type: ignore
+
+def make_scraper(server: StandinServer, concurrency: int) -> YouTubeScraper:
+    return standin_scraper(server, concurrency=concurrency)
+
+def measure(label: str, scraper: YouTubeScraper, run) -> dict:
+    clock = Stopwatch()
+    contacts = [contact.to_dict() for contact in run()]
+    counts = scraper.request_counts
+    return {
+        "label": label,
+        "contacts": contacts,
+        "search": counts.get("search", 0),
+        "about": counts.get("about", 0),
+        "units": sum(ENDPOINT_COSTS.get(e, 0) * n for e, n in counts.items()),
+        "wall": clock.wall,
+    }
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--channels", type=int, default=2000)
+    parser.add_argument("--target", type=int, default=50)
+    parser.add_argument("--guess", type=int, default=1000, help="max_results without a target")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--about-latency", type=float, default=0.005)
+    args = parser.parse_args()
+
+    config = StandinConfig(total_channels=args.channels, latency={"about": args.about_latency})
+    domains = ["@gmail.com"]
+    with StandinServer(config) as server:
+        guessed = make_scraper(server, args.concurrency)
+        full = measure(
+            f"max {args.guess}",
+            guessed,
+            lambda: guessed.iter_contacts("bench", args.guess, domains),
+        )
+        targeted = make_scraper(server, args.concurrency)
+        target = measure(
+            f"target {args.target}",
+            targeted,
+            lambda: targeted.iter_target_contacts([("bench", args.guess)], args.target, domains),
+        )
+
+    print(f"{args.channels} channels, whitelist {', '.join(domains)}")
+    print(
+        f"{'mode':<12} {'contacts':>8} {'search':>7} {'about':>6} {'units':>6} "
+        f"{'units/c':>8} {'about/c':>8} {'wall s':>7}"
+    )
+    for r in (full, target):
+        found = max(len(r["contacts"]), 1)
+        print(
+            f"{r['label']:<12} {len(r['contacts']):>8} {r['search']:>7} {r['about']:>6} "
+            f"{r['units']:>6} {r['units'] / found:>8.1f} {r['about'] / found:>8.2f} "
+            f"{r['wall']:>7.2f}"
+        )
+    subset = all(contact in full["contacts"] for contact in target["contacts"])
+    reached = len(target["contacts"]) == args.target
+    print(f"target reached: {reached}; contacts also in the full run: {subset}")
+    return 0 if subset and reached and target["units"] < full["units"] else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,273 @@
+"""
+Local stand-in for the YouTube endpoints used by YouTubeScraper.
+
+Serves deterministic fixture data for the search, channels and channel
+About endpoints so benchmarks can drive the scraper without network access
+or API quota. Latency is simulated per endpoint. Channels can be edited
+(revisions), have only their About page edited, or be removed between
+runs; channel items carry etags and About pages carry ETags honoured by
+If-None-Match, like the real endpoints.
+"""
+
+import json
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Set
+from urllib.parse import parse_qs, urlparse
+
+ABOUT_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head><title>{title} - YouTube</title>
+<script>var ytcfg = {{"padding": "{padding}"}};</script>
+</head>
+<body>
+<div id="about">
+  <h1>{title}</h1>
+  <p>{about}</p>
+</div>
+</body>
+{tail}</html>
+"""
+
+def channel_id_for(index: int) -> str:
+    # 24 characters, like real channel ids
+    return f"UCstandin{index:015d}"
+
+def channel_index_from_id(channel_id: str) -> int:
+    return int(channel_id[len("UCstandin"):])
+
+class StandinConfig:
+    def __init__(
+        self,
+        total_channels: int = 1000,
+        latency: Optional[Dict[str, float]] = None,
+        about_padding: int = 2000,
+        tail_padding: int = 0,
+        complete_descriptions: float = 0.0,
+        error_rate: Optional[Dict[str, float]] = None,
+        seed: int = 0,
+    ) -> None:
+        # Edits per channel index: snippet (and etag) revisions, About-only
+        # revisions, and channels that no longer exist
+        self.revisions: Dict[int, int] = {}
+        self.about_revisions: Dict[int, int] = {}
+        self.removed: Set[int] = set()
+        self.total_channels = total_channels
+        # Seconds of simulated latency per endpoint
+        self.latency = {"search": 0.0, "channels": 0.0, "about": 0.0}
+        self.latency.update(latency or {})
+        self.about_padding = about_padding
+        # Bytes of script after </body>, like the player scripts real About
+        # pages end with
+        self.tail_padding = tail_padding
+        # Fraction of channels whose description lists both an email and a
+        # phone, so their About page adds nothing to the contact
+        self.complete_descriptions = complete_descriptions
+        # Fraction of requests per endpoint answered with a 503
+        self.error_rate = {"search": 0.0, "channels": 0.0, "about": 0.0}
+        self.error_rate.update(error_rate or {})
+        self.rng = random.Random(seed)
+        self.rng_lock = threading.Lock()
+
+    def should_fail(self, endpoint: str) -> bool:
+        rate = self.error_rate.get(endpoint, 0.0)
+        if rate <= 0:
+            return False
+        with self.rng_lock:
+            return self.rng.random() < rate
+
+def make_description(index: int, revision: int = 0, complete: bool = False) -> str:
+    suffix = f" Updated {revision} times." if revision else ""
+    if complete:
+        return (
+            f"Creator #{index}. Business inquiries: creator{index}@gmail.com or "
+            f"+1 555 {index % 1000:03d} {index % 10000:04d}{suffix}"
+        )
+    if index % 3 == 0:
+        return f"Creator #{index}. Business inquiries: creator{index}@gmail.com{suffix}"
+    if index % 3 == 1:
+        return (
+            f"Creator #{index}. Call us at +1 555 {index % 1000:03d} "
+            f"{index % 10000:04d}{suffix}"
+        )
+    return f"Creator #{index} posts weekly videos.{suffix}"
+
+def make_about_text(index: int, revision: int = 0) -> str:
+    if revision:
+        return f"New team address: team{index}.v{revision}@yahoo.com"
+    if index % 2 == 0:
+        return f"For collaborations contact team{index}@yahoo.com"
+    return "Thanks for watching!"
+
+class StandinHandler(BaseHTTPRequestHandler):
+    server_version = "YouTubeStandin/1.0"
+    # Keep-alive, so the scraper's pooled connections are actually reused
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; avoid delayed-ACK stalls
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):  # noqa: A002 - signature from base class
+        return
+
+    @property
+    def config(self) -> StandinConfig:
+        return self.server.standin_config  # type: ignore[attr-defined]
+
+    def _send(self, status: int, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, payload: dict) -> None:
+        self._send(200, json.dumps(payload).encode("utf-8"), "application/json")
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        parsed = urlparse(self.path)
+        params = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+        path = parsed.path
+
+        if path.endswith("/youtube/v3/search"):
+            endpoint = "search"
+        elif path.endswith("/youtube/v3/channels"):
+            endpoint = "channels"
+        elif path.startswith("/channel/") and path.rstrip("/").endswith("/about"):
+            endpoint = "about"
+        else:
+            self._send(404, b"not found", "text/plain")
+            return
+
+        self._sleep(endpoint)
+        if self._fail(endpoint):
+            return
+        if endpoint == "search":
+            self._handle_search(params)
+        elif endpoint == "channels":
+            self._handle_channels(params)
+        else:
+            self._handle_about(path.split("/")[2])
+
+    def _sleep(self, endpoint: str) -> None:
+        delay = self.config.latency.get(endpoint, 0.0)
+        if delay > 0:
+            time.sleep(delay)
+
+    def _fail(self, endpoint: str) -> bool:
+        if not self.config.should_fail(endpoint):
+            return False
+        body = json.dumps(
+            {"error": {"code": 503, "errors": [{"reason": "backendError"}]}}
+        ).encode("utf-8")
+        self._send(503, body, "application/json")
+        return True
+
+    def _handle_search(self, params: Dict[str, str]) -> None:
+        page_size = int(params.get("maxResults", "5"))
+        start = int(params.get("pageToken") or 0)
+        end = min(start + page_size, self.config.total_channels)
+        items = [
+            {
+                "kind": "youtube#searchResult",
+                "id": {"kind": "youtube#channel", "channelId": channel_id_for(i)},
+            }
+            for i in range(start, end)
+        ]
+        payload: dict = {"items": items}
+        if end < self.config.total_channels:
+            payload["nextPageToken"] = str(end)
+        self._send_json(payload)
+
+    def _handle_channels(self, params: Dict[str, str]) -> None:
+        items = []
+        for channel_id in filter(None, params.get("id", "").split(",")):
+            index = channel_index_from_id(channel_id)
+            if index in self.config.removed:
+                continue
+            revision = self.config.revisions.get(index, 0)
+            items.append(
+                {
+                    "kind": "youtube#channel",
+                    "etag": f"etag-{index}-{revision}",
+                    "id": channel_id,
+                    "snippet": {
+                        "title": f"Standin Channel {index}",
+                        "description": make_description(
+                            index,
+                            revision,
+                            complete=index % 100 < self.config.complete_descriptions * 100,
+                        ),
+                    },
+                }
+            )
+        self._send_json({"items": items})
+
+    def _handle_about(self, channel_id: str) -> None:
+        index = channel_index_from_id(channel_id)
+        revision = self.config.about_revisions.get(index, 0)
+        etag = f'"about-{index}-{revision}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = ABOUT_TEMPLATE.format(
+            title=f"Standin Channel {index}",
+            about=make_about_text(index, revision),
+            padding="x" * self.config.about_padding,
+            tail=(
+                f'<script>var ytPlayerConfig = "{"y" * self.config.tail_padding}";</script>\n'
+                if self.config.tail_padding
+                else ""
+            ),
+        ).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+class _StandinHTTPServer(ThreadingHTTPServer):
+    # The default backlog of 5 drops SYNs under concurrent benchmarks
+    request_queue_size = 128
+
+    def handle_error(self, request, client_address) -> None:
+        # Clients that stop reading a page early hang up mid-response
+        if not isinstance(sys.exc_info()[1], (BrokenPipeError, ConnectionResetError)):
+            super().handle_error(request, client_address)
+
+class StandinServer:
+    """
+    Runs the stand-in on a background thread. Use as a context manager.
+    """
+
+    def __init__(self, config: Optional[StandinConfig] = None) -> None:
+        self.config = config or StandinConfig()
+        self.httpd = _StandinHTTPServer(("127.0.0.1", 0), StandinHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.standin_config = self.config  # type: ignore[attr-defined]
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def configure_scraper(self, scraper) -> None:
+        """Point a YouTubeScraper instance at this server."""
+        scraper.search_url = f"{self.base_url}/youtube/v3/search"
+        scraper.channels_url = f"{self.base_url}/youtube/v3/channels"
+        scraper.channel_base_url = f"{self.base_url}/channel/"
+
+    def __enter__(self) -> "StandinServer":
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
@@ -1,9 +1,10 @@
 import argparse
 import json
 import logging
+import os
 import sys
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Iterator, List, NamedTuple, Optional, Tuple
 
 # Ensure the src folder is on the path so we can import sibling packages as namespace packages
 CURRENT_FILE = Path(__file__).resolve()
@@ -12,8 +13,27 @@ PROJECT_ROOT = SRC_DIR.parent
 if str(SRC_DIR) not in sys.path:
     sys.path.insert(0, str(SRC_DIR))
 
-from parsers.youtube_parser import YouTubeScraper, ChannelContact  # type: ignore
-from outputs.export_manager import ExportManager  # type: ignore
+from parsers.utils_extract import DomainMatcher  # type: ignore
+
+# Everything else (requests and bs4 through the scraper, the exporters,
+# SQLite-backed stores, the service) is imported by the command that needs
+# it, so --help and config errors return without loading any of it.
+# benchmarks/bench_startup.py keeps it that way.
+if TYPE_CHECKING:
+    from parsers.about_stream import AboutStreamer
+    from parsers.contact import ChannelContact
+    from parsers.quota_scheduler import QuotaScheduler
+    from parsers.youtube_parser import KeywordJobStats, TargetStats, YouTubeScraper
+    from service.job_service import Job
+    from storage.channel_index import ChannelIndex
+    from storage.http_cache import HttpCache
+    from storage.raw_archive import RawArchive
+    from storage.shard_queue import ShardQueue
+    from telemetry.metrics import RunMetrics
+
+# Default candidate cap for target_contacts runs; YouTube search stops
+# paging after about 500 results per query anyway
+TARGET_MAX_CANDIDATES = 500
 
 def setup_logger(verbosity: int) -> logging.Logger:
     level = logging.WARNING
@@ -41,9 +61,9 @@ def load_json_file(path: Path, logger: logging.Logger) -> dict:
         logger.error("Failed to parse JSON from %s: %s", path, exc)
         raise
 
-def normalize_domains(raw) -> List[str]:
+def normalize_domains(raw) -> DomainMatcher:
     if raw is None:
-        return []
+        return DomainMatcher([])
     if isinstance(raw, str):
         raw = [raw]
     result = []
@@ -55,7 +75,170 @@ def normalize_domains(raw) -> List[str]:
         if not item.startswith("@"):
             item = "@" + item
         result.append(item.lower())
-    return result
+    # Compiled once and shared by every channel of the run
+    return DomainMatcher(result)
+
+def parse_keyword_jobs(input_data: dict, default_max_results: int) -> List[Tuple[str, int]]:
+    """
+    Read (keyword, max_results) pairs from either a single 'keyword' or a
+    'keywords' list whose entries are strings or
+    {"keyword": ..., "max_results": ...} objects.
+    """
+    raw = input_data.get("keywords")
+    if raw is None:
+        keyword = input_data.get("keyword") or input_data.get("query") or ""
+        return [(keyword, default_max_results)] if keyword else []
+
+    if isinstance(raw, str):
+        raw = [raw]
+    jobs: List[Tuple[str, int]] = []
+    for item in raw:
+        if isinstance(item, dict):
+            keyword = (item.get("keyword") or item.get("query") or "").strip()
+            limit = int(item.get("max_results") or default_max_results)
+        else:
+            keyword = str(item or "").strip()
+            limit = default_max_results
+        if keyword:
+            jobs.append((keyword, limit))
+    return jobs
+
+def log_keyword_job_stats(stats: "KeywordJobStats", logger: logging.Logger) -> None:
+    logger.info(
+        "Keywords: %d | Search calls: %d (%d quota units) | Candidates: %d | "
+        "Unique channels: %d",
+        stats.keywords,
+        stats.search_requests,
+        stats.search_quota_units,
+        stats.candidates,
+        stats.unique_channels,
+    )
+    logger.info(
+        "Cross-keyword de-duplication skipped %d repeat channels: saved %d "
+        "channel-detail calls (%d quota units) and %d About-page fetches.",
+        stats.duplicates,
+        stats.channel_calls_saved,
+        stats.channel_quota_units_saved,
+        stats.duplicates,
+    )
+
+def log_target_stats(stats: "TargetStats", logger: logging.Logger) -> None:
+    if not stats.reached:
+        logger.warning(
+            "Found %d of the %d contacts targeted before the search results "
+            "(or max_results) ran out.",
+            stats.contacts,
+            stats.target,
+        )
+    logger.info(
+        "Target mode: %d contacts from %d candidates (%d enriched) | Search "
+        "calls: %d | Channel calls: %d | About fetches: %d | Quota units: %d",
+        stats.contacts,
+        stats.candidates,
+        stats.enriched,
+        stats.search_requests,
+        stats.channel_calls,
+        stats.about_fetches,
+        stats.quota_units,
+    )
+    if stats.contacts:
+        logger.info(
+            "Per contact found: %.1f quota units, %.2f About fetches, %.2f "
+            "channels enriched.",
+            stats.per_contact(stats.quota_units),
+            stats.per_contact(stats.about_fetches),
+            stats.per_contact(stats.enriched),
+        )
+
+class JobSettings(NamedTuple):
+    """A scrape job's input, validated and resolved against the config."""
+
+    keyword_jobs: List[Tuple[str, int]]
+    max_results: int
+    multi_keyword: bool
+    allowed_domains: DomainMatcher
+    export_formats: List[str]
+    engine: str
+    compression: Optional[str]
+    append: bool
+    options: dict
+    # Stop once this many contacts are found; 0 enriches every candidate
+    target_contacts: int
+
+def parse_job_input(config: dict, input_data: dict) -> JobSettings:
+    """
+    Read a job in the shape of input.sample.json; the input file wins over
+    config. Raises ValueError if the job cannot run, including when a field
+    has the wrong type.
+    """
+    if not isinstance(input_data, dict):
+        raise ValueError("Job input must be a JSON object.")
+    try:
+        return _resolve_job_input(config, input_data)
+    except (TypeError, AttributeError) as exc:
+        raise ValueError(f"Invalid job input: {exc}") from None
+
+def _resolve_job_input(config: dict, input_data: dict) -> JobSettings:
+    target_contacts = int(input_data.get("target_contacts") or 0)
+    if target_contacts < 0:
+        raise ValueError("target_contacts cannot be negative.")
+    # In target mode max_results only guards against runaway paging
+    max_results = int(
+        input_data.get("max_results")
+        or (TARGET_MAX_CANDIDATES if target_contacts else 50)
+    )
+    keyword_jobs = parse_keyword_jobs(input_data, max_results)
+    if not keyword_jobs:
+        raise ValueError("Input is missing required field 'keyword'.")
+    engine = (input_data.get("engine") or config.get("engine") or "sync").lower()
+    if engine not in ("sync", "async"):
+        raise ValueError(f"Unknown engine '{engine}'; expected 'sync' or 'async'.")
+    if engine == "async" and ("keywords" in input_data or target_contacts):
+        # The async pipeline only implements single-keyword iter_contacts
+        raise ValueError(
+            "engine 'async' runs single-keyword jobs only; use engine 'sync' "
+            "with a 'keywords' list or 'target_contacts'."
+        )
+    options = scraper_options(config, input_data)
+    if options["fetch_policy"] not in ("always", "when_needed", "never"):
+        raise ValueError(
+            f"Unknown fetch_policy '{options['fetch_policy']}'; "
+            "expected 'always', 'when_needed' or 'never'."
+        )
+    raw_domains = input_data.get("domainemail") or input_data.get("domain_email")
+    return JobSettings(
+        keyword_jobs=keyword_jobs,
+        max_results=max_results,
+        multi_keyword="keywords" in input_data,
+        allowed_domains=normalize_domains(raw_domains),
+        export_formats=input_data.get("export_formats") or ["json"],
+        engine=engine,
+        compression=input_data.get("compression") or config.get("compression") or None,
+        append=bool(input_data.get("append")),
+        options=options,
+        target_contacts=target_contacts,
+    )
+
+def iter_job_contacts(
+    scraper: "YouTubeScraper", job: JobSettings
+) -> Iterator["ChannelContact"]:
+    if job.target_contacts:
+        return scraper.iter_target_contacts(
+            job.keyword_jobs,
+            job.target_contacts,
+            domain_whitelist=job.allowed_domains,
+            multi_keyword=job.multi_keyword,
+        )
+    if job.multi_keyword:
+        return scraper.iter_keyword_contacts(
+            job.keyword_jobs, domain_whitelist=job.allowed_domains
+        )
+    keyword, max_results = job.keyword_jobs[0]
+    return scraper.iter_contacts(
+        keyword=keyword,
+        max_results=max_results,
+        domain_whitelist=job.allowed_domains,
+    )
 
 def resolve_output_dir(default_dir: Optional[str]) -> Path:
     if default_dir:
@@ -63,61 +246,1001 @@ def resolve_output_dir(default_dir: Optional[str]) -> Path:
     # Fallback to ./data
     return (PROJECT_ROOT / "data").resolve()
 
-def run(config_path: Path, input_path: Path, verbosity: int) -> None:
-    logger = setup_logger(verbosity)
-    logger.debug("Project root resolved to %s", PROJECT_ROOT)
+def build_http_cache(
+    config: dict, output_dir: Path, logger: logging.Logger
+) -> Optional["HttpCache"]:
+    cache_cfg = config.get("cache") or {}
+    if not cache_cfg.get("enabled"):
+        return None
+    from storage.http_cache import HttpCache  # type: ignore
 
-    config = load_json_file(config_path, logger)
-    input_data = load_json_file(input_path, logger)
+    path = Path(cache_cfg.get("path") or output_dir / "cache" / "http_cache.sqlite")
+    if not path.is_absolute():
+        path = (PROJECT_ROOT / path).resolve()
+    ttls = {
+        endpoint: float(hours) * 3600
+        for endpoint, hours in (cache_cfg.get("ttl_hours") or {}).items()
+    }
+    max_bytes = int(float(cache_cfg.get("max_mb") or 512) * 1024 * 1024)
+    logger.info("Using HTTP cache at %s", path)
+    return HttpCache(path=path, ttls=ttls, max_bytes=max_bytes, logger=logger)
+
+def build_channel_index(
+    config: dict, output_dir: Path, logger: logging.Logger
+) -> Optional["ChannelIndex"]:
+    index_cfg = config.get("channel_index") or {}
+    if not index_cfg.get("enabled"):
+        return None
+    from storage.channel_index import ChannelIndex  # type: ignore
+
+    path = Path(index_cfg.get("path") or output_dir / "index" / "channels.sqlite")
+    if not path.is_absolute():
+        path = (PROJECT_ROOT / path).resolve()
+    max_age = float(index_cfg.get("max_age_days") or 30) * 86400
+    logger.info("Using channel index at %s", path)
+    return ChannelIndex(
+        path=path,
+        max_age_seconds=max_age,
+        mode=index_cfg.get("mode") or "reuse",
+        logger=logger,
+    )
+
+def resolve_archive_path(config: dict, output_dir: Path) -> Path:
+    archive_cfg = config.get("raw_archive") or {}
+    path = Path(archive_cfg.get("path") or output_dir / "archive" / "raw.sqlite")
+    if not path.is_absolute():
+        path = (PROJECT_ROOT / path).resolve()
+    return path
+
+def build_raw_archive(
+    config: dict,
+    output_dir: Path,
+    logger: logging.Logger,
+    run_id: Optional[str] = None,
+    about_backend: str = "fast",
+) -> Optional["RawArchive"]:
+    if not (config.get("raw_archive") or {}).get("enabled"):
+        return None
+    from storage.raw_archive import RawArchive  # type: ignore
+
+    path = resolve_archive_path(config, output_dir)
+    logger.info("Archiving raw responses to %s", path)
+    return RawArchive(path, run_id=run_id, about_backend=about_backend, logger=logger)
+
+def build_scheduler(
+    config: dict, output_dir: Path, logger: logging.Logger
+) -> "QuotaScheduler":
+    from parsers.quota_scheduler import QuotaScheduler  # type: ignore
+
+    quota_cfg = config.get("quota") or {}
+    state_path = Path(quota_cfg.get("state_path") or output_dir / "quota_state.json")
+    if not state_path.is_absolute():
+        state_path = (PROJECT_ROOT / state_path).resolve()
+    return QuotaScheduler(
+        daily_budget=int(quota_cfg.get("daily_budget") or 10_000),
+        requests_per_second=float(quota_cfg.get("requests_per_second") or 5),
+        burst=int(quota_cfg.get("burst") or 10),
+        max_retries=int(quota_cfg.get("max_retries", 4)),
+        backoff_base=float(quota_cfg.get("backoff_base_seconds") or 1.0),
+        state_path=state_path,
+        logger=logger,
+    )
+
+def build_metrics(config: dict) -> Optional["RunMetrics"]:
+    metrics_cfg = config.get("metrics") or {}
+    if not metrics_cfg.get("enabled"):
+        return None
+    from telemetry.metrics import RunMetrics  # type: ignore
+
+    return RunMetrics()
+
+def build_about_streamer(config: dict, logger: logging.Logger) -> "AboutStreamer":
+    from parsers.about_stream import AboutStreamer  # type: ignore
+
+    stream_cfg = config.get("about_stream") or {}
+    return AboutStreamer(
+        chunk_size=int(float(stream_cfg.get("chunk_kb") or 16) * 1024),
+        max_page_bytes=int(float(stream_cfg.get("max_page_kb", 1024)) * 1024),
+        inflight_bytes=int(float(stream_cfg.get("inflight_mb", 32)) * 1024 * 1024),
+        stop_early=bool(stream_cfg.get("stop_early", True)),
+        logger=logger,
+    )
+
+def scraper_options(config: dict, input_data: dict) -> dict:
+    """Scraper tuning shared by every command; the input file wins over config."""
+    return {
+        "concurrency": int(
+            input_data.get("concurrency") or config.get("concurrency") or 1
+        ),
+        "about_backend": (
+            input_data.get("about_backend") or config.get("about_backend") or "fast"
+        ),
+        "extract_workers": int(
+            input_data.get("extract_workers") or config.get("extract_workers") or 0
+        ),
+        "fetch_policy": (
+            input_data.get("fetch_policy") or config.get("fetch_policy") or "always"
+        ).lower(),
+    }
+
+def build_scraper(
+    config: dict,
+    output_dir: Path,
+    logger: logging.Logger,
+    scraper_cls=None,
+    live: bool = False,
+    **kwargs,
+) -> "YouTubeScraper":
+    """
+    Create a scraper (YouTubeScraper unless scraper_cls is given) with the
+    cache, channel index, quota scheduler, About streaming and raw archive
+    described by config. live leaves out the cache, index and archive, for
+    commands that must see current data. Invalid settings exit with status 1.
+    """
+    if scraper_cls is None:
+        from parsers.youtube_parser import YouTubeScraper  # type: ignore
+
+        scraper_cls = YouTubeScraper
+    cache = None if live else build_http_cache(config, output_dir, logger)
+    try:
+        channel_index = None if live else build_channel_index(config, output_dir, logger)
+        scheduler = build_scheduler(config, output_dir, logger)
+        kwargs.setdefault("about_streamer", build_about_streamer(config, logger))
+        if not live and "raw_archive" not in kwargs:
+            # Archived under the journal's run id, so a resumed run adds to it
+            journal = kwargs.get("journal")
+            kwargs["raw_archive"] = build_raw_archive(
+                config,
+                output_dir,
+                logger,
+                run_id=journal.run_id if journal is not None else None,
+                about_backend=kwargs.get("about_backend") or "fast",
+            )
+        return scraper_cls(
+            api_key=config.get("youtube_api_key") or "",
+            logger=logger,
+            cache=cache,
+            channel_index=channel_index,
+            scheduler=scheduler,
+            **kwargs,
+        )
+    except ValueError as exc:
+        logger.error("%s", exc)
+        raise SystemExit(1)
+
+def close_scraper(scraper: "YouTubeScraper", logger: logging.Logger) -> None:
+    """
+    Log the scraper's quota, cache, index, download and archive stats and
+    release them.
+    """
+    scraper.scheduler.log_stats()
+    scraper.about_streamer.log_stats()
+    scraper.log_fetch_policy_stats()
+    log_failed_batches(scraper, logger)
+
+    if scraper.cache is not None:
+        scraper.cache.log_stats()
+        scraper.cache.close()
+
+    if scraper.channel_index is not None:
+        scraper.channel_index.log_stats()
+        scraper.channel_index.close()
+
+    if scraper.raw_archive is not None:
+        scraper.raw_archive.log_stats()
+        scraper.raw_archive.close()
+
+def log_failed_batches(scraper: "YouTubeScraper", logger: logging.Logger) -> None:
+    if scraper.failed_batches:
+        logger.warning(
+            "%d channel-detail batches (%d channels) failed and are missing "
+            "from the output.",
+            len(scraper.failed_batches),
+            sum(len(batch) for batch in scraper.failed_batches),
+        )
 
-    api_key = config.get("youtube_api_key") or ""
-    if not api_key:
+def build_shard_queue(
+    config: dict,
+    output_dir: Path,
+    logger: logging.Logger,
+    queue_path: Optional[str] = None,
+) -> "ShardQueue":
+    from storage.shard_queue import ShardQueue  # type: ignore
+
+    queue_cfg = config.get("distributed") or {}
+    path = Path(
+        queue_path or queue_cfg.get("queue_path") or output_dir / "queue" / "shards.sqlite"
+    )
+    if not path.is_absolute():
+        path = (PROJECT_ROOT / path).resolve()
+    logger.info("Using shard queue at %s", path)
+    try:
+        return ShardQueue(
+            path=path,
+            lease_seconds=float(queue_cfg.get("lease_seconds") or 300),
+            max_attempts=int(queue_cfg.get("max_attempts") or 5),
+            search_timeout=float(queue_cfg.get("search_timeout_seconds") or 600),
+            logger=logger,
+        )
+    except ValueError as exc:
+        logger.error("%s", exc)
+        raise SystemExit(1)
+
+def require_api_key(config: dict, config_path: Path, logger: logging.Logger) -> None:
+    if not config.get("youtube_api_key"):
         logger.error(
             "YouTube API key missing. Please set 'youtube_api_key' in %s.",
             config_path,
         )
         raise SystemExit(1)
 
+def write_metrics(
+    metrics: "RunMetrics", config: dict, output_dir: Path, logger: logging.Logger
+) -> None:
+    metrics_cfg = config.get("metrics") or {}
+    targets = (
+        ("stats_path", "run_stats.json", metrics.write_json),
+        ("prometheus_path", "youtube_scraper.prom", metrics.write_prometheus),
+    )
+    for key, default_name, write in targets:
+        path = Path(metrics_cfg.get(key) or output_dir / "metrics" / default_name)
+        if not path.is_absolute():
+            path = (PROJECT_ROOT / path).resolve()
+        try:
+            write(path)
+        except OSError as exc:
+            logger.warning("Could not write metrics to %s: %s", path, exc)
+        else:
+            logger.info("Wrote run metrics to %s", path)
+
+def log_stage_summary(metrics: "RunMetrics", logger: logging.Logger) -> None:
+    for stage, stats in metrics.snapshot()["stages"].items():
+        logger.info(
+            "Stage %-11s %6d calls | total %8.2fs | p50 %8.2fms | p95 %8.2fms",
+            stage,
+            stats["count"],
+            stats["total_seconds"],
+            stats["p50_ms"],
+            stats["p95_ms"],
+        )
+
+def run_profiled(report_path: Path, func, *args, **kwargs) -> None:
+    """
+    Run func under cProfile and write a hot-spot report sorted by cumulative
+    and internal time, plus the raw stats (<report>.prof) for other viewers.
+    Worker threads get their own profilers, merged into the same report.
+    """
+    import cProfile
+    import io
+    import pstats
+    import threading
+
+    profilers = [cProfile.Profile()]
+    lock = threading.Lock()
+
+    def profile_thread(*_args) -> None:
+        # Runs as the first profile event of each new thread
+        sys.setprofile(None)
+        profiler = cProfile.Profile()
+        with lock:
+            profilers.append(profiler)
+        profiler.enable()
+
+    # From 3.12 cProfile hooks sys.monitoring, which already sees every thread
+    per_thread = sys.version_info < (3, 12)
+    if per_thread:
+        threading.setprofile(profile_thread)
+    try:
+        profilers[0].runcall(func, *args, **kwargs)
+    finally:
+        if per_thread:
+            threading.setprofile(None)
+        for profiler in profilers[1:]:
+            profiler.disable()
+        stats = pstats.Stats(profilers[0])
+        for profiler in profilers[1:]:
+            stats.add(profiler)
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        stats.dump_stats(str(report_path.with_suffix(".prof")))
+        buffer = io.StringIO()
+        stats.stream = buffer
+        stats.strip_dirs()
+        for sort_key in ("cumulative", "tottime"):
+            buffer.write(f"=== Top 40 functions by {sort_key} time ===\n")
+            stats.sort_stats(sort_key).print_stats(40)
+        report_path.write_text(buffer.getvalue(), encoding="utf-8")
+        logging.getLogger("youtube-email-phone-scraper").warning(
+            "Profile report written to %s", report_path
+        )
+
+def run(
+    config_path: Path,
+    input_path: Path,
+    verbosity: int,
+    resume: Optional[str] = None,
+) -> None:
+    logger = setup_logger(verbosity)
+    logger.debug("Project root resolved to %s", PROJECT_ROOT)
+
+    config = load_json_file(config_path, logger)
+    require_api_key(config, config_path, logger)
+
     default_output_dir = config.get("default_output_dir")
     output_dir = resolve_output_dir(default_output_dir)
+    runs_dir = output_dir / "runs"
+
+    from storage.run_journal import RunJournal  # type: ignore
+
+    journal: Optional[RunJournal] = None
+    RunJournal.prune_completed(
+        runs_dir, float(config.get("run_journal_keep_days", 7)) * 86400, logger
+    )
+    if resume:
+        try:
+            journal = RunJournal.resume(runs_dir, resume, logger=logger)
+        except FileNotFoundError as exc:
+            logger.error("%s", exc)
+            raise SystemExit(1)
+        # The journal's own input wins so the resumed run repeats the same job
+        input_data = journal.params
+        logger.info("Resuming run %s; ignoring --input %s", resume, input_path)
+    else:
+        input_data = load_json_file(input_path, logger)
+        if config.get("run_journal", True):
+            journal = RunJournal.create(runs_dir, input_data, logger=logger)
+
+    if journal is not None:
+        logger.info(
+            "Run id: %s (continue an interrupted run with --resume %s)",
+            journal.run_id,
+            journal.run_id,
+        )
 
-    keyword = input_data.get("keyword") or input_data.get("query") or ""
-    if not keyword:
-        logger.error("Input is missing required field 'keyword'.")
+    try:
+        job = parse_job_input(config, input_data)
+    except ValueError as exc:
+        logger.error("%s", exc)
         raise SystemExit(1)
 
-    max_results = int(input_data.get("max_results") or 50)
-    raw_domains = input_data.get("domainemail") or input_data.get("domain_email")
-    allowed_domains = normalize_domains(raw_domains)
-    export_formats = input_data.get("export_formats") or ["json"]
+    logger.info(
+        "Starting YouTube scraping for keyword%s %s",
+        "s" if len(job.keyword_jobs) > 1 else "",
+        ", ".join(f"'{kw}'" for kw, _ in job.keyword_jobs),
+    )
+    if job.target_contacts:
+        logger.info(
+            "Target mode: stopping once %d contacts are found.", job.target_contacts
+        )
+    logger.info(
+        "Max results: %s | Domain filters: %s | Export formats: %s | "
+        "Concurrency: %s | Engine: %s | Extract workers: %s | About fetch: %s",
+        job.max_results,
+        job.allowed_domains or "none",
+        ", ".join(job.export_formats),
+        job.options["concurrency"],
+        job.engine,
+        job.options["extract_workers"] or "off",
+        job.options["fetch_policy"],
+    )
 
-    logger.info("Starting YouTube scraping for keyword '%s'", keyword)
+    # Input is valid: load the scraper and exporters now
+    from outputs.export_manager import ExportManager  # type: ignore
+    from parsers.quota_scheduler import QuotaExhausted  # type: ignore
+    from parsers.youtube_async import AsyncYouTubeScraper  # type: ignore
+    from parsers.youtube_parser import YouTubeScraper  # type: ignore
+
+    scraper_cls = AsyncYouTubeScraper if job.engine == "async" else YouTubeScraper
+    metrics = build_metrics(config)
+    scraper = build_scraper(
+        config,
+        output_dir,
+        logger,
+        scraper_cls,
+        journal=journal,
+        metrics=metrics,
+        **job.options,
+    )
+    try:
+        exporter = ExportManager(
+            output_dir=output_dir,
+            logger=logger,
+            include_keywords=job.multi_keyword,
+            metrics=metrics,
+            compression=job.compression,
+        )
+    except ValueError as exc:
+        logger.error("%s", exc)
+        raise SystemExit(1)
+    if job.append and resume:
+        logger.warning(
+            "Resuming with 'append' enabled: rows appended before the "
+            "interruption will be written again."
+        )
+    contacts = iter_job_contacts(scraper, job)
+
+    # Stream each contact to disk as soon as it is extracted, so an
+    # interrupted run keeps everything found so far.
+    quota_error: Optional[QuotaExhausted] = None
+    try:
+        with exporter.open_stream(job.export_formats, append=job.append) as stream:
+            for contact in contacts:
+                stream.write(contact)
+                stream.flush()
+                logger.debug("Exported contact for %s", contact.Channel_url)
+        if journal is not None:
+            journal.mark_complete()
+    except QuotaExhausted as exc:
+        # Exports were closed cleanly by the stream; keep what we have
+        quota_error = exc
+        logger.error("Stopping early: %s", exc)
+    except KeyboardInterrupt:
+        if journal is not None:
+            logger.warning(
+                "Run %s interrupted; continue it with --resume %s",
+                journal.run_id,
+                journal.run_id,
+            )
+        raise
+    finally:
+        if journal is not None:
+            journal.close()
+
+    logger.info("Scraping completed. Extracted %d contacts.", stream.count)
+    outputs = stream.close()
+
+    for fmt, path in outputs.items():
+        logger.info("Exported %s to %s", fmt.upper(), path)
+
+    if job.target_contacts:
+        log_target_stats(scraper.last_target_stats, logger)
+    elif job.multi_keyword:
+        log_keyword_job_stats(scraper.last_job_stats, logger)
+
+    close_scraper(scraper, logger)
+
+    if metrics is not None:
+        log_stage_summary(metrics, logger)
+        write_metrics(metrics, config, output_dir, logger)
+
+    if quota_error is not None:
+        if journal is not None:
+            logger.error(
+                "Quota exhausted. Continue once it resets with --resume %s",
+                journal.run_id,
+            )
+        raise SystemExit(3)
+
+def run_coordinator(
+    config_path: Path,
+    input_path: Path,
+    verbosity: int,
+    queue_path: Optional[str] = None,
+    job_id: Optional[str] = None,
+) -> None:
+    """
+    Distributed run, coordinator side: search, queue the channel ids as
+    shards for `work` processes, then merge their results into the usual
+    exports. Re-running with the same --job-id resumes the merge.
+    """
+    logger = setup_logger(verbosity)
+    config = load_json_file(config_path, logger)
+    require_api_key(config, config_path, logger)
+    output_dir = resolve_output_dir(config.get("default_output_dir"))
+    input_data = load_json_file(input_path, logger)
+    queue_cfg = config.get("distributed") or {}
+
+    try:
+        job = parse_job_input(config, input_data)
+    except ValueError as exc:
+        logger.error("%s", exc)
+        raise SystemExit(1)
+    if job.target_contacts:
+        # The coordinator queues every candidate before workers enrich any
+        logger.error(
+            "target_contacts is not supported by distributed runs; use max_results."
+        )
+        raise SystemExit(1)
+
+    import secrets
+    import time
+
+    from outputs.export_manager import ExportManager  # type: ignore
+    from parsers.distributed import Coordinator  # type: ignore
+    from parsers.quota_scheduler import QuotaExhausted  # type: ignore
+
+    metrics = build_metrics(config)
+    # Only searches run here; workers do the enrichment (and archiving)
+    scraper = build_scraper(config, output_dir, logger, metrics=metrics, raw_archive=None)
+    queue = build_shard_queue(config, output_dir, logger, queue_path)
+    try:
+        exporter = ExportManager(
+            output_dir=output_dir,
+            logger=logger,
+            include_keywords=job.multi_keyword,
+            metrics=metrics,
+            compression=job.compression,
+        )
+        coordinator = Coordinator(
+            scraper,
+            queue,
+            shard_size=int(queue_cfg.get("shard_size") or 200),
+            poll_interval=float(queue_cfg.get("poll_seconds") or 2),
+            logger=logger,
+        )
+    except ValueError as exc:
+        logger.error("%s", exc)
+        raise SystemExit(1)
+
+    job_id = job_id or time.strftime("%Y%m%d-%H%M%S") + "-" + secrets.token_hex(3)
     logger.info(
-        "Max results: %s | Domain filters: %s | Export formats: %s",
-        max_results,
-        allowed_domains or "none",
-        ", ".join(export_formats),
+        "Job id: %s (resume the merge with coordinate --job-id %s)", job_id, job_id
+    )
+    try:
+        coordinator.submit(
+            job_id,
+            job.keyword_jobs,
+            job.allowed_domains,
+            job.multi_keyword,
+            fetch_policy=job.options["fetch_policy"],
+        )
+    except QuotaExhausted as exc:
+        logger.error(
+            "Stopping early: %s. Re-run with --job-id %s once it resets.", exc, job_id
+        )
+        close_scraper(scraper, logger)
+        raise SystemExit(3)
+    if job.multi_keyword:
+        log_keyword_job_stats(scraper.last_job_stats, logger)
+    logger.info(
+        "Waiting for workers: run `python src/main.py work --queue %s` on each node.",
+        queue.path,
     )
 
-    scraper = YouTubeScraper(api_key=api_key, logger=logger)
-    contacts: List[ChannelContact] = scraper.scrape_contacts(
-        keyword=keyword,
-        max_results=max_results,
-        domain_whitelist=allowed_domains,
+    with exporter.open_stream(job.export_formats, append=job.append) as stream:
+        for contact in coordinator.iter_contacts(job_id):
+            stream.write(contact)
+            stream.flush()
+    outputs = stream.close()
+    logger.info("Distributed job %s completed. Merged %d contacts.", job_id, stream.count)
+    for fmt, path in outputs.items():
+        logger.info("Exported %s to %s", fmt.upper(), path)
+
+    if coordinator.failed_ids:
+        logger.warning(
+            "%d channels were in channel-detail batches that failed on the "
+            "workers and are missing from the output.",
+            len(coordinator.failed_ids),
+        )
+    if coordinator.failed_shards:
+        logger.warning(
+            "%d shards failed on every attempt and are missing from the output.",
+            len(coordinator.failed_shards),
+        )
+    close_scraper(scraper, logger)
+    queue.close()
+    if metrics is not None:
+        log_stage_summary(metrics, logger)
+        write_metrics(metrics, config, output_dir, logger)
+
+def run_worker(
+    config_path: Path,
+    verbosity: int,
+    queue_path: Optional[str] = None,
+    job_id: Optional[str] = None,
+    worker_id: Optional[str] = None,
+    wait: bool = False,
+) -> None:
+    """
+    Distributed run, worker side: enrich shards from the queue until no
+    work is left (or forever with --wait).
+    """
+    logger = setup_logger(verbosity)
+    config = load_json_file(config_path, logger)
+    require_api_key(config, config_path, logger)
+    output_dir = resolve_output_dir(config.get("default_output_dir"))
+    queue_cfg = config.get("distributed") or {}
+
+    from parsers.distributed import ShardWorker  # type: ignore
+    from parsers.quota_scheduler import QuotaExhausted  # type: ignore
+
+    metrics = build_metrics(config)
+    scraper = build_scraper(
+        config, output_dir, logger, metrics=metrics, **scraper_options(config, {})
+    )
+    queue = build_shard_queue(config, output_dir, logger, queue_path)
+    worker = ShardWorker(
+        scraper,
+        queue,
+        worker_id=worker_id,
+        poll_interval=float(queue_cfg.get("poll_seconds") or 2),
+        logger=logger,
     )
+    quota_error: Optional[QuotaExhausted] = None
+    try:
+        worker.run(job_id=job_id, wait=wait)
+    except QuotaExhausted as exc:
+        # The shard in hand went back to the queue for other workers
+        quota_error = exc
+        logger.error("Stopping worker: %s", exc)
+    finally:
+        close_scraper(scraper, logger)
+        queue.close()
+    if metrics is not None:
+        log_stage_summary(metrics, logger)
+        write_metrics(metrics, config, output_dir, logger)
+    if quota_error is not None:
+        raise SystemExit(3)
+
+def run_refresh(
+    config_path: Path,
+    input_path: Path,
+    source_path: Path,
+    verbosity: int,
+) -> None:
+    """
+    Re-validate an existing dataset instead of re-scraping it: re-query the
+    channels endpoint for its ids, re-fetch About pages only for channels
+    that changed, and write the updated dataset plus a change report. The
+    input file supplies the domain filter and export formats; its keywords
+    are not used.
+    """
+    logger = setup_logger(verbosity)
+    config = load_json_file(config_path, logger)
+    require_api_key(config, config_path, logger)
+    output_dir = resolve_output_dir(config.get("default_output_dir"))
+    input_data = load_json_file(input_path, logger)
+    refresh_cfg = config.get("refresh") or {}
+
+    import time
 
-    logger.info("Scraping completed. Extracted %d contacts.", len(contacts))
+    from outputs.export_manager import ExportManager  # type: ignore
+    from parsers.refresh import DatasetRefresher, load_dataset  # type: ignore
+    from storage.refresh_state import RefreshState  # type: ignore
 
-    exporter = ExportManager(output_dir=output_dir, logger=logger)
-    outputs = exporter.export(contacts, export_formats)
+    try:
+        table = load_dataset(source_path)
+    except (OSError, ValueError) as exc:
+        logger.error("Cannot read dataset %s: %s", source_path, exc)
+        raise SystemExit(1)
+    logger.info("Refreshing %d rows from %s", len(table), source_path)
 
+    started, cpu_started = time.time(), time.process_time()
+    metrics = build_metrics(config)
+    # Cached channel details or About pages would hide the very changes we want
+    scraper = build_scraper(
+        config,
+        output_dir,
+        logger,
+        live=True,
+        metrics=metrics,
+        **scraper_options(config, input_data),
+    )
+    state_path = Path(
+        refresh_cfg.get("state_path") or output_dir / "index" / "refresh_state.sqlite"
+    )
+    if not state_path.is_absolute():
+        state_path = (PROJECT_ROOT / state_path).resolve()
+    logger.info("Using refresh state at %s", state_path)
+    state = RefreshState(state_path, logger=logger)
+    refresher = DatasetRefresher(
+        scraper,
+        state,
+        about_max_age_seconds=float(refresh_cfg.get("about_max_age_days", 30)) * 86400,
+        logger=logger,
+    )
+    raw_domains = input_data.get("domainemail") or input_data.get("domain_email")
+    try:
+        exporter = ExportManager(
+            output_dir=output_dir,
+            logger=logger,
+            include_keywords=any(table.keywords),
+            metrics=metrics,
+            compression=input_data.get("compression") or config.get("compression") or None,
+        )
+    except ValueError as exc:
+        logger.error("%s", exc)
+        raise SystemExit(1)
+
+    # The whole dataset is in memory, so the source can be an export this
+    # run overwrites
+    with exporter.open_stream(input_data.get("export_formats") or ["json"]) as stream:
+        for contact in refresher.refresh(table, normalize_domains(raw_domains)):
+            stream.write(contact)
+        stream.discard(
+            [
+                change["channel_url"]
+                for change in refresher.changes
+                if change["outcome"] in ("removed", "filtered")
+            ]
+        )
+    outputs = stream.close()
+    state.close()
     for fmt, path in outputs.items():
         logger.info("Exported %s to %s", fmt.upper(), path)
 
+    report = refresher.report()
+    report["summary"].update(
+        source=str(source_path),
+        contacts=stream.count,
+        wall_seconds=round(time.time() - started, 3),
+        cpu_seconds=round(time.process_time() - cpu_started, 3),
+    )
+    report_path = Path(refresh_cfg.get("report_path") or output_dir / "refresh_report.json")
+    if not report_path.is_absolute():
+        report_path = (PROJECT_ROOT / report_path).resolve()
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    report_path.write_text(
+        json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8"
+    )
+
+    stats = refresher.stats
+    outcomes = stats.outcomes
+    logger.info(
+        "Refresh completed: %d unchanged, %d updated, %d removed, %d filtered, "
+        "%d unchecked. Change report: %s",
+        outcomes["unchanged"],
+        outcomes["updated"],
+        outcomes["removed"],
+        outcomes["filtered"],
+        outcomes["unchecked"],
+        report_path,
+    )
+    logger.info(
+        "%d channels calls for %d channels (%d etag matches, %d snippet "
+        "matches); About pages: %d fetched, %d not modified, %d fetches avoided.",
+        stats.channel_calls,
+        stats.channels,
+        stats.etag_matches,
+        stats.snippet_matches,
+        stats.about_fetches,
+        stats.about_not_modified,
+        stats.about_fetches_avoided,
+    )
+    close_scraper(scraper, logger)
+    if metrics is not None:
+        log_stage_summary(metrics, logger)
+        write_metrics(metrics, config, output_dir, logger)
+    if refresher.quota_error is not None:
+        raise SystemExit(3)
+
+def run_reprocess(
+    config_path: Path,
+    input_path: Path,
+    verbosity: int,
+    archive_path: Optional[str] = None,
+    run_id: Optional[str] = None,
+) -> None:
+    """
+    Re-extract contacts from the raw archive with the current extraction
+    code instead of scraping again: no request is made and no quota is
+    used. Reprocesses one archived run, or by default the latest archived
+    copy of every channel. The input file supplies the domain filter,
+    export formats and About backend; its keywords are not used.
+    """
+    logger = setup_logger(verbosity)
+    config = load_json_file(config_path, logger)
+    output_dir = resolve_output_dir(config.get("default_output_dir"))
+    input_data = load_json_file(input_path, logger)
+    options = scraper_options(config, input_data)
+    # Offline work is CPU-bound, so use every core unless told otherwise
+    workers = options["extract_workers"] or os.cpu_count() or 1
+
+    import time
+
+    from outputs.export_manager import ExportManager  # type: ignore
+    from parsers.reprocess import ArchiveReprocessor  # type: ignore
+    from storage.raw_archive import archive_runs  # type: ignore
+
+    path = (
+        Path(archive_path).resolve()
+        if archive_path
+        else resolve_archive_path(config, output_dir)
+    )
+    try:
+        runs = archive_runs(path)
+        if run_id is not None and run_id not in {run[0] for run in runs}:
+            raise ValueError(f"Run '{run_id}' is not in the raw archive {path}")
+        reprocessor = ArchiveReprocessor(
+            path,
+            about_backend=options["about_backend"],
+            workers=workers,
+            logger=logger,
+        )
+        exporter = ExportManager(
+            output_dir=output_dir,
+            logger=logger,
+            include_keywords=False,
+            compression=input_data.get("compression") or config.get("compression") or None,
+        )
+    except ValueError as exc:
+        logger.error("%s", exc)
+        raise SystemExit(1)
+    logger.info(
+        "Reprocessing %s from %s (%d runs archived) with %d workers | "
+        "About backend: %s",
+        f"run {run_id}" if run_id else "the latest copy of every channel",
+        path,
+        len(runs),
+        workers,
+        options["about_backend"],
+    )
+
+    raw_domains = input_data.get("domainemail") or input_data.get("domain_email")
+    started, cpu_started = time.perf_counter(), time.process_time()
+    try:
+        with exporter.open_stream(input_data.get("export_formats") or ["json"]) as stream:
+            for contact in reprocessor.iter_contacts(run_id, normalize_domains(raw_domains)):
+                stream.write(contact)
+    except ValueError as exc:
+        logger.error("%s", exc)
+        raise SystemExit(1)
+    outputs = stream.close()
+    wall = time.perf_counter() - started
+
+    stats = reprocessor.stats
+    logger.info(
+        "Reprocess completed: %d channels (%d About pages parsed), %d contacts "
+        "in %.2fs wall / %.2fs CPU in this process (%.0f channels/s).",
+        stats.channels,
+        stats.pages,
+        stats.contacts,
+        wall,
+        time.process_time() - cpu_started,
+        stats.channels / wall if wall > 0 else 0.0,
+    )
+    for fmt, out_path in outputs.items():
+        logger.info("Exported %s to %s", fmt.upper(), out_path)
+
+def run_service(
+    config_path: Path,
+    verbosity: int,
+    host: Optional[str] = None,
+    port: Optional[int] = None,
+) -> None:
+    """
+    Daemon mode: serve a local HTTP/JSON API for scrape jobs. The HTTP
+    session and its connection pool, the HTTP cache, channel index, quota
+    scheduler, raw archive and extraction pool are built once and shared by
+    every job, so a job only pays for its own requests.
+    """
+    logger = setup_logger(verbosity)
+    config = load_json_file(config_path, logger)
+    require_api_key(config, config_path, logger)
+    output_dir = resolve_output_dir(config.get("default_output_dir"))
+    service_cfg = config.get("service") or {}
+    max_jobs = int(service_cfg.get("max_jobs") or 2)
+
+    # Loaded once here, then warm for every job
+    from outputs.export_manager import ExportManager  # type: ignore
+    from parsers.extract_pool import create_extract_pool  # type: ignore
+    from parsers.youtube_async import AsyncYouTubeScraper  # type: ignore
+    from parsers.youtube_parser import YouTubeScraper  # type: ignore
+    from service.job_service import JobServer, JobService  # type: ignore
+
+    metrics = build_metrics(config)
+    defaults = scraper_options(config, {})
+    # Holds the shared resources; its session is sized for every job at once
+    shared = build_scraper(
+        config,
+        output_dir,
+        logger,
+        metrics=metrics,
+        concurrency=max_jobs * defaults["concurrency"],
+        about_backend=defaults["about_backend"],
+    )
+    extract_pool = (
+        create_extract_pool(defaults["extract_workers"])
+        if defaults["extract_workers"] > 0
+        else None
+    )
+
+    def run_job(job: "Job") -> dict:
+        settings = parse_job_input(config, job.params)
+        scraper_cls = (
+            AsyncYouTubeScraper if settings.engine == "async" else YouTubeScraper
+        )
+        scraper = scraper_cls(
+            api_key=shared.api_key,
+            logger=logger,
+            session=shared.session,
+            cache=shared.cache,
+            channel_index=shared.channel_index,
+            scheduler=shared.scheduler,
+            metrics=metrics,
+            extract_pool=extract_pool,
+            about_streamer=shared.about_streamer,
+            raw_archive=shared.raw_archive,
+            **settings.options,
+        )
+        exporter = ExportManager(
+            output_dir=job.output_dir,
+            logger=logger,
+            include_keywords=settings.multi_keyword,
+            metrics=metrics,
+            compression=settings.compression,
+        )
+        try:
+            with exporter.open_stream(settings.export_formats) as stream:
+                for contact in iter_job_contacts(scraper, settings):
+                    stream.write(contact)
+                    stream.flush()
+                    job.contacts = stream.count
+        finally:
+            job.failed_batches = len(scraper.failed_batches)
+            job.failed_channels = sum(len(batch) for batch in scraper.failed_batches)
+        outputs = stream.close()
+
+        # The per-job part of run's summary; the cache is shared, so its
+        # stats are totals since the service started
+        if settings.target_contacts:
+            log_target_stats(scraper.last_target_stats, logger)
+        elif settings.multi_keyword:
+            log_keyword_job_stats(scraper.last_job_stats, logger)
+        scraper.log_fetch_policy_stats()
+        log_failed_batches(scraper, logger)
+        if scraper.cache is not None:
+            scraper.cache.log_stats()
+        return outputs
+
+    try:
+        service = JobService(
+            run_job,
+            jobs_dir=output_dir / "jobs",
+            validate=lambda params: parse_job_input(config, params),
+            max_jobs=max_jobs,
+            max_queued=int(service_cfg.get("max_queued") or 100),
+            logger=logger,
+        )
+        server = JobServer(
+            service,
+            host=host or service_cfg.get("host") or "127.0.0.1",
+            port=port if port is not None else int(service_cfg.get("port") or 8765),
+            metrics_text=(
+                (lambda: "\n".join(metrics.prometheus_lines()) + "\n")
+                if metrics is not None
+                else None
+            ),
+        )
+    except (ValueError, OSError) as exc:
+        logger.error("%s", exc)
+        raise SystemExit(1)
+
+    bound_host, bound_port = server.server_address[:2]
+    # WARNING so the address shows without -v
+    logger.warning(
+        "Serving scrape jobs on http://%s:%d (up to %d at a time); Ctrl-C stops.",
+        bound_host,
+        bound_port,
+        max_jobs,
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.warning("Stopping: finishing running jobs, dropping queued ones.")
+    finally:
+        server.server_close()
+        service.shutdown()
+        if extract_pool is not None:
+            extract_pool.shutdown(wait=True, cancel_futures=True)
+        close_scraper(shared, logger)
+        if metrics is not None:
+            write_metrics(metrics, config, output_dir, logger)
+
 def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="YouTube Email & Phone Scraper - CLI entrypoint"
     )
+    parser.add_argument(
+        "command",
+        nargs="?",
+        choices=("scrape", "coordinate", "work", "serve", "refresh", "reprocess"),
+        default="scrape",
+        help="scrape: single-node run (default); coordinate: search and queue "
+        "shards for workers, then merge their results; work: enrich shards "
+        "from the queue; serve: run jobs submitted over a local HTTP API; "
+        "refresh: re-validate the dataset given with --from; reprocess: "
+        "re-extract contacts from the raw archive without any requests",
+    )
     parser.add_argument(
         "--config",
         type=str,
@@ -138,16 +1261,140 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         default=0,
         help="Increase verbosity (use -v or -vv)",
     )
-    return parser.parse_args(argv)
+    parser.add_argument(
+        "--resume",
+        metavar="RUN_ID",
+        default=None,
+        help="Continue an interrupted run from its journal in <output dir>/runs",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="REPORT",
+        nargs="?",
+        const=str(PROJECT_ROOT / "data" / "profile.txt"),
+        default=None,
+        help="Run under cProfile and write a hot-spot report "
+        "(default: data/profile.txt; raw stats go next to it as .prof)",
+    )
+    parser.add_argument(
+        "--queue",
+        metavar="PATH",
+        default=None,
+        help="Shard queue database shared by coordinate and work "
+        "(default: distributed.queue_path, or <output dir>/queue/shards.sqlite)",
+    )
+    parser.add_argument(
+        "--job-id",
+        default=None,
+        help="coordinate: job to create or resume; work: only take this job's shards",
+    )
+    parser.add_argument(
+        "--worker-id",
+        default=None,
+        help="Name this worker's leases (default: <hostname>-<pid>)",
+    )
+    parser.add_argument(
+        "--wait",
+        action="store_true",
+        help="work: keep polling for new jobs instead of exiting when idle",
+    )
+    parser.add_argument(
+        "--from",
+        dest="source",
+        metavar="PATH",
+        default=None,
+        help="refresh: previous export (json, jsonl, csv or sqlite) or a .txt "
+        "list of channel ids to re-validate",
+    )
+    parser.add_argument(
+        "--archive",
+        metavar="PATH",
+        default=None,
+        help="reprocess: raw archive to read "
+        "(default: raw_archive.path, or <output dir>/archive/raw.sqlite)",
+    )
+    parser.add_argument(
+        "--run-id",
+        default=None,
+        help="reprocess: only this archived run (default: the latest copy of "
+        "every archived channel)",
+    )
+    parser.add_argument(
+        "--host",
+        default=None,
+        help="serve: address to listen on (default: service.host or 127.0.0.1)",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=None,
+        help="serve: port to listen on (default: service.port or 8765)",
+    )
+    args = parser.parse_args(argv)
+    if args.command == "refresh" and not args.source:
+        parser.error("refresh needs --from PATH (a previous export or channel id list)")
+    return args
 
 if __name__ == "__main__":
     args = parse_args()
-    try:
-        run(
-            config_path=Path(args.config).resolve(),
+    config_path = Path(args.config).resolve()
+    if args.command == "coordinate":
+        entry = run_coordinator
+        run_kwargs = dict(
+            config_path=config_path,
+            input_path=Path(args.input).resolve(),
+            verbosity=args.verbose,
+            queue_path=args.queue,
+            job_id=args.job_id,
+        )
+    elif args.command == "serve":
+        entry = run_service
+        run_kwargs = dict(
+            config_path=config_path,
+            verbosity=args.verbose,
+            host=args.host,
+            port=args.port,
+        )
+    elif args.command == "refresh":
+        entry = run_refresh
+        run_kwargs = dict(
+            config_path=config_path,
+            input_path=Path(args.input).resolve(),
+            source_path=Path(args.source).resolve(),
+            verbosity=args.verbose,
+        )
+    elif args.command == "reprocess":
+        entry = run_reprocess
+        run_kwargs = dict(
+            config_path=config_path,
+            input_path=Path(args.input).resolve(),
+            verbosity=args.verbose,
+            archive_path=args.archive,
+            run_id=args.run_id,
+        )
+    elif args.command == "work":
+        entry = run_worker
+        run_kwargs = dict(
+            config_path=config_path,
+            verbosity=args.verbose,
+            queue_path=args.queue,
+            job_id=args.job_id,
+            worker_id=args.worker_id,
+            wait=args.wait,
+        )
+    else:
+        entry = run
+        run_kwargs = dict(
+            config_path=config_path,
             input_path=Path(args.input).resolve(),
             verbosity=args.verbose,
+            resume=args.resume,
         )
+    try:
+        if args.profile:
+            run_profiled(Path(args.profile).resolve(), entry, **run_kwargs)
+        else:
+            entry(**run_kwargs)
     except KeyboardInterrupt:
         logging.getLogger("youtube-email-phone-scraper").warning("Interrupted by user.")
         raise SystemExit(130)
\ No newline at end of file
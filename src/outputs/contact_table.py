@@ -0,0 +1,177 @@
+import csv
+import json
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from parsers.contact import CONTACT_FIELDS, ChannelContact  # type: ignore
+
+# Extra column written when include_keywords is set
+KEYWORDS_FIELD = "Keywords"
+
+# Columns with few distinct values; each distinct value is stored once
+_INTERNED_FIELDS = ("Domain_email",)
+
+class _RowLayout:
+    """Field order and column lookups shared by every view of one rows() call."""
+
+    __slots__ = ("fields", "columns", "keywords")
+
+    def __init__(self, table: "ContactTable", fields: Tuple[str, ...]) -> None:
+        self.fields = fields
+        # None marks the computed Keywords column
+        self.columns: Dict[str, Optional[List[str]]] = {
+            name: None if name == KEYWORDS_FIELD else table.columns[name]
+            for name in fields
+        }
+        self.keywords = table.keywords
+
+class ContactRow(Mapping):
+    """
+    Read-only view of one ContactTable row. Values are read straight from
+    the table's columns; nothing is copied until a writer asks for it.
+    """
+
+    __slots__ = ("_layout", "_index")
+
+    def __init__(self, layout: _RowLayout, index: int) -> None:
+        self._layout = layout
+        self._index = index
+
+    def __getitem__(self, key: str) -> str:
+        column = self._layout.columns[key]
+        if column is None:
+            return "; ".join(self._layout.keywords[self._index])
+        return column[self._index]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._layout.fields)
+
+    def __len__(self) -> int:
+        return len(self._layout.fields)
+
+    # Concrete versions of the Mapping mixins, which exporters call per row
+
+    def keys(self) -> Tuple[str, ...]:  # type: ignore[override]
+        return self._layout.fields
+
+    def get(self, key: str, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def items(self) -> List[Tuple[str, str]]:  # type: ignore[override]
+        index = self._index
+        return [
+            (key, column[index] if column is not None else self[key])
+            for key, column in self._layout.columns.items()
+        ]
+
+    def __repr__(self) -> str:
+        return f"ContactRow({dict(self)!r})"
+
+def _sqlite_rows(path: Path) -> Iterator[dict]:
+    # Loaded here so json/csv loads skip it
+    import sqlite3
+
+    try:
+        conn = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+        conn.row_factory = sqlite3.Row
+        try:
+            rows = conn.execute("SELECT * FROM contacts ORDER BY rowid").fetchall()
+        finally:
+            conn.close()
+    except sqlite3.Error as exc:
+        raise ValueError(f"Cannot load contacts from '{path.name}': {exc}") from None
+    return (dict(row) for row in rows)
+
+class ContactTable:
+    """
+    Column-oriented store for large contact datasets.
+
+    A ChannelContact costs a Python object plus an instance __dict__ per
+    row, on top of its strings. Here each export field is one list, so a
+    row costs one pointer per column, and repeated Domain_email values and
+    keyword tuples are stored once per table. Exporters read rows through
+    ContactRow views without building per-row dicts.
+    """
+
+    def __init__(self) -> None:
+        self.columns: Dict[str, List[str]] = {name: [] for name in CONTACT_FIELDS}
+        self.keywords: List[Tuple[str, ...]] = []
+        self._interned: Dict[str, Dict[str, str]] = {name: {} for name in _INTERNED_FIELDS}
+        self._interned_keywords: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+    @classmethod
+    def from_contacts(cls, contacts: Iterable[ChannelContact]) -> "ContactTable":
+        """Collect contacts (e.g. straight from iter_contacts) into a table."""
+        table = cls()
+        table.extend(contacts)
+        return table
+
+    @classmethod
+    def load(cls, path: Path) -> "ContactTable":
+        """Load a json, jsonl, csv or sqlite export written by ExportManager."""
+        table = cls()
+        suffix = path.suffix.lower()
+        if suffix == ".sqlite":
+            for row in _sqlite_rows(path):
+                table.append_row(row)
+            return table
+        with path.open("r", encoding="utf-8", newline="" if suffix == ".csv" else None) as f:
+            if suffix == ".csv":
+                rows: Iterable[Mapping] = csv.DictReader(f)
+            elif suffix == ".jsonl":
+                rows = (json.loads(line) for line in f if line.strip())
+            elif suffix == ".json":
+                rows = json.load(f)
+            else:
+                raise ValueError(f"Cannot load contacts from '{path.name}'; use json, jsonl, csv or sqlite")
+            for row in rows:
+                table.append_row(row)
+        return table
+
+    def _intern(self, name: str, value: str) -> str:
+        pool = self._interned.get(name)
+        if pool is None:
+            return value
+        return pool.setdefault(value, value)
+
+    def append(self, contact: ChannelContact) -> None:
+        for name, column in self.columns.items():
+            column.append(self._intern(name, getattr(contact, name)))
+        keywords = tuple(contact.keywords)
+        self.keywords.append(self._interned_keywords.setdefault(keywords, keywords))
+
+    def append_row(self, row: Mapping) -> None:
+        """Append an exported row (field name -> value), e.g. from a file."""
+        for name, column in self.columns.items():
+            column.append(self._intern(name, row.get(name) or ""))
+        raw = row.get(KEYWORDS_FIELD) or ""
+        keywords = tuple(kw for kw in raw.split("; ") if kw) if isinstance(raw, str) else ()
+        self.keywords.append(self._interned_keywords.setdefault(keywords, keywords))
+
+    def extend(self, contacts: Iterable[ChannelContact]) -> None:
+        for contact in contacts:
+            self.append(contact)
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def contact(self, index: int) -> ChannelContact:
+        """Materialize one row as a ChannelContact."""
+        values = {name: column[index] for name, column in self.columns.items()}
+        return ChannelContact(**values, keywords=self.keywords[index])
+
+    def __iter__(self) -> Iterator[ChannelContact]:
+        for index in range(len(self)):
+            yield self.contact(index)
+
+    def rows(self, fields: Optional[Sequence[str]] = None) -> Iterator[ContactRow]:
+        """
+        Row views over fields (default: the export columns). Include
+        KEYWORDS_FIELD to get each row's keywords joined with "; ".
+        """
+        layout = _RowLayout(self, tuple(fields) if fields is not None else CONTACT_FIELDS)
+        for index in range(len(self)):
+            yield ContactRow(layout, index)
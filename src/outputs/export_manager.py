@@ -1,172 +1,596 @@
 import csv
 import html
 import json
+import time
 from pathlib import Path
-from typing import Dict, Iterable, List, Mapping
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, TextIO, Union
 
-from parsers.youtube_parser import ChannelContact  # type: ignore
+from outputs.contact_table import KEYWORDS_FIELD, ContactTable  # type: ignore
+from parsers.contact import CONTACT_FIELDS, ChannelContact  # type: ignore
+from telemetry.metrics import NULL_METRICS, RunMetrics  # type: ignore
+
+# The string encoder json.dumps uses with ensure_ascii=False
+_encode_str = json.encoder.encode_basestring
+
+# Output compression -> file suffix
+COMPRESSIONS = {"gzip": ".gz", "zstd": ".zst"}
+# Rows are collected and handed to the file (or compressor) in chunks this large
+CHUNK_SIZE = 1 << 16
+
+def _esc(value: str) -> str:
+    return html.escape(value or "", quote=True)
+
+def _zstd_module():
+    try:
+        from compression import zstd  # type: ignore  # Python 3.14+
+    except ImportError:
+        import zstandard as zstd  # type: ignore
+    return zstd
+
+def _open_zstd(path: Path, mode: str, newline: Optional[str]) -> TextIO:
+    return _zstd_module().open(str(path), mode + "t", encoding="utf-8", newline=newline)
+
+def _open_text(
+    path: Path, mode: str, newline: Optional[str], compression: Optional[str]
+) -> TextIO:
+    if compression == "gzip":
+        import gzip
+
+        # Appending adds a gzip member; readers see one continuous stream
+        # Level 6 (zlib's default) instead of gzip's 9: ~2x faster, ~same size
+        return gzip.open(
+            path, mode + "t", compresslevel=6, encoding="utf-8", newline=newline
+        )
+    if compression == "zstd":
+        return _open_zstd(path, mode, newline)
+    return path.open(mode, encoding="utf-8", newline=newline)
+
+class _ChunkBuffer:
+    """
+    File-like sink that collects small writes and passes them on in
+    CHUNK_SIZE pieces, so per-row writes cost a list append rather than a
+    trip through the text and compression layers.
+    """
+
+    __slots__ = ("fh", "parts", "size")
+
+    def __init__(self, fh: TextIO) -> None:
+        self.fh = fh
+        self.parts: List[str] = []
+        self.size = 0
+
+    def write(self, text: str) -> None:
+        self.parts.append(text)
+        self.size += len(text)
+        if self.size >= CHUNK_SIZE:
+            self.drain()
+
+    def drain(self) -> None:
+        if self.parts:
+            self.fh.write("".join(self.parts))
+            self.parts = []
+            self.size = 0
+
+class _FormatWriter:
+    """
+    Incremental writer for one export format.
+    The document header is written on open and closed off in close().
+    """
+
+    extension = ""
+    supports_append = False
+    # Binary formats (sqlite, parquet) manage their own files and compression
+    supports_compression = True
+    newline: Optional[str] = None
+
+    def __init__(
+        self,
+        path: Path,
+        fields: Sequence[str] = CONTACT_FIELDS,
+        append: bool = False,
+        compression: Optional[str] = None,
+    ) -> None:
+        self.path = path
+        self.fields = list(fields)
+        self.append = append and self.supports_append
+        self.compression = compression if self.supports_compression else None
+        self._fh: Optional[TextIO] = None
+
+    def open(self) -> None:
+        existing = self.append and self.path.exists() and self.path.stat().st_size > 0
+        mode = "a" if self.append else "w"
+        self._fh = _open_text(self.path, mode, self.newline, self.compression)
+        self._out = _ChunkBuffer(self._fh)
+        self.write_header(resuming=existing)
+
+    def write_header(self, resuming: bool) -> None:
+        pass
+
+    def write_row(self, row: Mapping) -> None:
+        raise NotImplementedError
+
+    def write_footer(self) -> None:
+        pass
+
+    def discard(self, channel_urls: Sequence[str]) -> None:
+        """Drop rows kept from earlier runs; rewritten formats never have any."""
+
+    def flush(self) -> None:
+        if self._fh is not None:
+            self._out.drain()
+            self._fh.flush()
+
+    def close(self) -> Path:
+        if self._fh is not None:
+            self.write_footer()
+            self._out.drain()
+            self._fh.close()
+            self._fh = None
+        return self.path
+
+def _json_object(row: Mapping, item_sep: str, open_: str, close: str) -> Optional[str]:
+    """
+    Serialize a flat row of strings as json.dumps(ensure_ascii=False) would,
+    using the C string encoder directly. With indent set, json.dumps falls
+    back to its pure-Python encoder, which dominates large JSON exports.
+    Returns None if a value is not a string, so the caller can fall back.
+    """
+    parts = []
+    for key, value in row.items():
+        if not isinstance(value, str):
+            return None
+        parts.append(f"{_encode_str(key)}: {_encode_str(value)}")
+    if not parts:
+        return "{}"
+    return open_ + item_sep.join(parts) + close
+
+class _JsonWriter(_FormatWriter):
+    extension = "json"
+
+    def write_header(self, resuming: bool) -> None:
+        self._count = 0
+
+    def write_row(self, row: Mapping) -> None:
+        # Matches json.dump(rows, indent=2) byte for byte
+        item = _json_object(row, ",\n    ", "{\n    ", "\n  }")
+        if item is None:
+            item = json.dumps(dict(row), ensure_ascii=False, indent=2).replace("\n", "\n  ")
+        self._out.write(("[\n  " if self._count == 0 else ",\n  ") + item)
+        self._count += 1
+
+    def write_footer(self) -> None:
+        self._out.write("\n]" if self._count else "[]")
+
+class _JsonLinesWriter(_FormatWriter):
+    extension = "jsonl"
+    supports_append = True
+
+    def write_row(self, row: Mapping) -> None:
+        item = _json_object(row, ", ", "{", "}")
+        if item is None:
+            item = json.dumps(dict(row), ensure_ascii=False)
+        self._out.write(item)
+        self._out.write("\n")
+
+class _CsvWriter(_FormatWriter):
+    extension = "csv"
+    supports_append = True
+    newline = ""
+
+    def write_header(self, resuming: bool) -> None:
+        # Same bytes as csv.DictWriter, without its per-row key checks
+        self._writer = csv.writer(self._out)
+        if not resuming:
+            self._writer.writerow(self.fields)
+
+    def write_row(self, row: Mapping) -> None:
+        self._writer.writerow([row.get(name, "") for name in self.fields])
+
+class _XmlWriter(_FormatWriter):
+    extension = "xml"
+
+    def write_header(self, resuming: bool) -> None:
+        self._out.write('<?xml version="1.0" encoding="UTF-8"?>\n<contacts>')
+
+    def write_row(self, row: Mapping) -> None:
+        parts = ["\n  <contact>"]
+        for key, value in row.items():
+            parts.append(f"\n    <{key}>{_esc(str(value))}</{key}>")
+        parts.append("\n  </contact>")
+        self._out.write("".join(parts))
+
+    def write_footer(self) -> None:
+        self._out.write("\n</contacts>")
+
+class _HtmlWriter(_FormatWriter):
+    extension = "html"
+
+    HEAD = [
+        "<!DOCTYPE html>",
+        "<html>",
+        "<head>",
+        '  <meta charset="utf-8" />',
+        "  <title>YouTube Contacts Export</title>",
+        "  <style>",
+        "    table { border-collapse: collapse; width: 100%; }",
+        "    th, td { border: 1px solid #ddd; padding: 8px; font-family: Arial, sans-serif; font-size: 14px; }",
+        "    th { background-color: #f4f4f4; text-align: left; }",
+        "    tr:nth-child(even) { background-color: #fbfbfb; }",
+        "  </style>",
+        "</head>",
+        "<body>",
+        "  <h1>YouTube Contacts Export</h1>",
+        "  <table>",
+        "    <thead>",
+        "      <tr>",
+    ]
+
+    def write_header(self, resuming: bool) -> None:
+        lines = list(self.HEAD)
+        for h in self.fields:
+            lines.append(f"        <th>{_esc(h)}</th>")
+        lines.extend(
+            [
+                "      </tr>",
+                "    </thead>",
+                "    <tbody>",
+            ]
+        )
+        self._out.write("\n".join(lines))
+
+    def write_row(self, row: Mapping) -> None:
+        parts = ["\n      <tr>"]
+        for h in self.fields:
+            value = str(row.get(h, ""))
+            if h == "Channel_url" and value:
+                cell = f'<a href="{_esc(value)}" target="_blank">{_esc(value)}</a>'
+            else:
+                cell = _esc(value)
+            parts.append(f"\n        <td>{cell}</td>")
+        parts.append("\n      </tr>")
+        self._out.write("".join(parts))
+
+    def write_footer(self) -> None:
+        self._out.write("\n    </tbody>\n  </table>\n</body>\n</html>")
+
+class _SqliteWriter(_FormatWriter):
+    """
+    Upserts rows into a SQLite database keyed on Channel_url, so one
+    database grows across runs instead of being rewritten. Rows are written
+    in executemany batches; Email and Domain_email are indexed for
+    filtering without loading the dataset.
+    """
+
+    extension = "sqlite"
+    # Always merges into the existing database, with or without append
+    supports_append = True
+    supports_compression = False
+    batch_size = 500
+
+    def open(self) -> None:
+        # Loaded per format, like pyarrow below, so other exports skip it
+        import sqlite3
+
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        columns = ", ".join(
+            f"{name} TEXT NOT NULL DEFAULT ''"
+            for name in self.fields
+            if name != "Channel_url"
+        )
+        self._conn.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS contacts (
+                Channel_url TEXT PRIMARY KEY,
+                {columns},
+                first_seen REAL NOT NULL,
+                last_seen REAL NOT NULL
+            )
+            """
+        )
+        existing = {row[1] for row in self._conn.execute("PRAGMA table_info(contacts)")}
+        for name in self.fields:
+            # e.g. Keywords, when a multi-keyword run writes to an older database
+            if name not in existing:
+                self._conn.execute(
+                    f"ALTER TABLE contacts ADD COLUMN {name} TEXT NOT NULL DEFAULT ''"
+                )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_contacts_email ON contacts (Email)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_contacts_domain ON contacts (Domain_email)"
+        )
+        self._conn.commit()
+        self._upsert_sql = self._build_upsert()
+        self._pending: List[tuple] = []
+
+    def _build_upsert(self) -> str:
+        names = list(self.fields) + ["first_seen", "last_seen"]
+        updates = []
+        for name in self.fields:
+            if name == "Channel_url":
+                continue
+            if name in ("Email", "Domain_email"):
+                # A run that found no email keeps the one already stored
+                updates.append(
+                    f"{name} = CASE WHEN excluded.Email != '' "
+                    f"THEN excluded.{name} ELSE contacts.{name} END"
+                )
+            elif name in ("Phone", KEYWORDS_FIELD):
+                updates.append(
+                    f"{name} = CASE WHEN excluded.{name} != '' "
+                    f"THEN excluded.{name} ELSE contacts.{name} END"
+                )
+            else:
+                updates.append(f"{name} = excluded.{name}")
+        updates.append("last_seen = excluded.last_seen")
+        return (
+            f"INSERT INTO contacts ({', '.join(names)}) "
+            f"VALUES ({', '.join('?' for _ in names)}) "
+            f"ON CONFLICT(Channel_url) DO UPDATE SET {', '.join(updates)}"
+        )
+
+    def write_row(self, row: Mapping) -> None:
+        now = time.time()
+        self._pending.append(
+            tuple(row.get(name) or "" for name in self.fields) + (now, now)
+        )
+        if len(self._pending) >= self.batch_size:
+            self._write_pending()
+
+    def _write_pending(self) -> None:
+        if self._pending:
+            with self._conn:
+                self._conn.executemany(self._upsert_sql, self._pending)
+            self._pending = []
+
+    def discard(self, channel_urls: Sequence[str]) -> None:
+        self._write_pending()
+        with self._conn:
+            self._conn.executemany(
+                "DELETE FROM contacts WHERE Channel_url = ?",
+                [(url,) for url in channel_urls],
+            )
+
+    def flush(self) -> None:
+        self._write_pending()
+
+    def close(self) -> Path:
+        if getattr(self, "_conn", None) is not None:
+            self._write_pending()
+            self._conn.close()
+            self._conn = None
+        return self.path
+
+class _ParquetWriter(_FormatWriter):
+    """
+    Parquet via pyarrow (optional dependency), written in row groups so
+    memory stays bounded by row_group_size rows.
+    """
+
+    extension = "parquet"
+    supports_compression = False
+    row_group_size = 10_000
+
+    def open(self) -> None:
+        import pyarrow as pa  # type: ignore
+        import pyarrow.parquet as pq  # type: ignore
+
+        self._pa = pa
+        self._schema = pa.schema([(name, pa.string()) for name in self.fields])
+        self._writer = pq.ParquetWriter(str(self.path), self._schema, compression="zstd")
+        self._columns: Dict[str, List[str]] = {name: [] for name in self.fields}
+        self._buffered = 0
+
+    def write_row(self, row: Mapping) -> None:
+        for name, column in self._columns.items():
+            column.append(row.get(name) or "")
+        self._buffered += 1
+        if self._buffered >= self.row_group_size:
+            self._write_row_group()
+
+    def _write_row_group(self) -> None:
+        if not self._buffered:
+            return
+        table = self._pa.Table.from_pydict(self._columns, schema=self._schema)
+        self._writer.write_table(table)
+        self._columns = {name: [] for name in self.fields}
+        self._buffered = 0
+
+    def flush(self) -> None:
+        # Row groups are written when full; a flush per contact would make
+        # one tiny row group per row
+        pass
+
+    def close(self) -> Path:
+        if getattr(self, "_writer", None) is not None:
+            self._write_row_group()
+            self._writer.close()
+            self._writer = None
+        return self.path
+
+WRITERS = {
+    "json": _JsonWriter,
+    "jsonl": _JsonLinesWriter,
+    "csv": _CsvWriter,
+    "xml": _XmlWriter,
+    "html": _HtmlWriter,
+    "sqlite": _SqliteWriter,
+    "parquet": _ParquetWriter,
+}
+
+class ExportStream:
+    """
+    Open set of format writers that contacts are written to one at a time.
+    Each contact is converted to a row once and handed to every writer.
+    flush() reaches the files at most once per flush_interval seconds, so
+    callers can flush after every contact without defeating buffering,
+    batching or compression.
+    """
+
+    flush_interval = 1.0
+
+    def __init__(
+        self,
+        writers: Dict[str, _FormatWriter],
+        logger,
+        include_keywords: bool = False,
+        metrics: Optional[RunMetrics] = None,
+    ) -> None:
+        self.writers = writers
+        self.logger = logger
+        self.include_keywords = include_keywords
+        self.metrics = metrics if metrics is not None else NULL_METRICS
+        self.count = 0
+        self._closed = False
+        self._last_flush = time.monotonic()
+
+    def write(self, contact: ChannelContact) -> None:
+        self.write_row(contact.to_dict(include_keywords=self.include_keywords))
+
+    def write_row(self, row: Mapping) -> None:
+        """Write an already converted row, such as a ContactTable view."""
+        with self.metrics.timer("export"):
+            for writer in self.writers.values():
+                writer.write_row(row)
+        self.count += 1
+
+    def discard(self, channel_urls: Sequence[str]) -> None:
+        """
+        Remove channels from formats that keep rows across runs (sqlite),
+        e.g. ones a refresh found deleted.
+        """
+        if channel_urls:
+            for writer in self.writers.values():
+                writer.discard(channel_urls)
+
+    def flush(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if not force and now - self._last_flush < self.flush_interval:
+            return
+        for writer in self.writers.values():
+            writer.flush()
+        self._last_flush = now
+
+    def close(self) -> Dict[str, Path]:
+        # Writers ignore repeated close() calls, so this is idempotent
+        paths = {fmt: writer.close() for fmt, writer in self.writers.items()}
+        if self.metrics.enabled and not self._closed:
+            self.metrics.count("export_rows", "", self.count)
+            for fmt, path in paths.items():
+                self.metrics.count("export_bytes", fmt, path.stat().st_size)
+        self._closed = True
+        return paths
+
+    def __enter__(self) -> "ExportStream":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
 
 class ExportManager:
     """
     Handles multi-format export of scraped contact data.
-    Supported formats: json, csv, xml, html
+    Supported formats: json, jsonl, csv, xml, html, sqlite, parquet
+    (parquet needs pyarrow)
+
+    Exports are streamed: open_stream() writes each document's header up
+    front, contacts are written as they arrive, and close() finishes the
+    documents. With append=True, csv and jsonl add to existing files.
+    sqlite always upserts into its existing database, keyed on Channel_url.
+    With compression="gzip" or "zstd" the text formats are written
+    compressed (contacts.json.gz, contacts.csv.zst, ...).
+    With include_keywords=True a Keywords column records each contact's
+    search provenance.
     """
 
-    def __init__(self, output_dir: Path, logger) -> None:
+    def __init__(
+        self,
+        output_dir: Path,
+        logger,
+        include_keywords: bool = False,
+        metrics: Optional[RunMetrics] = None,
+        compression: Optional[str] = None,
+    ) -> None:
+        if compression is not None and compression not in COMPRESSIONS:
+            raise ValueError(
+                f"Unknown export compression '{compression}'; expected one of: "
+                f"{', '.join(COMPRESSIONS)}"
+            )
+        if compression == "zstd":
+            try:
+                _zstd_module()
+            except ImportError:
+                raise ValueError(
+                    "zstd export compression needs Python 3.14+ or the "
+                    "'zstandard' package"
+                ) from None
         self.output_dir = output_dir
         self.logger = logger
+        self.include_keywords = include_keywords
+        self.metrics = metrics
+        self.compression = compression
+        self.fields: List[str] = list(CONTACT_FIELDS)
+        if include_keywords:
+            self.fields.append(KEYWORDS_FIELD)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
     def export(
         self,
-        contacts: Iterable[ChannelContact],
+        contacts: Union[Iterable[ChannelContact], ContactTable],
         formats: Iterable[str],
+        append: bool = False,
     ) -> Dict[str, Path]:
-        contacts_list: List[ChannelContact] = list(contacts)
-        results: Dict[str, Path] = {}
+        with self.open_stream(formats, append=append) as stream:
+            if isinstance(contacts, ContactTable):
+                # Row views straight off the columns; no per-row objects
+                for row in contacts.rows(self.fields):
+                    stream.write_row(row)
+            else:
+                for contact in contacts:
+                    stream.write(contact)
+        return stream.close()
 
+    def open_stream(
+        self,
+        formats: Iterable[str],
+        append: bool = False,
+    ) -> ExportStream:
         normalized_formats = {fmt.lower().strip() for fmt in formats}
         if not normalized_formats:
             normalized_formats = {"json"}
 
-        for fmt in normalized_formats:
-            if fmt == "json":
-                results["json"] = self._export_json(contacts_list)
-            elif fmt == "csv":
-                results["csv"] = self._export_csv(contacts_list)
-            elif fmt == "xml":
-                results["xml"] = self._export_xml(contacts_list)
-            elif fmt == "html":
-                results["html"] = self._export_html(contacts_list)
-            else:
-                self.logger.warning("Unknown export format '%s'; skipping.", fmt)
-
-        return results
-
-    def _contacts_to_dicts(self, contacts: List[ChannelContact]) -> List[Mapping]:
-        return [c.to_dict() for c in contacts]
-
-    def _export_json(self, contacts: List[ChannelContact]) -> Path:
-        path = self.output_dir / "contacts.json"
-        self.logger.debug("Exporting JSON to %s", path)
-        data = self._contacts_to_dicts(contacts)
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        return path
-
-    def _export_csv(self, contacts: List[ChannelContact]) -> Path:
-        path = self.output_dir / "contacts.csv"
-        self.logger.debug("Exporting CSV to %s", path)
-        rows = self._contacts_to_dicts(contacts)
-        if not rows:
-            # Still create an empty file with headers
-            headers = [
-                "Channel_url",
-                "Channel_name",
-                "Email",
-                "Domain_email",
-                "Phone",
-                "Description",
-            ]
-        else:
-            headers = list(rows[0].keys())
-        with path.open("w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=headers)
-            writer.writeheader()
-            for row in rows:
-                writer.writerow(row)
-        return path
-
-    def _export_xml(self, contacts: List[ChannelContact]) -> Path:
-        path = self.output_dir / "contacts.xml"
-        self.logger.debug("Exporting XML to %s", path)
-        rows = self._contacts_to_dicts(contacts)
-
-        def esc(value: str) -> str:
-            return html.escape(value or "", quote=True)
-
-        xml_parts: List[str] = ['<?xml version="1.0" encoding="UTF-8"?>', "<contacts>"]
-        for row in rows:
-            xml_parts.append("  <contact>")
-            for key, value in row.items():
-                xml_parts.append(
-                    f"    <{key}>{esc(str(value))}</{key}>"
+        writers: Dict[str, _FormatWriter] = {}
+        try:
+            for fmt in sorted(normalized_formats):
+                writer_cls = WRITERS.get(fmt)
+                if writer_cls is None:
+                    self.logger.warning("Unknown export format '%s'; skipping.", fmt)
+                    continue
+                path = self.output_dir / f"contacts.{writer_cls.extension}"
+                if self.compression and writer_cls.supports_compression:
+                    path = path.with_name(path.name + COMPRESSIONS[self.compression])
+                writer = writer_cls(
+                    path, fields=self.fields, append=append, compression=self.compression
                 )
-            xml_parts.append("  </contact>")
-        xml_parts.append("</contacts>")
-
-        with path.open("w", encoding="utf-8") as f:
-            f.write("\n".join(xml_parts))
-
-        return path
-
-    def _export_html(self, contacts: List[ChannelContact]) -> Path:
-        path = self.output_dir / "contacts.html"
-        self.logger.debug("Exporting HTML to %s", path)
-        rows = self._contacts_to_dicts(contacts)
-
-        headers = [
-            "Channel_url",
-            "Channel_name",
-            "Email",
-            "Domain_email",
-            "Phone",
-            "Description",
-        ]
-
-        def esc(value: str) -> str:
-            return html.escape(value or "", quote=True)
-
-        lines: List[str] = [
-            "<!DOCTYPE html>",
-            "<html>",
-            "<head>",
-            '  <meta charset="utf-8" />',
-            "  <title>YouTube Contacts Export</title>",
-            "  <style>",
-            "    table { border-collapse: collapse; width: 100%; }",
-            "    th, td { border: 1px solid #ddd; padding: 8px; font-family: Arial, sans-serif; font-size: 14px; }",
-            "    th { background-color: #f4f4f4; text-align: left; }",
-            "    tr:nth-child(even) { background-color: #fbfbfb; }",
-            "  </style>",
-            "</head>",
-            "<body>",
-            "  <h1>YouTube Contacts Export</h1>",
-            "  <table>",
-            "    <thead>",
-            "      <tr>",
-        ]
-        for h in headers:
-            lines.append(f"        <th>{esc(h)}</th>")
-        lines.extend(
-            [
-                "      </tr>",
-                "    </thead>",
-                "    <tbody>",
-            ]
-        )
-
-        for row in rows:
-            lines.append("      <tr>")
-            for h in headers:
-                value = str(row.get(h, ""))
-                if h == "Channel_url" and value:
-                    cell = f'<a href="{esc(value)}" target="_blank">{esc(value)}</a>'
-                else:
-                    cell = esc(value)
-                lines.append(f"        <td>{cell}</td>")
-            lines.append("      </tr>")
+                self.logger.debug("Exporting %s to %s", fmt.upper(), path)
+                try:
+                    writer.open()
+                except ImportError as exc:
+                    # Optional backends (parquet needs pyarrow)
+                    self.logger.warning(
+                        "Skipping %s export: %s is not installed.", fmt, exc.name or exc
+                    )
+                    continue
+                writers[fmt] = writer
+        except BaseException:
+            # Release the files of the formats already opened
+            for opened in writers.values():
+                opened.close()
+            raise
 
-        lines.extend(
-            [
-                "    </tbody>",
-                "  </table>",
-                "</body>",
-                "</html>",
-            ]
+        return ExportStream(
+            writers, self.logger, self.include_keywords, metrics=self.metrics
         )
-
-        with path.open("w", encoding="utf-8") as f:
-            f.write("\n".join(lines))
-
-        return path
\ No newline at end of file
@@ -0,0 +1,142 @@
+import html as html_lib
+import json
+import re
+from typing import Callable, Dict, Iterator, List, Tuple
+
+# Openers of blocks whose contents are never visible text (BeautifulSoup
+# skips them too). Their ends are found with str.find, which is far cheaper
+# than a lazy regex over hundreds of KB of inline script.
+_HIDDEN_OPEN_RE = re.compile(
+    r"<!--|<(script|style|template)\b[^>]*>",
+    re.IGNORECASE,
+)
+# Only real markup: tags, closing tags, declarations and processing instructions.
+# A bare '<' in text (e.g. "a < b") is left alone, as html.parser does.
+_TAG_RE = re.compile(r"</?[A-Za-z][^>]*>|<![^>]*>|<\?[^>]*>")
+
+_INITIAL_DATA_RE = re.compile(r"ytInitialData\s*=\s*")
+_INITIAL_DATA_KEYS = {"description", "simpleText", "content", "text"}
+
+def about_text_soup(html: str) -> str:
+    """
+    Visible page text via a full BeautifulSoup tree. Slow but tolerant.
+    """
+    from bs4 import BeautifulSoup  # type: ignore
+
+    soup = BeautifulSoup(html, "html.parser")
+    return soup.get_text(" ", strip=True)
+
+def _find_block_end(html: str, name: str, pos: int) -> int:
+    """Index just past the closing </name> tag at or after pos, or len(html)."""
+    size = len(name)
+    while True:
+        idx = html.find("</", pos)
+        if idx == -1:
+            return len(html)
+        if html[idx + 2 : idx + 2 + size].lower() == name:
+            close = html.find(">", idx + 2 + size)
+            return len(html) if close == -1 else close + 1
+        pos = idx + 2
+
+def _strip_hidden_blocks(html: str) -> str:
+    parts: List[str] = []
+    pos = 0
+    while True:
+        match = _HIDDEN_OPEN_RE.search(html, pos)
+        if match is None:
+            parts.append(html[pos:])
+            break
+        parts.append(html[pos : match.start()])
+        parts.append(" ")
+        if match.group(1) is None:
+            end = html.find("-->", match.end())
+            pos = len(html) if end == -1 else end + 3
+        else:
+            pos = _find_block_end(html, match.group(1).lower(), match.end())
+    return "".join(parts)
+
+def about_text_fast(html: str) -> str:
+    """
+    Visible page text by scanning the raw HTML, without building a tree.
+    Produces the same text as about_text_soup for well-formed pages.
+    """
+    stripped = _strip_hidden_blocks(html)
+    pieces: List[str] = []
+    for chunk in _TAG_RE.split(stripped):
+        if "&" in chunk:
+            chunk = html_lib.unescape(chunk)
+        chunk = chunk.strip()
+        if chunk:
+            pieces.append(chunk)
+    return " ".join(pieces)
+
+def _iter_initial_data_strings(node) -> Iterator[str]:
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            for key, value in current.items():
+                if isinstance(value, str):
+                    if key in _INITIAL_DATA_KEYS and value.strip():
+                        yield value
+                else:
+                    stack.append(value)
+        elif isinstance(current, list):
+            stack.extend(current)
+
+def about_text_initial_data(html: str) -> str:
+    """
+    Visible text plus the text fields of the embedded ytInitialData JSON.
+
+    YouTube renders most About content client-side from ytInitialData, so
+    this finds contacts that are absent from the static markup.
+    """
+    parts = [about_text_fast(html)]
+    match = _INITIAL_DATA_RE.search(html)
+    if match:
+        try:
+            data, _ = json.JSONDecoder().raw_decode(html, match.end())
+        except ValueError:
+            data = None
+        if data is not None:
+            parts.extend(_iter_initial_data_strings(data))
+    return "\n".join(p for p in parts if p)
+
+BACKENDS: Dict[str, Callable[[str], str]] = {
+    "fast": about_text_fast,
+    "initial_data": about_text_initial_data,
+    "soup": about_text_soup,
+}
+
+# Where each backend's input ends, so a streamed download can stop there:
+# visible text ends with </body>; initial_data also needs the ytInitialData
+# script, which YouTube places before the trailing player scripts.
+STOP_MARKERS: Dict[str, Tuple[str, ...]] = {
+    "fast": ("</body>",),
+    "initial_data": ("ytInitialData", "</script>"),
+    "soup": ("</body>",),
+}
+
+def get_about_extractor(name: str) -> Callable[[str], str]:
+    """
+    Return the About-page text extractor for a backend name.
+    Non-soup backends fall back to BeautifulSoup if they fail on a page.
+    """
+    try:
+        backend = BACKENDS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown About extraction backend '{name}'; "
+            f"expected one of: {', '.join(sorted(BACKENDS))}"
+        ) from None
+
+    if backend is about_text_soup:
+        return backend
+
+    def extract(html: str) -> str:
+        try:
+            return backend(html)
+        except Exception:
+            return about_text_soup(html)
+
+    return extract
@@ -0,0 +1,249 @@
+import codecs
+import logging
+import re
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+
+from telemetry.metrics import NULL_METRICS, RunMetrics
+
+if TYPE_CHECKING:
+    import requests
+
+DEFAULT_CHUNK_SIZE = 16 * 1024
+DEFAULT_MAX_PAGE_BYTES = 1024 * 1024
+DEFAULT_INFLIGHT_BYTES = 32 * 1024 * 1024
+# Unread tails up to this size are drained so the connection is reused
+DEFAULT_DRAIN_BELOW = 64 * 1024
+
+class ByteBudget:
+    """
+    Caps the bytes of About pages being downloaded at once, across threads.
+
+    Each page takes a ticket and reserves each chunk's bytes before reading
+    it; when the budget is full, downloads wait until other pages finish,
+    so the bytes in memory never exceed the limit. The oldest
+    open page never waits, so pages holding part of the budget cannot
+    deadlock each other. A limit of 0 disables the cap.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.used = 0
+        self.waits = 0
+        self.wait_seconds = 0.0
+        self._held: Dict[int, int] = {}
+        self._next_ticket = 0
+        self._cond = threading.Condition()
+
+    def open(self) -> int:
+        with self._cond:
+            ticket = self._next_ticket
+            self._next_ticket += 1
+            self._held[ticket] = 0
+            return ticket
+
+    def acquire(self, ticket: int, size: int) -> None:
+        with self._cond:
+            if self.limit and self.used + size > self.limit:
+                started = time.perf_counter()
+                self.waits += 1
+                # dicts keep insertion order, so the first key is the oldest page
+                while self.used + size > self.limit and next(iter(self._held)) != ticket:
+                    self._cond.wait()
+                self.wait_seconds += time.perf_counter() - started
+            self.used += size
+            self._held[ticket] += size
+
+    def release(self, ticket: int, size: int) -> None:
+        """Give back reserved bytes a read did not use (negative: it used more)."""
+        with self._cond:
+            self.used -= size
+            self._held[ticket] -= size
+            self._cond.notify_all()
+
+    def close(self, ticket: int) -> None:
+        with self._cond:
+            self.used -= self._held.pop(ticket, 0)
+            self._cond.notify_all()
+
+class _MarkerScan:
+    """
+    Finds a sequence of markers, in order, across streamed text chunks.
+    A marker split over a chunk boundary is found via a carried-over tail.
+    """
+
+    def __init__(self, markers: Sequence[str]) -> None:
+        self._patterns = [re.compile(re.escape(m), re.IGNORECASE) for m in markers]
+        self._lengths = [len(m) for m in markers]
+        self._next = 0
+        self._carry = ""
+
+    def feed(self, text: str) -> Optional[int]:
+        """Offset in text just past the last marker, once all are found."""
+        window = self._carry + text
+        pos = 0
+        while self._next < len(self._patterns):
+            match = self._patterns[self._next].search(window, pos)
+            if match is None:
+                break
+            pos = match.end()
+            self._next += 1
+        if self._next == len(self._patterns):
+            return max(0, pos - len(self._carry))
+        keep = self._lengths[self._next] - 1
+        self._carry = window[max(pos, len(window) - keep) :]
+        return None
+
+class AboutStreamer:
+    """
+    Downloads About pages in chunks instead of buffering whole responses.
+
+    Each chunk is decoded incrementally and scanned for the backend's stop
+    markers (e.g. the end of <body>); once they have been seen, or the page
+    reaches max_page_bytes, the download stops and the rest of the page is
+    never read or decoded. The bytes downloaded at once across all threads
+    are capped by a shared ByteBudget. Savings are kept for log_stats().
+    """
+
+    # How read_page stopped before the end of a page
+    EARLY_STOP = "early_stop"
+    CAPPED = "capped"
+
+    def __init__(
+        self,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_page_bytes: int = DEFAULT_MAX_PAGE_BYTES,
+        inflight_bytes: int = DEFAULT_INFLIGHT_BYTES,
+        stop_early: bool = True,
+        drain_below: int = DEFAULT_DRAIN_BELOW,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError("About stream chunk size must be at least 1 byte.")
+        self.chunk_size = chunk_size
+        # 0 means no cap
+        self.max_page_bytes = max_page_bytes
+        self.stop_early = stop_early
+        self.drain_below = drain_below
+        self.budget = ByteBudget(inflight_bytes)
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self.pages = 0
+        self.bytes_read = 0
+        # Known from Content-Length; pages without one are not counted
+        self.bytes_skipped = 0
+        self.early_stops = 0
+        self.capped = 0
+        self._lock = threading.Lock()
+
+    def read(
+        self,
+        resp: "requests.Response",
+        stop_markers: Sequence[str] = (),
+        metrics: RunMetrics = NULL_METRICS,
+    ) -> str:
+        """Read a streamed (stream=True) response's text, stopping early if possible."""
+        return self.read_page(resp, stop_markers, metrics)[0]
+
+    def read_page(
+        self,
+        resp: "requests.Response",
+        stop_markers: Sequence[str] = (),
+        metrics: RunMetrics = NULL_METRICS,
+    ) -> Tuple[str, str]:
+        """
+        Like read, but returns (text, how it stopped): "" when the whole
+        page was read, EARLY_STOP after the stop markers, CAPPED at
+        max_page_bytes.
+        """
+        try:
+            decoder = codecs.getincrementaldecoder(resp.encoding or "utf-8")(errors="replace")
+        except LookupError:
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        scan = _MarkerScan(stop_markers) if self.stop_early and stop_markers else None
+        parts: List[str] = []
+        # Bytes off the wire; a capped page keeps only part of its last chunk
+        read = 0
+        stopped = ""
+        ticket = self.budget.open()
+        chunks = resp.iter_content(self.chunk_size)
+        try:
+            while True:
+                # Reserved before the read, so the budget bounds what is in memory
+                self.budget.acquire(ticket, self.chunk_size)
+                chunk = next(chunks, None)
+                if chunk is None:
+                    parts.append(decoder.decode(b"", final=True))
+                    break
+                self.budget.release(ticket, self.chunk_size - len(chunk))
+                read += len(chunk)
+                if self.max_page_bytes and read > self.max_page_bytes:
+                    chunk = chunk[: len(chunk) - (read - self.max_page_bytes)]
+                    stopped = self.CAPPED
+                text = decoder.decode(chunk, final=bool(stopped))
+                cut = scan.feed(text) if scan is not None else None
+                if cut is not None:
+                    parts.append(text[:cut])
+                    stopped = self.EARLY_STOP
+                    break
+                parts.append(text)
+                if stopped:
+                    break
+        finally:
+            self.budget.close(ticket)
+        drained, skipped = self._finish(resp, read) if stopped else (0, 0)
+        read += drained
+
+        metrics.count("bytes", "about", read)
+        if stopped:
+            metrics.count("about_stream", stopped)
+            metrics.count("about_bytes_skipped", "", skipped)
+        with self._lock:
+            self.pages += 1
+            self.bytes_read += read
+            self.bytes_skipped += skipped
+            if stopped == self.EARLY_STOP:
+                self.early_stops += 1
+            elif stopped == self.CAPPED:
+                self.capped += 1
+        return "".join(parts), stopped
+
+    def _finish(self, resp: "requests.Response", read: int) -> Tuple[int, int]:
+        """
+        Deal with the unread rest of a page: a short tail is drained (not
+        decoded) to keep the pooled connection, a long one is abandoned by
+        closing the connection. Returns (bytes drained, bytes skipped).
+        """
+        try:
+            length = int(resp.headers.get("Content-Length", ""))
+        except ValueError:
+            length = -1
+        # With Content-Encoding the length is of the compressed body
+        remaining = (
+            length - read
+            if length >= 0 and not resp.headers.get("Content-Encoding")
+            else -1
+        )
+        if 0 <= remaining <= self.drain_below:
+            drained = sum(len(chunk) for chunk in resp.iter_content(self.chunk_size))
+            return drained, 0
+        resp.close()
+        return 0, max(remaining, 0)
+
+    def log_stats(self) -> None:
+        if not self.pages:
+            return
+        self.logger.info(
+            "About pages: %d streamed, %.1f KB read, %.1f KB never downloaded "
+            "(%d stopped after the data section, %d at the %d KB page cap); "
+            "%d waits (%.2fs) on the %d KB in-flight budget",
+            self.pages,
+            self.bytes_read / 1024,
+            self.bytes_skipped / 1024,
+            self.early_stops,
+            self.capped,
+            self.max_page_bytes // 1024,
+            self.budget.waits,
+            self.budget.wait_seconds,
+            self.budget.limit // 1024,
+        )
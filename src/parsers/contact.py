@@ -0,0 +1,29 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, Tuple
+
+# Exported columns, in output order
+CONTACT_FIELDS: Tuple[str, ...] = (
+    "Channel_url",
+    "Channel_name",
+    "Email",
+    "Domain_email",
+    "Phone",
+    "Description",
+)
+
+@dataclass
+class ChannelContact:
+    Channel_url: str
+    Channel_name: str
+    Email: str
+    Domain_email: str
+    Phone: str
+    Description: str
+    # Provenance: the search keywords that surfaced this channel
+    keywords: Tuple[str, ...] = field(default=(), compare=False)
+
+    def to_dict(self, include_keywords: bool = False) -> Dict[str, Any]:
+        data = {name: getattr(self, name) for name in CONTACT_FIELDS}
+        if include_keywords:
+            data["Keywords"] = "; ".join(self.keywords)
+        return data
@@ -0,0 +1,269 @@
+import logging
+import os
+import socket
+import threading
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from parsers.quota_scheduler import QuotaExhausted
+from parsers.utils_extract import DomainMatcher
+from parsers.youtube_parser import (
+    CHANNELS_BATCH_SIZE,
+    CONTACT_FIELDS,
+    ChannelContact,
+    YouTubeScraper,
+    iter_batches,
+)
+from storage.shard_queue import FAILED, Shard, ShardQueue
+
+# Channel ids per shard: four channels calls' worth
+DEFAULT_SHARD_SIZE = 4 * CHANNELS_BATCH_SIZE
+
+def contact_to_record(contact: ChannelContact) -> dict:
+    record = {name: getattr(contact, name) for name in CONTACT_FIELDS}
+    record["keywords"] = list(contact.keywords)
+    return record
+
+def contact_from_record(record: dict) -> ChannelContact:
+    values = {name: record.get(name) or "" for name in CONTACT_FIELDS}
+    return ChannelContact(**values, keywords=tuple(record.get("keywords") or ()))
+
+class Coordinator:
+    """
+    Coordinator side of a distributed run.
+
+    Runs the job's search (the only part that needs the search quota),
+    splits the channel ids into shards on a ShardQueue, then merges the
+    workers' partial results back in search order, so the merged output
+    matches a single-node run of the same job.
+    """
+
+    def __init__(
+        self,
+        scraper: YouTubeScraper,
+        queue: ShardQueue,
+        shard_size: int = DEFAULT_SHARD_SIZE,
+        poll_interval: float = 2.0,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        if shard_size < 1:
+            raise ValueError("Coordinator shard_size must be at least 1.")
+        self.scraper = scraper
+        self.queue = queue
+        self.shard_size = shard_size
+        self.poll_interval = poll_interval
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        # Filled in while merging
+        self.failed_shards: List[int] = []
+        self.failed_ids: List[str] = []
+
+    def submit(
+        self,
+        job_id: str,
+        keyword_jobs: List[Tuple[str, int]],
+        domain_whitelist: DomainMatcher,
+        multi_keyword: bool,
+        fetch_policy: str = "always",
+    ) -> int:
+        """
+        Search and enqueue the job's shards; returns the shard count.
+        A job that was already fully enqueued is not searched again.
+        """
+        total = self.queue.total_shards(job_id)
+        if total is not None:
+            self.logger.info(
+                "Job %s already has %d shards queued; skipping search.", job_id, total
+            )
+            return total
+
+        self.queue.create_job(
+            job_id, {"domains": list(domain_whitelist), "fetch_policy": fetch_policy}
+        )
+        # Keeps workers waiting for this job's shards while the search runs
+        self.queue.touch_job(job_id)
+        stop = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._heartbeat, args=(job_id, stop), daemon=True
+        )
+        heartbeat.start()
+        try:
+            return self._enqueue(job_id, keyword_jobs, multi_keyword)
+        finally:
+            stop.set()
+            heartbeat.join()
+
+    def _heartbeat(self, job_id: str, stop: threading.Event) -> None:
+        while not stop.wait(self.queue.search_timeout / 3):
+            self.queue.touch_job(job_id)
+
+    def _enqueue(
+        self, job_id: str, keyword_jobs: List[Tuple[str, int]], multi_keyword: bool
+    ) -> int:
+        keywords_by_id: Optional[Dict[str, Tuple[str, ...]]] = None
+        if multi_keyword:
+            keywords_by_id = self.scraper.collect_keyword_candidates(keyword_jobs)
+            channel_ids: Iterable[str] = list(keywords_by_id)
+        else:
+            keyword, max_results = keyword_jobs[0]
+            channel_ids = self.scraper._search_channels(keyword, max_results)
+
+        # Single-keyword shards are enqueued as search pages arrive, so
+        # workers can start before the search is over.
+        total = 0
+        for total, batch in enumerate(iter_batches(channel_ids, self.shard_size), 1):
+            keywords = (
+                {cid: keywords_by_id[cid] for cid in batch}
+                if keywords_by_id is not None
+                else None
+            )
+            self.queue.add_shard(job_id, total - 1, batch, keywords)
+        self.queue.seal(job_id, total)
+        self.logger.info("Job %s: queued %d shards.", job_id, total)
+        return total
+
+    def iter_contacts(self, job_id: str) -> Iterator[ChannelContact]:
+        """Yield the job's contacts in search order as shards complete."""
+        total = self.queue.total_shards(job_id)
+        for result in self.queue.iter_job_results(job_id, self.poll_interval):
+            if result.state == FAILED:
+                self.failed_shards.append(result.seq)
+                self.logger.warning(
+                    "Shard %d of job %s failed and is missing from the output: %s",
+                    result.seq,
+                    job_id,
+                    result.error,
+                )
+                continue
+            self.failed_ids.extend(result.failed_ids)
+            for record in result.contacts:
+                yield contact_from_record(record)
+            self.logger.info(
+                "Merged shard %d/%s of job %s (%d contacts).",
+                result.seq + 1,
+                total if total is not None else "?",
+                job_id,
+                len(result.contacts),
+            )
+
+class ShardWorker:
+    """
+    Worker side of a distributed run.
+
+    Claims shards from the queue, fetches their channel details and About
+    pages with its own scraper, and stores the contacts as the shard's
+    result. A background heartbeat renews the lease while a shard is being
+    worked on; if this process dies, the lease runs out and the shard goes
+    back to the queue for another worker.
+    """
+
+    def __init__(
+        self,
+        scraper: YouTubeScraper,
+        queue: ShardQueue,
+        worker_id: Optional[str] = None,
+        poll_interval: float = 2.0,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        self.scraper = scraper
+        self.queue = queue
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.poll_interval = poll_interval
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self.shards_done = 0
+        self.contacts = 0
+        self._matchers: Dict[str, DomainMatcher] = {}
+        # For jobs queued without a fetch policy of their own
+        self._fetch_policy = scraper.fetch_policy
+
+    def run(self, job_id: Optional[str] = None, wait: bool = False) -> int:
+        """
+        Work until no shard is pending, leased or still to come (or, with
+        wait, forever). Limit to job_id if given. Returns shards completed.
+        Raises QuotaExhausted, after handing the current shard back.
+        """
+        self.logger.info("Worker %s polling %s", self.worker_id, self.queue.path)
+        while True:
+            shard = self.queue.claim(self.worker_id, job_id)
+            if shard is None:
+                if not wait and not self.queue.has_open_work(job_id):
+                    break
+                time.sleep(self.poll_interval)
+                continue
+            self.process(shard)
+        self.logger.info(
+            "Worker %s finished: %d shards, %d contacts.",
+            self.worker_id,
+            self.shards_done,
+            self.contacts,
+        )
+        return self.shards_done
+
+    def _heartbeat(self, shard: Shard, stop: threading.Event) -> None:
+        interval = self.queue.lease_seconds / 3
+        while not stop.wait(interval):
+            if not self.queue.renew(shard, self.worker_id):
+                self.logger.warning(
+                    "Lost the lease on shard %s/%d; another worker may redo it.",
+                    shard.job_id,
+                    shard.seq,
+                )
+                return
+
+    def process(self, shard: Shard) -> None:
+        self.logger.info(
+            "Working on shard %s/%d (%d channels, attempt %d).",
+            shard.job_id,
+            shard.seq,
+            len(shard.channel_ids),
+            shard.attempts,
+        )
+        matcher = self._matchers.get(shard.job_id)
+        if matcher is None:
+            matcher = DomainMatcher(shard.params.get("domains") or [])
+            self._matchers[shard.job_id] = matcher
+        # Shards are worked one at a time, so the job's policy can be set here
+        self.scraper.fetch_policy = shard.params.get("fetch_policy") or self._fetch_policy
+
+        stop = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._heartbeat, args=(shard, stop), name="shard-lease", daemon=True
+        )
+        heartbeat.start()
+        failed_before = len(self.scraper.failed_batches)
+        try:
+            records = [
+                contact_to_record(contact)
+                for contact in self.scraper.iter_channel_contacts(
+                    shard.channel_ids, matcher, shard.keywords
+                )
+            ]
+        except (QuotaExhausted, KeyboardInterrupt) as exc:
+            # Not the shard's fault: hand it back without using up an attempt
+            self.queue.release(
+                shard, self.worker_id, f"{type(exc).__name__}: {exc}", count_attempt=False
+            )
+            raise
+        except Exception as exc:
+            self.logger.warning(
+                "Shard %s/%d failed: %s", shard.job_id, shard.seq, exc
+            )
+            self.queue.release(shard, self.worker_id, f"{type(exc).__name__}: {exc}")
+            return
+        finally:
+            stop.set()
+            heartbeat.join()
+
+        failed_ids = [
+            channel_id
+            for batch in self.scraper.failed_batches[failed_before:]
+            for channel_id in batch
+        ]
+        if self.queue.complete(shard, self.worker_id, records, failed_ids):
+            self.shards_done += 1
+            self.contacts += len(records)
+        else:
+            self.logger.info(
+                "Shard %s/%d was already completed by another worker.",
+                shard.job_id,
+                shard.seq,
+            )
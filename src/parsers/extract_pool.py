@@ -0,0 +1,40 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+from parsers.about_extract import get_about_extractor
+from parsers.utils_extract import scan_contacts
+
+# (about_text or None, emails, phones)
+PageResult = Tuple[Optional[str], List[str], List[str]]
+
+# One extractor per backend per worker process
+_EXTRACTORS: Dict[str, Callable[[str], str]] = {}
+
+def extract_page(
+    html: str,
+    description: str,
+    about_backend: str = "fast",
+    want_text: bool = False,
+) -> PageResult:
+    """
+    Parse an About page and scan it, together with the channel description,
+    for emails and phones. Runs in a worker process, so it must stay a
+    module-level function. The About text itself is only sent back when
+    want_text is set (the channel index stores it); otherwise the result
+    is just the two short contact lists.
+    """
+    extractor = _EXTRACTORS.get(about_backend)
+    if extractor is None:
+        extractor = _EXTRACTORS[about_backend] = get_about_extractor(about_backend)
+    about_text = extractor(html)
+    emails, phones = scan_contacts(description + "\n" + about_text)
+    return (about_text if want_text else None), emails, phones
+
+def create_extract_pool(workers: int) -> ProcessPoolExecutor:
+    # spawn, not fork: the scraper forks from a process full of live threads
+    # (I/O workers, connection pools), which fork does not copy safely.
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
@@ -0,0 +1,234 @@
+import json
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Optional, TypeVar
+
+import requests
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process lock on the usage file
+    fcntl = None  # type: ignore[assignment]
+
+T = TypeVar("T")
+
+# YouTube Data API v3 quota cost per call
+ENDPOINT_COSTS: Dict[str, int] = {
+    "search": 100,
+    "channels": 1,
+}
+
+# Error reasons that mean the quota is gone for the day; retrying won't help
+DAILY_QUOTA_REASONS = {"quotaExceeded", "dailyLimitExceeded"}
+# 403 reasons that are transient and worth retrying after a pause
+RATE_LIMIT_REASONS = {"rateLimitExceeded", "userRateLimitExceeded"}
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+class QuotaExhausted(Exception):
+    """
+    Raised when a Data API call would exceed the daily budget, or the API
+    reports that the quota is used up. Deliberately not a RequestException,
+    so per-request error handling cannot swallow it.
+    """
+
+def _quota_day() -> str:
+    # The Data API quota resets at midnight Pacific time
+    try:
+        from zoneinfo import ZoneInfo
+
+        now = datetime.now(ZoneInfo("America/Los_Angeles"))
+    except Exception:
+        now = datetime.now(timezone(timedelta(hours=-8)))
+    return now.strftime("%Y-%m-%d")
+
+def _error_reason(resp: requests.Response) -> str:
+    try:
+        errors = resp.json().get("error", {}).get("errors") or []
+    except ValueError:
+        return ""
+    return errors[0].get("reason", "") if errors else ""
+
+class QuotaScheduler:
+    """
+    Gatekeeper for YouTube Data API calls.
+
+    Charges each call its endpoint's unit cost against a daily budget
+    (persisted to state_path so consecutive runs share it), paces calls with
+    a token bucket, and retries transient failures (429, 5xx, connection
+    errors) with jittered exponential backoff. When the budget runs out it
+    raises QuotaExhausted instead of letting calls fail one by one.
+
+    Processes on one host may share state_path (distributed workers, the
+    job service, overlapping CLI runs): each charge re-reads the usage and
+    writes it back under an exclusive flock on <state_path>.lock, so no
+    process overwrites another's count. Without fcntl (Windows) the file
+    is safe for one process at a time only.
+    """
+
+    def __init__(
+        self,
+        daily_budget: int = 10_000,
+        requests_per_second: float = 5.0,
+        burst: int = 10,
+        max_retries: int = 4,
+        backoff_base: float = 1.0,
+        backoff_max: float = 30.0,
+        state_path: Optional[Path] = None,
+        costs: Optional[Dict[str, int]] = None,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        self.daily_budget = daily_budget
+        self.rate = requests_per_second
+        self.burst = max(burst, 1)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.state_path = state_path
+        self.costs = dict(ENDPOINT_COSTS)
+        self.costs.update(costs or {})
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+
+        self.used_this_run = 0
+        self.retries = 0
+        self.exhausted = False
+        self._tokens = float(self.burst)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+        self._day = _quota_day()
+        self._used_today = self._load_usage()
+
+    def handles(self, endpoint: str) -> bool:
+        return endpoint in self.costs
+
+    @property
+    def remaining(self) -> int:
+        return max(self.daily_budget - self._used_today, 0)
+
+    def _load_usage(self) -> int:
+        if self.state_path is None or not self.state_path.exists():
+            return 0
+        try:
+            state = json.loads(self.state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return 0
+        return int(state.get("used", 0)) if state.get("day") == self._day else 0
+
+    @contextmanager
+    def _usage_lock(self) -> Iterator[None]:
+        """Hold the cross-process lock on the usage file, where there is one."""
+        if self.state_path is None or fcntl is None:
+            yield
+            return
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        with self.state_path.with_name(self.state_path.name + ".lock").open("a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _save_usage(self) -> None:
+        if self.state_path is None:
+            return
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.state_path.with_suffix(".tmp")
+        tmp.write_text(
+            json.dumps({"day": self._day, "used": self._used_today}), encoding="utf-8"
+        )
+        tmp.replace(self.state_path)
+
+    def _charge(self, endpoint: str) -> None:
+        cost = self.costs[endpoint]
+        with self._lock, self._usage_lock():
+            today = _quota_day()
+            if today != self._day:
+                self._day, self._used_today = today, 0
+                self.exhausted = False
+            if self.state_path is not None:
+                # Other processes sharing the file may have charged since
+                self._used_today = self._load_usage()
+            if self.exhausted or self._used_today + cost > self.daily_budget:
+                self.exhausted = True
+                raise QuotaExhausted(
+                    f"Daily quota budget of {self.daily_budget} units reached "
+                    f"({self._used_today} used); '{endpoint}' costs {cost}."
+                )
+            self._used_today += cost
+            self.used_this_run += cost
+            self._save_usage()
+
+    def _wait_for_token(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._last_refill) * self.rate
+                )
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def _backoff(self, attempt: int) -> float:
+        # "Full jitter": spreads retries from concurrent workers apart
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def call(self, endpoint: str, fn: Callable[[], T]) -> T:
+        """
+        Run fn (one HTTP call to endpoint) under budget, pacing and retry.
+        Non-retryable errors are re-raised unchanged.
+        """
+        attempt = 0
+        while True:
+            self._charge(endpoint)
+            if self.rate > 0:
+                self._wait_for_token()
+            try:
+                return fn()
+            except requests.HTTPError as exc:
+                resp = exc.response
+                status = resp.status_code if resp is not None else 0
+                reason = _error_reason(resp) if resp is not None else ""
+                if reason in DAILY_QUOTA_REASONS:
+                    with self._lock:
+                        self.exhausted = True
+                    raise QuotaExhausted(
+                        f"YouTube reported the quota as exhausted: {exc}"
+                    ) from exc
+                if status not in RETRY_STATUSES and reason not in RATE_LIMIT_REASONS:
+                    raise
+                error: Exception = exc
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                error = exc
+
+            if attempt >= self.max_retries:
+                raise error
+            delay = self._backoff(attempt)
+            attempt += 1
+            with self._lock:
+                self.retries += 1
+            self.logger.warning(
+                "%s request failed (%s); retry %d/%d in %.1fs",
+                endpoint,
+                error,
+                attempt,
+                self.max_retries,
+                delay,
+            )
+            time.sleep(delay)
+
+    def log_stats(self) -> None:
+        self.logger.info(
+            "Quota: %d units used this run, %d of %d left today, %d retries",
+            self.used_this_run,
+            self.remaining,
+            self.daily_budget,
+            self.retries,
+        )
@@ -0,0 +1,368 @@
+import hashlib
+import logging
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import requests
+
+from outputs.contact_table import ContactTable
+from parsers.contact import CONTACT_FIELDS, ChannelContact
+from parsers.quota_scheduler import QuotaExhausted
+from parsers.utils_extract import DomainMatcher
+from parsers.youtube_parser import CHANNELS_BATCH_SIZE, YouTubeScraper
+from storage.refresh_state import ChannelState, RefreshState
+
+# Per-channel outcomes in the change report
+UNCHANGED = "unchanged"
+UPDATED = "updated"
+# No longer returned by the channels endpoint; dropped from the dataset
+REMOVED = "removed"
+# Re-extracted, but no longer passes the domain whitelist; dropped
+FILTERED = "filtered"
+# Could not be checked (failed request, quota, no channel id); kept as it was
+UNCHECKED = "unchecked"
+
+_CHANNEL_ID = re.compile(r"UC[\w-]{22}")
+_CHANNEL_URL_ID = re.compile(r"/channel/(UC[\w-]{22})(?![\w-])")
+
+def channel_id_from_url(url: str) -> str:
+    """
+    Channel id from an exported Channel_url or a bare id, or "" when there
+    is none (a handle or custom URL). Rows without an id are never looked
+    up, so a URL this cannot parse can only leave its row unchecked.
+    """
+    value = url.strip()
+    if _CHANNEL_ID.fullmatch(value):
+        return value
+    match = _CHANNEL_URL_ID.search(value)
+    return match.group(1) if match else ""
+
+def snippet_hash(title: str, description: str) -> str:
+    """Hash of the snippet fields contacts come from, as the exports store them."""
+    text = f"{title.strip()}\0{description.strip()}"
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+def load_dataset(path: Path) -> ContactTable:
+    """
+    Load the dataset to refresh: an export (json, jsonl, csv or sqlite) or
+    a .txt file of channel ids or URLs, one per line.
+    """
+    if path.suffix.lower() != ".txt":
+        return ContactTable.load(path)
+    table = ContactTable()
+    with path.open("r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                table.append_row({"Channel_url": line})
+    return table
+
+@dataclass
+class RefreshStats:
+    channels: int = 0
+    channel_calls: int = 0
+    # How each channel was judged unchanged or changed
+    etag_matches: int = 0
+    snippet_matches: int = 0
+    snippet_changes: int = 0
+    # Unchanged channels whose About page was due for revalidation
+    about_revalidations: int = 0
+    about_fetches: int = 0
+    about_not_modified: int = 0
+    about_errors: int = 0
+    outcomes: Dict[str, int] = field(
+        default_factory=lambda: dict.fromkeys(
+            (UNCHANGED, UPDATED, REMOVED, FILTERED, UNCHECKED), 0
+        )
+    )
+
+    @property
+    def about_fetches_avoided(self) -> int:
+        """About downloads a full re-scrape would have made and this run did not."""
+        return self.channels - self.about_fetches
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "channels": self.channels,
+            "channel_calls": self.channel_calls,
+            "etag_matches": self.etag_matches,
+            "snippet_matches": self.snippet_matches,
+            "snippet_changes": self.snippet_changes,
+            "about_revalidations": self.about_revalidations,
+            "about_fetches": self.about_fetches,
+            "about_not_modified": self.about_not_modified,
+            "about_errors": self.about_errors,
+            "about_fetches_avoided": self.about_fetches_avoided,
+            "outcomes": dict(self.outcomes),
+        }
+
+@dataclass
+class _Check:
+    """One dataset row's channels-call result and what to do about it."""
+
+    previous: ChannelContact
+    channel_id: str
+    detail: Optional[dict] = None
+    state: Optional[ChannelState] = None
+    fetch_about: bool = False
+    # Set by _revalidate: "fetched", "not_modified", or "" if it failed
+    about_status: str = ""
+    about_text: Optional[str] = None
+    scanned: Optional[Tuple[List[str], List[str]]] = None
+
+class DatasetRefresher:
+    """
+    Incremental refresh of an existing contact dataset.
+
+    Channel ids go back through the channels endpoint in 50-id batches
+    (one quota unit each, versus 100 per search call). A channel whose
+    title and description still hash the same as the dataset row is kept
+    as it was with no About fetch; when its item etag matches the one
+    stored by the last refresh, the stored hash stands in for the current
+    snippet, but is still compared with the row, since the dataset may be
+    older than the refresh state. Only
+    changed channels, and those whose About page is older than
+    about_max_age, get their About page fetched and re-extracted, and that
+    fetch is conditional (If-None-Match / If-Modified-Since) whenever the
+    page's validators are known. Rows without a /channel/UC... id cannot
+    be looked up and are kept unchecked.
+    """
+
+    def __init__(
+        self,
+        scraper: YouTubeScraper,
+        state: RefreshState,
+        about_max_age_seconds: float = 30 * 86400,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        self.scraper = scraper
+        self.state = state
+        self.about_max_age_seconds = about_max_age_seconds
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self.stats = RefreshStats()
+        # Every channel that did not come out unchanged, for the report
+        self.changes: List[Dict[str, Any]] = []
+        # Set when the quota ran out; the remaining rows are kept unchecked
+        self.quota_error: Optional[QuotaExhausted] = None
+
+    def refresh(
+        self,
+        table: ContactTable,
+        domain_whitelist: Optional[Iterable[str]] = None,
+    ) -> Iterator[ChannelContact]:
+        """
+        Yield the refreshed dataset in the table's order: unchanged rows as
+        they were, changed ones re-extracted, removed and filtered ones left
+        out. Rows that could not be checked are yielded unchanged.
+        """
+        domain_whitelist = DomainMatcher.coerce(domain_whitelist)
+        pool = (
+            ThreadPoolExecutor(max_workers=self.scraper.concurrency)
+            if self.scraper.concurrency > 1
+            else None
+        )
+        try:
+            with self.scraper._extraction_pool():
+                for start in range(0, len(table), CHANNELS_BATCH_SIZE):
+                    end = min(start + CHANNELS_BATCH_SIZE, len(table))
+                    previous = [table.contact(i) for i in range(start, end)]
+                    if self.quota_error is None:
+                        try:
+                            results = self._refresh_batch(previous, domain_whitelist, pool)
+                        except QuotaExhausted as exc:
+                            self.quota_error = exc
+                            self.logger.error(
+                                "Stopping refresh: %s. The remaining %d rows are "
+                                "kept unchecked.",
+                                exc,
+                                len(table) - start,
+                            )
+                    if self.quota_error is not None:
+                        results = [(contact, UNCHECKED) for contact in previous]
+                    for contact, outcome in results:
+                        self.stats.outcomes[outcome] += 1
+                        if outcome not in (REMOVED, FILTERED):
+                            yield contact
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True, cancel_futures=True)
+
+    def _refresh_batch(
+        self,
+        previous: List[ChannelContact],
+        domain_whitelist: Optional[DomainMatcher],
+        pool: Optional[ThreadPoolExecutor],
+    ) -> List[Tuple[ChannelContact, str]]:
+        checks = [
+            _Check(contact, channel_id_from_url(contact.Channel_url))
+            for contact in previous
+        ]
+        ids = list(dict.fromkeys(check.channel_id for check in checks if check.channel_id))
+        failed_before = len(self.scraper.failed_batches)
+        details = self.scraper._fetch_channel_batch(ids) if ids else []
+        if ids:
+            self.stats.channel_calls += 1
+        self.stats.channels += len(checks)
+        if len(self.scraper.failed_batches) > failed_before:
+            return [self._note(check, UNCHECKED) for check in checks]
+
+        by_id = {detail.get("id"): detail for detail in details}
+        known = self.state.get_many(by_id)
+        now = time.time()
+        for check in checks:
+            check.detail = by_id.get(check.channel_id)
+            if check.detail is not None:
+                self._plan(check, known.get(check.channel_id), now)
+
+        to_fetch = [check for check in checks if check.fetch_about]
+        if pool is not None and len(to_fetch) > 1:
+            list(pool.map(lambda c: self._revalidate(c, now), to_fetch))
+        else:
+            for check in to_fetch:
+                self._revalidate(check, now)
+
+        results: List[Tuple[ChannelContact, str]] = []
+        states: List[ChannelState] = []
+        about_texts: Dict[str, str] = {}
+        for check in checks:
+            if check.detail is None:
+                results.append(self._note(check, REMOVED if check.channel_id else UNCHECKED))
+                continue
+            if not check.fetch_about:
+                states.append(check.state)
+                results.append(self._note(check, UNCHANGED))
+                continue
+            if not check.about_status:
+                # About fetch failed: keep the row, and no new state so the
+                # next refresh tries again
+                self.stats.about_errors += 1
+                results.append(self._note(check, UNCHECKED))
+                continue
+            states.append(check.state)
+            if check.about_status == "not_modified":
+                self.stats.about_not_modified += 1
+            else:
+                self.stats.about_fetches += 1
+                if check.about_text is not None:
+                    about_texts[check.channel_id] = check.about_text
+            contact = self.scraper.build_contact(
+                check.detail, check.about_text, domain_whitelist, check.scanned
+            )
+            if contact is None:
+                results.append(self._note(check, FILTERED))
+                continue
+            contact.keywords = check.previous.keywords
+            changed = [
+                name
+                for name in CONTACT_FIELDS
+                if getattr(contact, name) != getattr(check.previous, name)
+            ]
+            results.append(self._note(check, UPDATED if changed else UNCHANGED, contact, changed))
+
+        self.state.save(states, about_texts)
+        return results
+
+    def _plan(self, check: _Check, known: Optional[ChannelState], now: float) -> None:
+        """Decide from the channels item whether the row needs its About page."""
+        detail = check.detail or {}
+        etag = detail.get("etag", "")
+        etag_match = known is not None and bool(etag) and etag == known.etag
+        if etag_match:
+            # The snippet is the one the last refresh hashed
+            digest = known.snippet_hash
+        else:
+            snippet = detail.get("snippet") or {}
+            digest = snippet_hash(snippet.get("title", ""), snippet.get("description", ""))
+        # Always against the row itself: a dataset older than the refresh
+        # state must not be kept just because the channel has not changed
+        changed = digest != snippet_hash(
+            check.previous.Channel_name, check.previous.Description
+        )
+        if changed:
+            self.stats.snippet_changes += 1
+        elif etag_match:
+            self.stats.etag_matches += 1
+        else:
+            self.stats.snippet_matches += 1
+
+        stale = (
+            known is not None
+            and now - (known.about_checked_at or known.created_at) > self.about_max_age_seconds
+        )
+        if stale and not changed:
+            self.stats.about_revalidations += 1
+        check.fetch_about = changed or stale
+        check.state = ChannelState(
+            channel_id=check.channel_id,
+            etag=etag,
+            snippet_hash=digest,
+            about_etag=known.about_etag if known is not None else "",
+            about_last_modified=known.about_last_modified if known is not None else "",
+            about_checked_at=known.about_checked_at if known is not None else None,
+            created_at=known.created_at if known is not None else now,
+            checked_at=now,
+        )
+
+    def _revalidate(self, check: _Check, now: float) -> None:
+        """
+        Conditionally re-fetch one About page (on a pool thread) and leave
+        the outcome on the check.
+        """
+        state = check.state
+        detail = check.detail or {}
+        stored_text: Optional[str] = None
+        if state.about_etag or state.about_last_modified:
+            stored_text = self.state.about_text(check.channel_id)
+        try:
+            html, etag, last_modified = self.scraper.fetch_about_if_changed(
+                self.scraper._build_channel_url(detail),
+                # Validators are only worth sending if the text is there to reuse
+                etag=state.about_etag if stored_text is not None else "",
+                last_modified=state.about_last_modified if stored_text is not None else "",
+            )
+        except requests.RequestException as exc:
+            self.logger.info(
+                "Failed to revalidate about page for %s: %s", check.channel_id, exc
+            )
+            return
+
+        state.about_etag = etag
+        state.about_last_modified = last_modified
+        state.about_checked_at = now
+        if html is None:
+            check.about_status = "not_modified"
+            check.about_text = stored_text
+            return
+        snippet = detail.get("snippet") or {}
+        check.about_text, check.scanned = self.scraper.parse_about(
+            html, snippet.get("description", "").strip()
+        )
+        check.about_status = "fetched"
+
+    def _note(
+        self,
+        check: _Check,
+        outcome: str,
+        contact: Optional[ChannelContact] = None,
+        changed: Iterable[str] = (),
+    ) -> Tuple[ChannelContact, str]:
+        if outcome != UNCHANGED:
+            entry: Dict[str, Any] = {
+                "channel_id": check.channel_id,
+                "channel_url": check.previous.Channel_url,
+                "outcome": outcome,
+            }
+            if contact is not None:
+                entry["changes"] = {
+                    name: {"old": getattr(check.previous, name), "new": getattr(contact, name)}
+                    for name in changed
+                }
+            self.changes.append(entry)
+        return (contact if contact is not None else check.previous), outcome
+
+    def report(self) -> Dict[str, Any]:
+        return {"summary": self.stats.to_dict(), "changes": self.changes}
@@ -1,5 +1,8 @@
+import logging
 import re
-from typing import Iterable, List, Optional, Tuple
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from parsers.contact import ChannelContact
 
 EMAIL_REGEX = re.compile(
     r"""
@@ -22,14 +25,14 @@ PHONE_REGEX = re.compile(
     re.VERBOSE,
 )
 
-def extract_emails(text: str) -> List[str]:
-    if not text:
-        return []
-    emails = EMAIL_REGEX.findall(text)
+# Cheap pre-filter: PHONE_REGEX needs at least one run of three digits
+_PHONE_HINT = re.compile(r"\d{3}")
+
+def _unique_emails(matches: Iterable[str]) -> List[str]:
     # Normalize and deduplicate while preserving order
     seen = set()
     result = []
-    for email in emails:
+    for email in matches:
         e = email.strip()
         if not e:
             continue
@@ -38,15 +41,16 @@ def extract_emails(text: str) -> List[str]:
             result.append(e)
     return result
 
-def extract_phones(text: str) -> List[str]:
-    if not text:
-        return []
-    phones = PHONE_REGEX.findall(text)
+def _clean_phones(matches: Iterable[str]) -> List[str]:
     cleaned: List[str] = []
     seen = set()
-    for phone in phones:
-        p = re.sub(r"\s+", " ", phone).strip()
-        if len(re.sub(r"\D", "", p)) < 7:
+    for phone in matches:
+        # Same as re.sub(r"\s+", " ", phone).strip(), without a regex call
+        p = " ".join(phone.split())
+        # Matches contain only digits, whitespace and "+-()", so subtracting
+        # the separators counts the digits without another re.sub
+        digits = len(p) - sum(p.count(ch) for ch in " -+()")
+        if digits < 7:
             # Reject obviously too-short numbers
             continue
         if p not in seen:
@@ -54,37 +58,181 @@ def extract_phones(text: str) -> List[str]:
             cleaned.append(p)
     return cleaned
 
+def extract_emails(text: str) -> List[str]:
+    if not text or "@" not in text:
+        return []
+    return _unique_emails(EMAIL_REGEX.findall(text))
+
+def extract_phones(text: str) -> List[str]:
+    if not text or not _PHONE_HINT.search(text):
+        return []
+    return _clean_phones(PHONE_REGEX.findall(text))
+
+def scan_contacts(text: str) -> Tuple[List[str], List[str]]:
+    """
+    Find (emails, phones), identical to calling extract_emails and
+    extract_phones separately. This is not a single-pass scanner: it is
+    the two scans behind cheap pre-filters.
+
+    Blobs without an '@' skip the email regex, and blobs without a
+    three-digit run skip the phone regex. A blob that passes both filters
+    is scanned twice, once per regex, because each regex's non-overlapping
+    matches depend on where its own previous match ended, and an email's
+    local part can also hold a phone number.
+    """
+    if not text:
+        return [], []
+    return extract_emails(text), extract_phones(text)
+
+class DomainMatcher:
+    """
+    Compiled domain whitelist with O(1) lookups regardless of its size.
+
+    Keeps the original suffix semantics (a domain matches an entry when it
+    equals it or ends with it) by probing a hash set with the domain's
+    suffixes, one probe per distinct entry length.
+    """
+
+    def __init__(self, domains: Iterable[str]) -> None:
+        self.domains: List[str] = list(dict.fromkeys(d.lower() for d in domains))
+        self._suffixes = set(self.domains)
+        self._lengths = sorted({len(d) for d in self.domains})
+
+    @classmethod
+    def coerce(cls, domains: Optional[Iterable[str]]) -> Optional["DomainMatcher"]:
+        if domains is None or isinstance(domains, cls):
+            return domains
+        return cls(domains)
+
+    def matches(self, domain: str) -> bool:
+        size = len(domain)
+        for length in self._lengths:
+            if length > size:
+                break
+            if domain[size - length :] in self._suffixes:
+                return True
+        return False
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.domains)
+
+    def __len__(self) -> int:
+        return len(self.domains)
+
+    def __repr__(self) -> str:
+        if len(self.domains) <= 10:
+            return repr(self.domains)
+        return f"<{len(self.domains)} domains>"
+
 def choose_best_email_for_domains(
     emails: Iterable[str],
-    domain_whitelist: Optional[List[str]] = None,
+    domain_whitelist: Optional[Iterable[str]] = None,
 ) -> Tuple[Optional[str], Optional[str]]:
     """
     Pick the email that best matches a domain whitelist.
     Returns (email, '@domain') or (None, None) if nothing matches.
 
     If whitelist is empty or None, attempts to return the first found email
-    and its domain.
+    and its domain. Pass a DomainMatcher to avoid recompiling the whitelist
+    on every call.
     """
     emails = list(emails)
     if not emails:
         return None, None
 
-    if not domain_whitelist:
+    matcher = DomainMatcher.coerce(domain_whitelist)
+    if not matcher:
         email = emails[0]
         domain = extract_domain(email)
         return email, domain
 
-    normalized_whitelist = [d.lower() for d in domain_whitelist]
-
     for email in emails:
         domain = extract_domain(email)
         if not domain:
             continue
-        if any(domain == d or domain.endswith(d) for d in normalized_whitelist):
+        if matcher.matches(domain):
             return email, domain
 
     return None, None
 
+# Phrases that usually point to contact details, often on the About page
+_CONTACT_HINTS = re.compile(
+    r"business\s+(?:inquir|enquir)|for business|contact|e-?mail|booking|sponsor",
+    re.IGNORECASE,
+)
+
+def contact_promise(
+    description: str,
+    domain_whitelist: Optional[Iterable[str]] = None,
+) -> int:
+    """
+    Rough odds that a channel yields a contact, judged from its description
+    alone: 3 if it has an email that passes the whitelist, 2 for any other
+    email, 1 for a phrase like "business inquiries", otherwise 0.
+    """
+    if not description:
+        return 0
+    emails = extract_emails(description)
+    if emails:
+        primary_email, _ = choose_best_email_for_domains(emails, domain_whitelist)
+        return 3 if primary_email is not None else 2
+    return 1 if _CONTACT_HINTS.search(description) else 0
+
+def contact_from_scan(
+    channel_data: dict,
+    channel_url: str,
+    emails: List[str],
+    phones: List[str],
+    domain_whitelist: Optional[Iterable[str]] = None,
+    logger: Optional[logging.Logger] = None,
+) -> Optional[ChannelContact]:
+    """
+    Build a channel's contact from the emails and phones found in its
+    description and About text, applying the domain whitelist. Returns
+    None if the channel is filtered out. Shared by live scraping and
+    `reprocess`, so both apply the same rules.
+    """
+    logger = logger or logging.getLogger(__name__)
+    snippet = channel_data.get("snippet") or {}
+    channel_name = snippet.get("title", "").strip()
+    description = snippet.get("description", "").strip()
+
+    primary_email, primary_domain = choose_best_email_for_domains(
+        emails, domain_whitelist
+    )
+
+    if domain_whitelist and not primary_email:
+        # Skip channels that do not match the whitelist at all
+        logger.debug(
+            "Channel %s filtered out: no email matching domains %s",
+            channel_name,
+            domain_whitelist,
+        )
+        return None
+
+    email_str = primary_email or (emails[0] if emails else "")
+    domain_str = primary_domain or ""
+
+    phone_str = phones[0] if phones else ""
+
+    if not (email_str or phone_str):
+        # No contact info found; keep if whitelist is empty but skip otherwise
+        if domain_whitelist:
+            logger.debug(
+                "Channel %s has no contact info; skipping due to whitelist.",
+                channel_name,
+            )
+            return None
+
+    return ChannelContact(
+        Channel_url=channel_url,
+        Channel_name=channel_name,
+        Email=email_str,
+        Domain_email=domain_str,
+        Phone=phone_str,
+        Description=description,
+    )
+
 def extract_domain(email: str) -> Optional[str]:
     if "@" not in email:
         return None
@@ -0,0 +1,231 @@
+import asyncio
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Iterable, Iterator, List, Optional
+
+import requests
+
+from parsers.utils_extract import DomainMatcher
+from parsers.youtube_parser import (
+    CHANNELS_BATCH_SIZE,
+    ChannelContact,
+    YouTubeScraper,
+)
+
+# Contacts iter_contacts buffers ahead of its consumer before the pipeline
+# pauses; two detail batches' worth
+RESULT_BUFFER = 2 * CHANNELS_BATCH_SIZE
+# Detail batches dispatched but not yet emitted before search pauses
+PENDING_BATCHES = 4
+
+class AsyncYouTubeScraper(YouTubeScraper):
+    """
+    Pipelined variant of YouTubeScraper with the same scrape_contacts contract.
+
+    Search pages, channel-detail batches and About pages overlap: each full
+    50-id batch goes to the channels endpoint as soon as search yields it,
+    and About fetches for a batch start as soon as its details arrive.
+    Blocking requests calls run on a thread pool; asyncio semaphores bound
+    how many detail batches and About pages are in flight.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        logger: Optional[logging.Logger] = None,
+        session: Optional[requests.Session] = None,
+        concurrency: int = 8,
+        detail_concurrency: int = 2,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(
+            api_key=api_key,
+            logger=logger,
+            session=session,
+            concurrency=concurrency,
+            **kwargs,
+        )
+        if detail_concurrency < 1:
+            raise ValueError(
+                "AsyncYouTubeScraper detail_concurrency must be at least 1."
+            )
+        self.detail_concurrency = detail_concurrency
+        # About workers + detail workers + the search pager
+        self._max_threads = concurrency + detail_concurrency + 1
+        self._size_connection_pool(self._max_threads)
+
+    def scrape_contacts(
+        self,
+        keyword: str,
+        max_results: int = 50,
+        domain_whitelist: Optional[Iterable[str]] = None,
+    ) -> List[ChannelContact]:
+        contacts: List[ChannelContact] = []
+        asyncio.run(
+            self._run_pipeline(
+                keyword, max_results, domain_whitelist, contacts.append
+            )
+        )
+        return contacts
+
+    def iter_contacts(
+        self,
+        keyword: str,
+        max_results: int = 50,
+        domain_whitelist: Optional[Iterable[str]] = None,
+    ) -> Iterator[ChannelContact]:
+        """
+        Yield contacts in scrape_contacts order while the pipeline runs on a
+        background event loop. At most RESULT_BUFFER contacts wait for the
+        consumer; beyond that emission waits on a helper thread, so the
+        event loop keeps running, and search pauses once PENDING_BATCHES
+        batches are waiting to be emitted.
+        Closing the generator stops further searching, cancels the batches
+        not yet emitted and waits for the pipeline thread to finish.
+        """
+        results: "queue.Queue" = queue.Queue(maxsize=RESULT_BUFFER)
+        stop = threading.Event()
+        done = object()
+        errors: List[BaseException] = []
+
+        def put(item: object) -> None:
+            # Blocks while the buffer is full, gives up once the consumer left
+            while not stop.is_set():
+                try:
+                    results.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        async def emit(contact: ChannelContact) -> None:
+            # Never block the event loop on a slow consumer
+            await asyncio.get_running_loop().run_in_executor(None, put, contact)
+
+        def run() -> None:
+            try:
+                asyncio.run(
+                    self._run_pipeline(
+                        keyword, max_results, domain_whitelist, emit, stop
+                    )
+                )
+            except BaseException as exc:  # surfaced in the consumer thread
+                errors.append(exc)
+            finally:
+                put(done)
+
+        thread = threading.Thread(target=run, name="async-scraper", daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = results.get()
+                if item is done:
+                    break
+                yield item
+        finally:
+            stop.set()
+            thread.join()
+        if errors:
+            raise errors[0]
+
+    async def _run_pipeline(
+        self,
+        keyword: str,
+        max_results: int,
+        domain_whitelist: Optional[Iterable[str]],
+        emit: Callable[[ChannelContact], Optional[Awaitable[None]]],
+        stop: Optional[threading.Event] = None,
+    ) -> None:
+        domain_whitelist = DomainMatcher.coerce(domain_whitelist)
+        loop = asyncio.get_running_loop()
+        about_sem = asyncio.Semaphore(self.concurrency)
+        detail_sem = asyncio.Semaphore(self.detail_concurrency)
+        # Batch tasks in search order; the drainer emits them in that order
+        batches: "asyncio.Queue[Optional[asyncio.Task]]" = asyncio.Queue(
+            maxsize=PENDING_BATCHES
+        )
+
+        with ThreadPoolExecutor(
+            max_workers=self._max_threads
+        ) as executor, self._extraction_pool():
+
+            async def enrich(detail: dict) -> Optional[ChannelContact]:
+                async with about_sem:
+                    return await loop.run_in_executor(
+                        executor, self._safe_extract, detail, domain_whitelist
+                    )
+
+            async def process_batch(batch_ids: List[str]) -> List[ChannelContact]:
+                async with detail_sem:
+                    details = await loop.run_in_executor(
+                        executor, self._fetch_channel_batch, batch_ids
+                    )
+                results = await asyncio.gather(*(enrich(d) for d in details))
+                return [c for c in results if c is not None]
+
+            async def drain() -> None:
+                while True:
+                    task = await batches.get()
+                    if task is None:
+                        return
+                    if stop is not None and stop.is_set():
+                        # Nobody reads the rest; stop fetching it
+                        task.cancel()
+                        continue
+                    for contact in await task:
+                        emitted = emit(contact)
+                        if emitted is not None:
+                            await emitted
+
+            async def enqueue(task: Optional[asyncio.Task]) -> None:
+                # Waits while the queue is full; if the drainer failed, nobody
+                # will make room, so surface its error instead
+                put = asyncio.ensure_future(batches.put(task))
+                await asyncio.wait({put, drainer}, return_when=asyncio.FIRST_COMPLETED)
+                if not put.done():
+                    put.cancel()
+                    if task is not None:
+                        task.cancel()
+                    drainer.result()
+
+            async def dispatch(batch_ids: List[str]) -> None:
+                await enqueue(asyncio.create_task(process_batch(batch_ids)))
+
+            drainer = asyncio.create_task(drain())
+            pending: List[str] = []
+            found = 0
+            remaining = max_results
+            page_token: Optional[str] = None
+
+            while remaining > 0 and not (stop and stop.is_set()):
+                page = await loop.run_in_executor(
+                    executor,
+                    self._search_page,
+                    keyword,
+                    min(50, remaining),
+                    page_token,
+                )
+                if page is None:
+                    break
+
+                channel_ids, page_token = page
+                channel_ids = channel_ids[:remaining]
+                remaining -= len(channel_ids)
+                found += len(channel_ids)
+                pending.extend(channel_ids)
+
+                # Dispatch full batches immediately, keep the tail for later
+                while len(pending) >= CHANNELS_BATCH_SIZE:
+                    await dispatch(pending[:CHANNELS_BATCH_SIZE])
+                    del pending[:CHANNELS_BATCH_SIZE]
+
+                if not page_token:
+                    break
+
+            if pending and not (stop and stop.is_set()):
+                await dispatch(pending)
+            await enqueue(None)
+
+            self.logger.info("Found %d channel candidates.", found)
+            await drainer
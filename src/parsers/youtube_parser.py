@@ -1,48 +1,197 @@
+import json
 import logging
-from dataclasses import dataclass, asdict
-from typing import Iterable, List, Optional, Dict, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, List, Optional, Dict, Any, Tuple
 
 import requests
-from bs4 import BeautifulSoup  # type: ignore
-
+from requests.adapters import HTTPAdapter
+
+from parsers.contact import CONTACT_FIELDS, ChannelContact
+from storage.channel_index import ChannelIndex
+from storage.http_cache import HttpCache
+from storage.raw_archive import RawArchive
+from storage.run_journal import RunJournal
+from telemetry.metrics import NULL_METRICS, RunMetrics
+from parsers.about_extract import STOP_MARKERS, get_about_extractor
+from parsers.about_stream import AboutStreamer
+from parsers.quota_scheduler import ENDPOINT_COSTS, QuotaScheduler
 from parsers.utils_extract import (
-    extract_emails,
-    extract_phones,
+    DomainMatcher,
+    contact_from_scan,
+    contact_promise,
+    scan_contacts,
     choose_best_email_for_domains,
 )
 
+if TYPE_CHECKING:
+    # multiprocessing is only loaded once a run actually uses extract_workers
+    from concurrent.futures import ProcessPoolExecutor
+
 YOUTUBE_SEARCH_URL = "https://www.googleapis.com/youtube/v3/search"
 YOUTUBE_CHANNELS_URL = "https://www.googleapis.com/youtube/v3/channels"
+YOUTUBE_CHANNEL_BASE_URL = "https://www.youtube.com/channel/"
+
+# The channels endpoint accepts at most 50 ids per call
+CHANNELS_BATCH_SIZE = 50
+
+# When to fetch a channel's About page: for every channel, only when the
+# description lacks a (whitelisted) email or a phone number, or never
+FETCH_POLICIES = ("always", "when_needed", "never")
+
+def iter_batches(items: Iterable[str], size: int) -> Iterator[List[str]]:
+    batch: List[str] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
 
 @dataclass
-class ChannelContact:
-    Channel_url: str
-    Channel_name: str
-    Email: str
-    Domain_email: str
-    Phone: str
-    Description: str
+class KeywordJobStats:
+    """
+    Savings from de-duplicating channels across the keywords of one job.
+    """
+
+    keywords: int = 0
+    # Search calls made over the network
+    search_requests: int = 0
+    candidates: int = 0
+    unique_channels: int = 0
+    # Channel-detail calls that per-keyword runs would have needed
+    undeduplicated_channel_calls: int = 0
+    # Quota units per call, as charged by the scheduler
+    search_cost: int = ENDPOINT_COSTS["search"]
+    channel_cost: int = ENDPOINT_COSTS["channels"]
+
+    @property
+    def duplicates(self) -> int:
+        return self.candidates - self.unique_channels
+
+    @property
+    def channel_calls(self) -> int:
+        return -(-self.unique_channels // CHANNELS_BATCH_SIZE)
+
+    @property
+    def channel_calls_saved(self) -> int:
+        return self.undeduplicated_channel_calls - self.channel_calls
+
+    @property
+    def search_quota_units(self) -> int:
+        return self.search_requests * self.search_cost
+
+    @property
+    def channel_quota_units_saved(self) -> int:
+        return self.channel_calls_saved * self.channel_cost
 
-    def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+@dataclass
+class TargetStats:
+    """
+    What a target_contacts run spent to find its contacts.
+    """
+
+    target: int = 0
+    contacts: int = 0
+    # Unique channel ids returned by search, and those actually enriched
+    candidates: int = 0
+    enriched: int = 0
+    # Network requests (cache hits excluded) and the quota they cost
+    search_requests: int = 0
+    channel_calls: int = 0
+    about_fetches: int = 0
+    quota_units: int = 0
+
+    @property
+    def reached(self) -> bool:
+        return self.contacts >= self.target
+
+    def per_contact(self, spent: int) -> Optional[float]:
+        return spent / self.contacts if self.contacts else None
 
 class YouTubeScraper:
     """
     Scraper that uses the YouTube Data API v3 and HTML parsing
     to extract emails and phone numbers from channel info.
+
+    With ``concurrency`` > 1, About pages are fetched by a bounded thread
+    pool sharing one session whose connection pool is sized to match.
+    With ``extract_workers`` > 0, those threads only do I/O: About parsing
+    and contact scanning run in a process pool, so they use more than one
+    core. Output order and filtering are identical to the sequential path.
+    About pages are streamed through ``about_streamer``, which stops each
+    download once the backend's data section has been read, and
+    ``fetch_policy`` decides whether a channel needs its About page at all.
     """
 
+    search_url = YOUTUBE_SEARCH_URL
+    channels_url = YOUTUBE_CHANNELS_URL
+    channel_base_url = YOUTUBE_CHANNEL_BASE_URL
+
     def __init__(
         self,
         api_key: str,
         logger: Optional[logging.Logger] = None,
         session: Optional[requests.Session] = None,
+        concurrency: int = 1,
+        cache: Optional[HttpCache] = None,
+        about_backend: str = "fast",
+        journal: Optional[RunJournal] = None,
+        channel_index: Optional[ChannelIndex] = None,
+        scheduler: Optional[QuotaScheduler] = None,
+        metrics: Optional[RunMetrics] = None,
+        extract_workers: int = 0,
+        extract_pool: Optional["ProcessPoolExecutor"] = None,
+        about_streamer: Optional[AboutStreamer] = None,
+        fetch_policy: str = "always",
+        raw_archive: Optional[RawArchive] = None,
     ) -> None:
         if not api_key:
             raise ValueError("YouTubeScraper requires a non-empty API key.")
+        if concurrency < 1:
+            raise ValueError("YouTubeScraper concurrency must be at least 1.")
+        if extract_workers < 0:
+            raise ValueError("YouTubeScraper extract_workers cannot be negative.")
+        if fetch_policy not in FETCH_POLICIES:
+            raise ValueError(
+                f"Unknown About fetch policy '{fetch_policy}'; "
+                f"expected one of: {', '.join(FETCH_POLICIES)}"
+            )
         self.api_key = api_key
         self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self.concurrency = concurrency
+        self.cache = cache
+        self.journal = journal
+        self.channel_index = channel_index
+        # Raw channel items and About pages, for offline `reprocess` runs
+        self.raw_archive = raw_archive
+        self.scheduler = scheduler
+        self.metrics = metrics if metrics is not None else NULL_METRICS
+        # Detail batches lost to non-retryable errors; reported, never silent
+        self.failed_batches: List[List[str]] = []
+        # Network requests per endpoint (cache hits excluded)
+        self.request_counts: Dict[str, int] = {}
+        self._counts_lock = threading.Lock()
+        self.fetch_policy = fetch_policy
+        # About fetches (and the parses that follow) made, and those the
+        # fetch policy made unnecessary
+        self.about_fetches = 0
+        self.about_fetches_avoided = 0
+        self.about_backend = about_backend
+        self._about_text = get_about_extractor(about_backend)
+        # Shared by scrapers that should share one in-flight byte budget
+        self.about_streamer = about_streamer or AboutStreamer(logger=self.logger)
+        # Processes for About parsing and contact scanning; 0 keeps it in-thread.
+        # A pool passed in (e.g. kept warm by the service) is used as is and
+        # left running.
+        self.extract_workers = extract_workers
+        self._extract_pool: Optional["ProcessPoolExecutor"] = extract_pool
         self.session = session or requests.Session()
+        if concurrency > 1:
+            self._size_connection_pool(concurrency)
         self.session.headers.update(
             {
                 "User-Agent": (
@@ -54,42 +203,350 @@ class YouTubeScraper:
             }
         )
 
+    def _size_connection_pool(self, size: int) -> None:
+        # One pooled connection per worker so threads never block on the pool.
+        # A shared session whose pools are already big enough keeps its warm
+        # connections.
+        if all(
+            getattr(self.session.get_adapter(prefix), "_pool_maxsize", 0) >= size
+            for prefix in ("https://", "http://")
+        ):
+            return
+        adapter = HTTPAdapter(pool_connections=size, pool_maxsize=size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    @contextmanager
+    def _extraction_pool(self) -> Iterator[None]:
+        """Keep the extraction process pool up for the duration of a run."""
+        if self.extract_workers < 1 or self._extract_pool is not None:
+            yield
+            return
+        from parsers.extract_pool import create_extract_pool
+
+        self._extract_pool = create_extract_pool(self.extract_workers)
+        try:
+            yield
+        finally:
+            pool, self._extract_pool = self._extract_pool, None
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _get_text(
+        self,
+        endpoint: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        reader: Optional[Callable[[requests.Response], Tuple[str, str]]] = None,
+        partial_key: str = "",
+    ) -> str:
+        """
+        GET a URL and return the body, going through the HTTP cache if set.
+        Data API endpoints go through the quota scheduler when one is set.
+        With reader, the response is streamed and reader returns (body, how
+        it stopped), as AboutStreamer.read_page does. A body cut at the stop
+        markers is cached under partial_key, so it is never served as the
+        full page; one cut at the page cap is not cached at all.
+        Raises requests.RequestException on failure (or QuotaExhausted);
+        errors are never cached.
+        """
+        metrics = self.metrics
+        partial_params = dict(params or {}, partial=partial_key) if partial_key else None
+        if self.cache is not None:
+            for key_params in (params, partial_params) if partial_params else (params,):
+                cached = self.cache.get(endpoint, url, key_params)
+                if cached is not None:
+                    metrics.count("cache_hits", endpoint)
+                    return cached
+
+        def fetch() -> Tuple[str, str]:
+            if reader is None:
+                resp = self._request(endpoint, url, params)
+                resp.raise_for_status()
+                return resp.text, ""
+            with self._request(endpoint, url, params, stream=True) as resp:
+                resp.raise_for_status()
+                return reader(resp)
+
+        if self.scheduler is not None and self.scheduler.handles(endpoint):
+            body, stopped = self.scheduler.call(endpoint, fetch)
+        else:
+            body, stopped = fetch()
+
+        if self.cache is not None:
+            if not stopped:
+                self.cache.set(endpoint, url, body, params)
+            elif stopped == AboutStreamer.EARLY_STOP and partial_params:
+                self.cache.set(endpoint, url, body, partial_params)
+        return body
+
+    def _request(
+        self,
+        endpoint: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        """
+        One counted, timed GET over the network; no cache, no status check.
+        A streamed body is left unread (and its bytes uncounted) for the caller.
+        """
+        metrics = self.metrics
+        with self._counts_lock:
+            self.request_counts[endpoint] = self.request_counts.get(endpoint, 0) + 1
+        metrics.count("requests", endpoint)
+        with metrics.timer(endpoint):
+            resp = self.session.get(
+                url, params=params, headers=headers, timeout=15, stream=stream
+            )
+        if not stream:
+            metrics.count("bytes", endpoint, len(resp.content))
+        if not resp.ok:
+            metrics.count("http_errors", endpoint)
+        return resp
+
     def scrape_contacts(
         self,
         keyword: str,
         max_results: int = 50,
-        domain_whitelist: Optional[List[str]] = None,
+        domain_whitelist: Optional[Iterable[str]] = None,
     ) -> List[ChannelContact]:
-        channel_ids = list(
-            self._search_channels(keyword=keyword, max_results=max_results)
+        return list(
+            self.iter_contacts(
+                keyword=keyword,
+                max_results=max_results,
+                domain_whitelist=domain_whitelist,
+            )
         )
-        self.logger.info("Found %d channel candidates.", len(channel_ids))
 
-        if not channel_ids:
-            return []
+    def iter_contacts(
+        self,
+        keyword: str,
+        max_results: int = 50,
+        domain_whitelist: Optional[Iterable[str]] = None,
+    ) -> Iterator[ChannelContact]:
+        """
+        Yield contacts as they are extracted, in the same order and with the
+        same filtering as scrape_contacts. Only the 50-id batch currently
+        being enriched is held in memory.
+        """
+        channel_ids = self._search_channels(keyword=keyword, max_results=max_results)
+        yield from self._iter_enriched(channel_ids, domain_whitelist)
 
-        channel_details = self._get_channel_details(channel_ids)
-        contacts: List[ChannelContact] = []
+    def iter_keyword_contacts(
+        self,
+        jobs: Iterable[Tuple[str, int]],
+        domain_whitelist: Optional[Iterable[str]] = None,
+    ) -> Iterator[ChannelContact]:
+        """
+        Run several (keyword, max_results) searches as one job.
 
-        for detail in channel_details:
-            try:
-                contact = self._extract_contact_from_channel_data(
-                    detail, domain_whitelist=domain_whitelist
-                )
-            except Exception as exc:
-                self.logger.warning(
-                    "Failed to extract contacts for channel %s: %s",
-                    detail.get("id"),
-                    exc,
-                )
-                continue
+        Channel ids are de-duplicated across keywords before any details are
+        fetched, so each channel is enriched once. Every contact's
+        ``keywords`` lists the keywords that found it, and the savings are
+        left in ``self.last_job_stats``.
+        """
+        keywords_by_id = self.collect_keyword_candidates(jobs)
+        yield from self._iter_enriched(
+            list(keywords_by_id), domain_whitelist, keywords_by_id
+        )
 
-            if contact is None:
-                continue
+    def collect_keyword_candidates(
+        self, jobs: Iterable[Tuple[str, int]]
+    ) -> Dict[str, Tuple[str, ...]]:
+        """
+        Search phase of iter_keyword_contacts: map each unique channel id,
+        in first-seen order, to the keywords that found it.
+        """
+        costs = self.scheduler.costs if self.scheduler is not None else ENDPOINT_COSTS
+        stats = KeywordJobStats(
+            search_cost=costs.get("search", 0), channel_cost=costs.get("channels", 0)
+        )
+        provenance: Dict[str, List[str]] = {}
+        searches_before = self.request_counts.get("search", 0)
+
+        for keyword, max_results in jobs:
+            stats.keywords += 1
+            found = 0
+            for channel_id in self._search_channels(keyword, max_results):
+                found += 1
+                sources = provenance.setdefault(channel_id, [])
+                if keyword not in sources:
+                    sources.append(keyword)
+            stats.candidates += found
+            stats.undeduplicated_channel_calls += -(-found // CHANNELS_BATCH_SIZE)
+            self.logger.info("Keyword '%s': %d channel candidates.", keyword, found)
+
+        stats.search_requests = self.request_counts.get("search", 0) - searches_before
+        stats.unique_channels = len(provenance)
+        self.last_job_stats = stats
+        return {cid: tuple(kws) for cid, kws in provenance.items()}
+
+    def iter_target_contacts(
+        self,
+        jobs: Iterable[Tuple[str, int]],
+        target: int,
+        domain_whitelist: Optional[Iterable[str]] = None,
+        multi_keyword: bool = False,
+    ) -> Iterator[ChannelContact]:
+        """
+        Page through the searches of (keyword, max_results) jobs only until
+        ``target`` contacts have been found, instead of enriching a fixed
+        number of candidates; max_results still caps each keyword.
+
+        Each search page's channels get their details in one call and are
+        then enriched most promising first (see contact_promise), at most
+        ``concurrency`` at a time, so no more About pages are fetched than
+        needed. Contacts therefore come in that order, not search order.
+        A channel found again by a later keyword is not enriched twice, and
+        with multi_keyword a contact's ``keywords`` is the keyword that
+        found it first. The spend is left in ``self.last_target_stats``.
+        """
+        if target < 1:
+            raise ValueError("target_contacts must be at least 1.")
+        domain_whitelist = DomainMatcher.coerce(domain_whitelist)
+        stats = TargetStats(target=target)
+        self.last_target_stats = stats
+        requests_before = dict(self.request_counts)
+        seen: set = set()
+        pool = (
+            ThreadPoolExecutor(max_workers=self.concurrency)
+            if self.concurrency > 1
+            else None
+        )
+        try:
+            with self._extraction_pool():
+                for keyword, max_results in jobs:
+                    for page_ids in self._search_pages(keyword, max_results):
+                        new_ids = [cid for cid in dict.fromkeys(page_ids) if cid not in seen]
+                        seen.update(new_ids)
+                        stats.candidates += len(new_ids)
+                        details = self._fetch_channel_batch(new_ids) if new_ids else []
+                        # sorted() is stable: equally promising channels keep search order
+                        ranked = sorted(
+                            details,
+                            key=lambda d: -contact_promise(
+                                (d.get("snippet") or {}).get("description", ""),
+                                domain_whitelist,
+                            ),
+                        )
+                        for start in range(0, len(ranked), self.concurrency):
+                            wave = ranked[start : start + self.concurrency]
+                            stats.enriched += len(wave)
+                            enriched = self._enrich_details(wave, domain_whitelist, pool)
+                            for _, contact in enriched:
+                                if multi_keyword:
+                                    contact.keywords = (keyword,)
+                                stats.contacts += 1
+                                yield contact
+                                if stats.reached:
+                                    return
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True, cancel_futures=True)
+            spent = {
+                endpoint: count - requests_before.get(endpoint, 0)
+                for endpoint, count in self.request_counts.items()
+            }
+            costs = self.scheduler.costs if self.scheduler is not None else ENDPOINT_COSTS
+            stats.search_requests = spent.get("search", 0)
+            stats.channel_calls = spent.get("channels", 0)
+            stats.about_fetches = spent.get("about", 0)
+            stats.quota_units = sum(
+                costs.get(endpoint, 0) * count for endpoint, count in spent.items()
+            )
+
+    def iter_channel_contacts(
+        self,
+        channel_ids: Iterable[str],
+        domain_whitelist: Optional[Iterable[str]] = None,
+        keywords_by_id: Optional[Dict[str, Tuple[str, ...]]] = None,
+    ) -> Iterator[ChannelContact]:
+        """
+        Enrichment phase only: fetch details and About pages for channel ids
+        found elsewhere (e.g. a shard from a distributed job's search).
+        """
+        yield from self._iter_enriched(channel_ids, domain_whitelist, keywords_by_id)
+
+    def _iter_enriched(
+        self,
+        channel_ids: Iterable[str],
+        domain_whitelist: Optional[Iterable[str]],
+        keywords_by_id: Optional[Dict[str, Tuple[str, ...]]] = None,
+    ) -> Iterator[ChannelContact]:
+        domain_whitelist = DomainMatcher.coerce(domain_whitelist)
+        found = 0
+        pool = (
+            ThreadPoolExecutor(max_workers=self.concurrency)
+            if self.concurrency > 1
+            else None
+        )
+        try:
+            with self._extraction_pool():
+                for batch_ids in iter_batches(channel_ids, CHANNELS_BATCH_SIZE):
+                    found += len(batch_ids)
+                    details = self._fetch_channel_batch(batch_ids)
+                    for detail, contact in self._enrich_details(
+                        details, domain_whitelist, pool
+                    ):
+                        if keywords_by_id is not None:
+                            contact.keywords = keywords_by_id.get(detail.get("id"), ())
+                        yield contact
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True, cancel_futures=True)
+
+        self.logger.info("Found %d channel candidates.", found)
+
+    def _enrich_details(
+        self,
+        details: List[dict],
+        domain_whitelist: Optional[Iterable[str]],
+        pool: Optional[ThreadPoolExecutor] = None,
+    ) -> Iterator[Tuple[dict, ChannelContact]]:
+        if pool is not None and len(details) > 1:
+            # map() yields in submission order, matching the sequential path
+            results = pool.map(
+                lambda d: self._safe_extract(d, domain_whitelist), details
+            )
+        else:
+            results = (self._safe_extract(d, domain_whitelist) for d in details)
+
+        for detail, contact in zip(details, results):
+            if contact is not None:
+                yield detail, contact
+
+    def _safe_extract(
+        self,
+        detail: dict,
+        domain_whitelist: Optional[Iterable[str]] = None,
+    ) -> Optional[ChannelContact]:
+        channel_id = detail.get("id") or ""
+        if self.journal is not None:
+            recorded, contact_data = self.journal.get_channel(channel_id)
+            if recorded:
+                self.metrics.count("channels", "replayed")
+                return ChannelContact(**contact_data) if contact_data else None
 
-            contacts.append(contact)
+        try:
+            contact = self._extract_contact_from_channel_data(
+                detail, domain_whitelist=domain_whitelist
+            )
+        except Exception as exc:
+            self.logger.warning(
+                "Failed to extract contacts for channel %s: %s",
+                channel_id,
+                exc,
+            )
+            self.metrics.count("channels", "failed")
+            return None
+        self.metrics.count("channels", "kept" if contact is not None else "filtered")
 
-        return contacts
+        if self.journal is not None:
+            self.journal.record_channel(
+                channel_id, contact.to_dict() if contact else None
+            )
+        return contact
 
     def _search_channels(
         self,
@@ -100,55 +557,95 @@ class YouTubeScraper:
         Use YouTube Data API search endpoint to get channel IDs for a keyword.
         Handles pagination up to max_results.
         """
-        if max_results <= 0:
-            return []
+        for channel_ids in self._search_pages(keyword, max_results):
+            yield from channel_ids
 
+    def _search_pages(self, keyword: str, max_results: int) -> Iterator[List[str]]:
+        """
+        Search results one page of channel ids at a time, up to max_results
+        ids in all. The next page is only requested once this one is used.
+        """
         remaining = max_results
         page_token: Optional[str] = None
 
         while remaining > 0:
-            batch = min(50, remaining)
-            params = {
-                "key": self.api_key,
-                "q": keyword,
-                "type": "channel",
-                "part": "snippet",
-                "maxResults": batch,
-            }
-            if page_token:
-                params["pageToken"] = page_token
-
-            self.logger.debug(
-                "Requesting YouTube search with params: %s", params
-            )
-            try:
-                resp = self.session.get(YOUTUBE_SEARCH_URL, params=params, timeout=15)
-                resp.raise_for_status()
-            except requests.RequestException as exc:
-                self.logger.error("Search request failed: %s", exc)
+            page = self._search_page(keyword, min(50, remaining), page_token)
+            if page is None:
                 break
 
-            data = resp.json()
-            items = data.get("items", [])
-            for item in items:
-                kind = (
-                    item.get("id", {}).get("kind", "")
-                    if isinstance(item.get("id"), dict)
-                    else ""
-                )
-                if not kind.endswith("#channel"):
-                    continue
-                channel_id = item.get("id", {}).get("channelId")
-                if channel_id:
-                    yield channel_id
-                    remaining -= 1
-                    if remaining == 0:
-                        break
-
-            page_token = data.get("nextPageToken")
+            channel_ids, page_token = page
+            channel_ids = channel_ids[:remaining]
+            remaining -= len(channel_ids)
+            yield channel_ids
+
             if not page_token:
                 break
 
+    def _search_page(
+        self,
+        keyword: str,
+        batch: int,
+        page_token: Optional[str] = None,
+    ) -> Optional[Tuple[List[str], Optional[str]]]:
+        """
+        Fetch one page of search results, replaying it from the run journal
+        when resuming. Returns (channel_ids, next_page_token), or None if
+        the request failed.
+        """
+        if self.journal is not None:
+            recorded = self.journal.get_search_page(keyword, batch, page_token)
+            if recorded is not None:
+                return recorded
+
+        page = self._request_search_page(keyword, batch, page_token)
+        if page is not None and self.journal is not None:
+            self.journal.record_search_page(keyword, batch, page_token, *page)
+        return page
+
+    def _request_search_page(
+        self,
+        keyword: str,
+        batch: int,
+        page_token: Optional[str] = None,
+    ) -> Optional[Tuple[List[str], Optional[str]]]:
+        params = {
+            "key": self.api_key,
+            "q": keyword,
+            "type": "channel",
+            "part": "snippet",
+            "maxResults": batch,
+        }
+        if page_token:
+            params["pageToken"] = page_token
+
+        self.logger.debug(
+            "Requesting YouTube search with params: %s", params
+        )
+        try:
+            data = json.loads(self._get_text("search", self.search_url, params))
+        except (requests.RequestException, ValueError) as exc:
+            self.logger.error(
+                "Search request for '%s' failed; stopping pagination: %s",
+                keyword,
+                exc,
+            )
+            return None
+
+        channel_ids: List[str] = []
+        for item in data.get("items", []):
+            kind = (
+                item.get("id", {}).get("kind", "")
+                if isinstance(item.get("id"), dict)
+                else ""
+            )
+            if not kind.endswith("#channel"):
+                continue
+            channel_id = item.get("id", {}).get("channelId")
+            if channel_id:
+                channel_ids.append(channel_id)
+
+        return channel_ids, data.get("nextPageToken")
+
     def _get_channel_details(self, channel_ids: List[str]) -> List[dict]:
         """
         Fetch channel details including description and custom URLs.
@@ -158,37 +655,67 @@ class YouTubeScraper:
             return []
 
         details: List[dict] = []
-        step = 50
+        step = CHANNELS_BATCH_SIZE
 
         for i in range(0, len(channel_ids), step):
-            batch_ids = channel_ids[i : i + step]
-            params = {
-                "key": self.api_key,
-                "id": ",".join(batch_ids),
-                "part": "snippet,brandingSettings",
-                "maxResults": len(batch_ids),
-            }
-            self.logger.debug(
-                "Requesting YouTube channels info for %d ids", len(batch_ids)
-            )
-            try:
-                resp = self.session.get(YOUTUBE_CHANNELS_URL, params=params, timeout=15)
-                resp.raise_for_status()
-            except requests.RequestException as exc:
-                self.logger.error("Channel details request failed: %s", exc)
-                continue
-
-            data = resp.json()
-            items = data.get("items", [])
-            details.extend(items)
+            details.extend(self._fetch_channel_batch(channel_ids[i : i + step]))
 
         return details
 
+    def _fetch_channel_batch(self, batch_ids: List[str]) -> List[dict]:
+        """
+        Fetch details for up to 50 channel ids in one channels call,
+        replaying the batch from the run journal when resuming.
+        Returns an empty list if the request failed.
+        """
+        if self.journal is not None:
+            recorded = self.journal.get_channel_batch(batch_ids)
+            if recorded is not None:
+                return recorded
+
+        items = self._request_channel_batch(batch_ids)
+        if items is None:
+            return []
+        if self.journal is not None:
+            self.journal.record_channel_batch(batch_ids, items)
+        if self.raw_archive is not None and items:
+            self.raw_archive.record_channels(
+                [self._build_channel_url(item) for item in items], items
+            )
+        return items
+
+    def _request_channel_batch(self, batch_ids: List[str]) -> Optional[List[dict]]:
+        params = {
+            "key": self.api_key,
+            "id": ",".join(batch_ids),
+            "part": "snippet,brandingSettings",
+            "maxResults": len(batch_ids),
+        }
+        self.logger.debug(
+            "Requesting YouTube channels info for %d ids", len(batch_ids)
+        )
+        try:
+            data = json.loads(
+                self._get_text("channels", self.channels_url, params)
+            )
+        except (requests.RequestException, ValueError) as exc:
+            self.logger.error(
+                "Channel details request failed for %d ids; they will be "
+                "missing from the output: %s",
+                len(batch_ids),
+                exc,
+            )
+            with self._counts_lock:
+                self.failed_batches.append(list(batch_ids))
+            return None
+
+        return data.get("items", [])
+
     def _build_channel_url(self, channel_data: dict) -> str:
         cid = channel_data.get("id", "")
         if not cid:
             return ""
-        return f"https://www.youtube.com/channel/{cid}"
+        return f"{self.channel_base_url}{cid}"
 
     def _fetch_about_html(self, channel_url: str) -> str:
         """
@@ -201,69 +728,207 @@ class YouTubeScraper:
         about_url = channel_url.rstrip("/") + "/about"
         self.logger.debug("Fetching channel about page: %s", about_url)
         try:
-            resp = self.session.get(about_url, timeout=15)
-            resp.raise_for_status()
-            return resp.text
+            return self._get_text(
+                "about",
+                about_url,
+                reader=self._read_about_page,
+                # Where the page is cut depends on the backend's stop markers
+                partial_key=(
+                    f"until-{self.about_backend}" if self.about_streamer.stop_early else ""
+                ),
+            )
         except requests.RequestException as exc:
             self.logger.info(
                 "Failed to fetch about page for %s: %s", channel_url, exc
             )
             return ""
 
+    def fetch_about_if_changed(
+        self,
+        channel_url: str,
+        etag: str = "",
+        last_modified: str = "",
+    ) -> Tuple[Optional[str], str, str]:
+        """
+        Conditional About fetch for refreshes, bypassing the HTTP cache.
+        Sends If-None-Match / If-Modified-Since when validators are given.
+        Returns (html, etag, last_modified); html is None when the server
+        answered 304 Not Modified. Raises requests.RequestException on
+        failure, so the caller can keep what it already has.
+        """
+        about_url = channel_url.rstrip("/") + "/about"
+        headers: Dict[str, str] = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        self.logger.debug("Revalidating channel about page: %s", about_url)
+        with self._request("about", about_url, headers=headers or None, stream=True) as resp:
+            if resp.status_code == 304:
+                self.metrics.count("not_modified", "about")
+                return None, etag, last_modified
+            resp.raise_for_status()
+            return (
+                self._read_about(resp),
+                resp.headers.get("ETag", ""),
+                resp.headers.get("Last-Modified", ""),
+            )
+
+    def _read_about(self, resp: requests.Response) -> str:
+        return self._read_about_page(resp)[0]
+
+    def _read_about_page(self, resp: requests.Response) -> Tuple[str, str]:
+        return self.about_streamer.read_page(
+            resp, STOP_MARKERS.get(self.about_backend, ()), self.metrics
+        )
+
+    def parse_about(
+        self, html: str, description: str
+    ) -> Tuple[Optional[str], Optional[Tuple[List[str], List[str]]]]:
+        """
+        Visible text of an About page, plus (emails, phones) when a worker
+        process already scanned it together with the description.
+        """
+        if self._extract_pool is not None:
+            about_text, emails, phones = self._offload_extraction(html, description)
+            return about_text, (emails, phones)
+        with self.metrics.timer("about_parse"):
+            return self._about_text(html), None
+
+    def _offload_extraction(
+        self, html: str, description: str
+    ) -> Tuple[Optional[str], List[str], List[str]]:
+        """
+        Parse and scan an About page in the extraction process pool. The
+        calling I/O thread blocks without holding the GIL meanwhile.
+        """
+        from parsers.extract_pool import extract_page
+
+        with self.metrics.timer("extract_offload"):
+            return self._extract_pool.submit(
+                extract_page,
+                html,
+                description,
+                self.about_backend,
+                self.channel_index is not None,
+            ).result()
+
     def _extract_contact_from_channel_data(
         self,
         channel_data: dict,
-        domain_whitelist: Optional[List[str]] = None,
+        domain_whitelist: Optional[Iterable[str]] = None,
     ) -> Optional[ChannelContact]:
         snippet = channel_data.get("snippet") or {}
         channel_name = snippet.get("title", "").strip()
         description = snippet.get("description", "").strip()
 
+        channel_id = channel_data.get("id", "")
         channel_url = self._build_channel_url(channel_data)
-        html = self._fetch_about_html(channel_url)
-
-        text_blobs: List[str] = [description]
-        if html:
-            soup = BeautifulSoup(html, "html.parser")
-            text_blobs.append(soup.get_text(" ", strip=True))
 
-        combined_text = "\n".join(text_blobs)
-
-        emails = extract_emails(combined_text)
-        phones = extract_phones(combined_text)
+        about_text: Optional[str] = None
+        if self.channel_index is not None:
+            about_text = self.channel_index.fresh_about_text(channel_id)
+            if about_text is not None and self.channel_index.mode == "skip":
+                self.logger.debug(
+                    "Channel %s skipped: enriched recently", channel_name
+                )
+                return None
 
-        primary_email, primary_domain = choose_best_email_for_domains(
-            emails, domain_whitelist
-        )
+        # Set here when a worker process has already scanned the page
+        scanned: Optional[Tuple[List[str], List[str]]] = None
+        if about_text is None and self.fetch_policy != "always":
+            with self.metrics.timer("extract"):
+                emails, phones = scan_contacts(description)
+            if self.fetch_policy == "never" or self._description_suffices(
+                emails, phones, domain_whitelist
+            ):
+                self._count_about_fetch(avoided=True)
+                if self.raw_archive is not None:
+                    self.raw_archive.record_page(channel_id, None)
+                return self.build_contact(
+                    channel_data, None, domain_whitelist, (emails, phones)
+                )
 
-        if domain_whitelist and not primary_email:
-            # Skip channels that do not match the whitelist at all
-            self.logger.debug(
-                "Channel %s filtered out: no email matching domains %s",
-                channel_name,
-                domain_whitelist,
+        html = ""
+        if about_text is None:
+            self._count_about_fetch(avoided=False)
+            html = self._fetch_about_html(channel_url)
+            if html:
+                about_text, scanned = self.parse_about(html, description)
+            if html and self.channel_index is not None:
+                self.channel_index.record(channel_id, about_text)
+
+        if self.raw_archive is not None:
+            # The page as read, else the About text reused from the index
+            self.raw_archive.record_page(
+                channel_id, html or None, None if html else about_text
             )
-            return None
-
-        email_str = primary_email or (emails[0] if emails else "")
-        domain_str = primary_domain or ""
-
-        phone_str = phones[0] if phones else ""
+        return self.build_contact(channel_data, about_text, domain_whitelist, scanned)
+
+    @staticmethod
+    def _description_suffices(
+        emails: List[str],
+        phones: List[str],
+        domain_whitelist: Optional[Iterable[str]],
+    ) -> bool:
+        """
+        Whether the description alone fills the record: the About text is
+        scanned after it, so it could not change the chosen email or phone.
+        """
+        if not phones:
+            return False
+        primary_email, _ = choose_best_email_for_domains(emails, domain_whitelist)
+        return primary_email is not None
+
+    def _count_about_fetch(self, avoided: bool) -> None:
+        with self._counts_lock:
+            if avoided:
+                self.about_fetches_avoided += 1
+            else:
+                self.about_fetches += 1
+        self.metrics.count("about_policy", "avoided" if avoided else "fetched")
+
+    def log_fetch_policy_stats(self) -> None:
+        if self.fetch_policy == "always" and not self.about_fetches_avoided:
+            return
+        self.logger.info(
+            "About fetch policy '%s': %d About fetches and parses avoided, %d made",
+            self.fetch_policy,
+            self.about_fetches_avoided,
+            self.about_fetches,
+        )
 
-        if not (email_str or phone_str):
-            # No contact info found; keep if whitelist is empty but skip otherwise
-            if domain_whitelist:
-                self.logger.debug(
-                    "Channel %s has no contact info; skipping due to whitelist.",
-                    channel_name,
-                )
-                return None
+    def build_contact(
+        self,
+        channel_data: dict,
+        about_text: Optional[str],
+        domain_whitelist: Optional[Iterable[str]] = None,
+        scanned: Optional[Tuple[List[str], List[str]]] = None,
+    ) -> Optional[ChannelContact]:
+        """
+        Scan a channel's description and About text for contacts and apply
+        the domain whitelist. scanned is (emails, phones) if already known.
+        """
+        snippet = channel_data.get("snippet") or {}
+        description = snippet.get("description", "").strip()
 
-        return ChannelContact(
-            Channel_url=channel_url,
-            Channel_name=channel_name,
-            Email=email_str,
-            Domain_email=domain_str,
-            Phone=phone_str,
-            Description=description,
+        if scanned is not None:
+            emails, phones = scanned
+        else:
+            text_blobs: List[str] = [description]
+            if about_text is not None:
+                text_blobs.append(about_text)
+
+            combined_text = "\n".join(text_blobs)
+
+            with self.metrics.timer("extract"):
+                emails, phones = scan_contacts(combined_text)
+
+        return contact_from_scan(
+            channel_data,
+            self._build_channel_url(channel_data),
+            emails,
+            phones,
+            domain_whitelist,
+            self.logger,
         )
\ No newline at end of file
@@ -0,0 +1,262 @@
+import json
+import logging
+import secrets
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+# Content types for export downloads, by file suffix
+CONTENT_TYPES = {
+    ".json": "application/json",
+    ".jsonl": "application/x-ndjson",
+    ".csv": "text/csv; charset=utf-8",
+    ".xml": "application/xml",
+    ".html": "text/html; charset=utf-8",
+    ".sqlite": "application/vnd.sqlite3",
+    ".parquet": "application/vnd.apache.parquet",
+    ".gz": "application/gzip",
+    ".zst": "application/zstd",
+}
+
+class ServiceBusy(Exception):
+    """Raised when the job queue is full."""
+
+class Job:
+    """One submitted scrape job and its progress."""
+
+    def __init__(self, job_id: str, params: Dict[str, Any], output_dir: Path) -> None:
+        self.id = job_id
+        self.params = params
+        self.output_dir = output_dir
+        self.state = QUEUED
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        # Updated by the runner as contacts are exported
+        self.contacts = 0
+        # Channel-detail batches that failed, and the channels they held
+        self.failed_batches = 0
+        self.failed_channels = 0
+        self.outputs: Dict[str, Path] = {}
+        self.error = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.id,
+            "state": self.state,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "contacts": self.contacts,
+            "failed_batches": self.failed_batches,
+            "failed_channels": self.failed_channels,
+            "exports": {
+                fmt: f"/jobs/{self.id}/exports/{fmt}" for fmt in self.outputs
+            },
+            "error": self.error or None,
+        }
+
+class JobService:
+    """
+    Runs submitted scrape jobs on a bounded thread pool inside one
+    long-lived process.
+
+    What a job does is up to run_job, which gets the Job (its params and
+    its own output directory) and returns the exported files by format.
+    The caller builds run_job around resources that stay warm across jobs
+    (HTTP session, caches, quota scheduler). validate is called on submit
+    so bad input is rejected before it is queued. Finished jobs beyond
+    max_history are forgotten (their files stay on disk).
+    """
+
+    def __init__(
+        self,
+        run_job: Callable[[Job], Dict[str, Path]],
+        jobs_dir: Path,
+        validate: Optional[Callable[[Dict[str, Any]], None]] = None,
+        max_jobs: int = 2,
+        max_queued: int = 100,
+        max_history: int = 1000,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        if max_jobs < 1:
+            raise ValueError("JobService max_jobs must be at least 1.")
+        self.run_job = run_job
+        self.jobs_dir = jobs_dir
+        self.validate = validate
+        self.max_jobs = max_jobs
+        self.max_queued = max_queued
+        self.max_history = max_history
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=max_jobs, thread_name_prefix="job")
+
+    def submit(self, params: Dict[str, Any]) -> Job:
+        """Queue a job. Raises ValueError for invalid input, ServiceBusy if full."""
+        if not isinstance(params, dict):
+            raise ValueError("Job input must be a JSON object.")
+        if self.validate is not None:
+            self.validate(params)
+        job_id = time.strftime("%Y%m%d-%H%M%S") + "-" + secrets.token_hex(3)
+        job = Job(job_id, params, self.jobs_dir / job_id)
+        with self._lock:
+            waiting = sum(1 for j in self._jobs.values() if j.state == QUEUED)
+            if waiting >= self.max_queued:
+                raise ServiceBusy(f"{waiting} jobs are already queued; try again later.")
+            self._jobs[job_id] = job
+            self._forget_old_jobs()
+        self._pool.submit(self._execute, job)
+        self.logger.info("Queued job %s", job_id)
+        return job
+
+    def _forget_old_jobs(self) -> None:
+        finished = [j.id for j in self._jobs.values() if j.state in (DONE, FAILED)]
+        for job_id in finished[: max(0, len(self._jobs) - self.max_history)]:
+            del self._jobs[job_id]
+
+    def _execute(self, job: Job) -> None:
+        job.state = RUNNING
+        job.started_at = time.time()
+        self.logger.info("Starting job %s", job.id)
+        try:
+            job.outputs = self.run_job(job)
+        except Exception as exc:
+            job.error = f"{type(exc).__name__}: {exc}"
+            job.state = FAILED
+            self.logger.warning("Job %s failed: %s", job.id, job.error)
+        else:
+            job.state = DONE
+            self.logger.info(
+                "Job %s done: %d contacts in %.2fs",
+                job.id,
+                job.contacts,
+                time.time() - job.started_at,
+            )
+        finally:
+            job.finished_at = time.time()
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def jobs(self) -> List[Job]:
+        with self._lock:
+            return list(self._jobs.values())
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._pool.shutdown(wait=wait, cancel_futures=not wait)
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "JobServer"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):  # noqa: A002 - signature from base class
+        self.server.service.logger.debug("%s - " + format, self.address_string(), *args)
+
+    def _send_json(self, status: int, payload: Any) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _error(self, status: int, message: str) -> None:
+        self._send_json(status, {"error": message})
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        service = self.server.service
+        parts = [p for p in self.path.split("?", 1)[0].split("/") if p]
+        if parts == ["health"]:
+            self._send_json(200, {"status": "ok"})
+        elif parts == ["metrics"] and self.server.metrics_text is not None:
+            body = self.server.metrics_text().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        elif parts == ["jobs"]:
+            self._send_json(200, [job.to_dict() for job in service.jobs()])
+        elif len(parts) in (2, 4) and parts[0] == "jobs":
+            job = service.get(parts[1])
+            if job is None:
+                self._error(404, f"Unknown job '{parts[1]}'")
+            elif len(parts) == 2:
+                self._send_json(200, job.to_dict())
+            elif parts[2] == "exports":
+                self._send_export(job, parts[3])
+            else:
+                self._error(404, "Not found")
+        else:
+            self._error(404, "Not found")
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server naming
+        if self.path.rstrip("/") != "/jobs":
+            self._error(404, "Not found")
+            return
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            params = json.loads(self.rfile.read(length) or b"{}")
+            job = self.server.service.submit(params)
+        except ValueError as exc:
+            self._error(400, str(exc))
+            return
+        except ServiceBusy as exc:
+            self._error(503, str(exc))
+            return
+        self._send_json(202, job.to_dict())
+
+    def _send_export(self, job: Job, fmt: str) -> None:
+        if job.state != DONE:
+            self._error(409, f"Job {job.id} is {job.state}; exports are ready once it is done.")
+            return
+        path = job.outputs.get(fmt)
+        if path is None or not path.exists():
+            self._error(404, f"Job {job.id} has no '{fmt}' export")
+            return
+        self.send_response(200)
+        self.send_header(
+            "Content-Type", CONTENT_TYPES.get(path.suffix, "application/octet-stream")
+        )
+        self.send_header("Content-Length", str(path.stat().st_size))
+        self.send_header("Content-Disposition", f'attachment; filename="{path.name}"')
+        self.end_headers()
+        with path.open("rb") as f:
+            shutil.copyfileobj(f, self.wfile)
+
+class JobServer(ThreadingHTTPServer):
+    """
+    Local HTTP/JSON front end for a JobService:
+
+        POST /jobs                      submit a job (input.sample.json shape)
+        GET  /jobs                      list jobs
+        GET  /jobs/<id>                 job status
+        GET  /jobs/<id>/exports/<fmt>   download an export once the job is done
+        GET  /health                    liveness
+        GET  /metrics                   Prometheus text, if metrics are on
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        service: JobService,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        metrics_text: Optional[Callable[[], str]] = None,
+    ) -> None:
+        self.service = service
+        self.metrics_text = metrics_text
+        super().__init__((host, port), _Handler)
@@ -0,0 +1,181 @@
+import hashlib
+import logging
+import math
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Iterable, Optional
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over string keys using double hashing.
+    A negative answer is definite; a positive one must be confirmed.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01) -> None:
+        capacity = max(capacity, 1)
+        self.capacity = capacity
+        self.error_rate = error_rate
+        bits = int(-capacity * math.log(error_rate) / (math.log(2) ** 2)) + 1
+        self.num_bits = max(bits, 64)
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str) -> Iterable[int]:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, key: str) -> None:
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+class ChannelIndex:
+    """
+    Persistent index of enriched channels shared across runs.
+
+    Keyed by channel id, it stores when each channel was last enriched and
+    the visible text of its About page. Channels enriched within max_age
+    can then be short-circuited: re-extracted from the stored text with no
+    About fetch ("reuse"), or dropped from the run entirely ("skip").
+    A Bloom filter in front of SQLite answers most lookups for unseen
+    channels without touching the database.
+    """
+
+    MODES = ("reuse", "skip")
+
+    def __init__(
+        self,
+        path: Path,
+        max_age_seconds: float = 30 * 86400,
+        mode: str = "reuse",
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        if mode not in self.MODES:
+            raise ValueError(
+                f"Unknown channel index mode '{mode}'; expected one of: "
+                f"{', '.join(self.MODES)}"
+            )
+        self.path = path
+        self.max_age_seconds = max_age_seconds
+        self.mode = mode
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self.reused = 0
+        self.skipped = 0
+        self.recorded = 0
+        self._pending_writes = 0
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS channels (
+                channel_id TEXT PRIMARY KEY,
+                enriched_at REAL NOT NULL,
+                about_text BLOB NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value BLOB)"
+        )
+        self._conn.commit()
+        self.bloom = self._load_bloom() or self._build_bloom()
+
+    def _load_bloom(self) -> Optional[BloomFilter]:
+        """Load the filter saved by close(), if it still covers every row."""
+        rows = dict(self._conn.execute("SELECT key, value FROM meta"))
+        if "bloom_bits" not in rows:
+            return None
+        total = self._conn.execute("SELECT COUNT(*) FROM channels").fetchone()[0]
+        if int(rows["bloom_rows"]) != total:
+            return None
+        bloom = BloomFilter(capacity=int(rows["bloom_capacity"]))
+        bloom.bits = bytearray(rows["bloom_bits"])
+        bloom.count = total
+        return bloom
+
+    def _build_bloom(self) -> BloomFilter:
+        total = self._conn.execute("SELECT COUNT(*) FROM channels").fetchone()[0]
+        # Headroom so a long run's new channels don't degrade the error rate
+        bloom = BloomFilter(capacity=max(2 * total, 100_000))
+        for (channel_id,) in self._conn.execute("SELECT channel_id FROM channels"):
+            bloom.add(channel_id)
+        self.logger.debug("Built channel index Bloom filter over %d ids", total)
+        return bloom
+
+    def _save_bloom(self) -> None:
+        total = self._conn.execute("SELECT COUNT(*) FROM channels").fetchone()[0]
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            [
+                ("bloom_capacity", str(self.bloom.capacity)),
+                ("bloom_rows", str(total)),
+                ("bloom_bits", bytes(self.bloom.bits)),
+            ],
+        )
+
+    def fresh_about_text(self, channel_id: str) -> Optional[str]:
+        """
+        Return the stored About text if the channel was enriched within
+        max_age, else None.
+        """
+        if not channel_id or channel_id not in self.bloom:
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT enriched_at, about_text FROM channels WHERE channel_id = ?",
+                (channel_id,),
+            ).fetchone()
+            if row is None or time.time() - row[0] > self.max_age_seconds:
+                return None
+            if self.mode == "skip":
+                self.skipped += 1
+            else:
+                self.reused += 1
+        return zlib.decompress(row[1]).decode("utf-8")
+
+    def record(self, channel_id: str, about_text: str) -> None:
+        if not channel_id:
+            return
+        blob = zlib.compress(about_text.encode("utf-8"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO channels (channel_id, enriched_at, about_text) "
+                "VALUES (?, ?, ?)",
+                (channel_id, time.time(), blob),
+            )
+            self.bloom.add(channel_id)
+            if self.bloom.count > self.bloom.capacity:
+                self._conn.commit()
+                self.bloom = self._build_bloom()
+            self.recorded += 1
+            self._pending_writes += 1
+            if self._pending_writes >= 100:
+                self._conn.commit()
+                self._pending_writes = 0
+
+    def log_stats(self) -> None:
+        self.logger.info(
+            "Channel index: %d channels %s as recently enriched, %d newly recorded",
+            self.skipped if self.mode == "skip" else self.reused,
+            "skipped" if self.mode == "skip" else "reused",
+            self.recorded,
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            self._save_bloom()
+            self._conn.commit()
+            self._conn.close()
@@ -0,0 +1,166 @@
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Mapping, Optional
+
+# Query parameters that must never become part of a cache key
+SECRET_PARAMS = {"key"}
+
+DEFAULT_TTLS: Dict[str, float] = {
+    "search": 24 * 3600,
+    "channels": 24 * 3600,
+    "about": 72 * 3600,
+}
+
+class HttpCache:
+    """
+    Persistent SQLite cache for GET responses, shared across runs.
+
+    Entries are keyed on the URL plus sorted query params with the API key
+    stripped, expire after a per-endpoint TTL, and are evicted least
+    recently used first once the stored bodies exceed max_bytes.
+    Safe to share between scraper worker threads.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        ttls: Optional[Mapping[str, float]] = None,
+        max_bytes: int = 512 * 1024 * 1024,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        self.path = path
+        self.ttls = dict(DEFAULT_TTLS)
+        self.ttls.update(ttls or {})
+        self.max_bytes = max_bytes
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self.hits: Dict[str, int] = {}
+        self.misses: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                endpoint TEXT NOT NULL,
+                created REAL NOT NULL,
+                accessed REAL NOT NULL,
+                size INTEGER NOT NULL,
+                body TEXT NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)"
+        )
+        self._conn.commit()
+        row = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        self._total_bytes = int(row[0])
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Mapping] = None) -> str:
+        clean = sorted(
+            (str(k), str(v))
+            for k, v in (params or {}).items()
+            if k not in SECRET_PARAMS
+        )
+        raw = url + "?" + json.dumps(clean, separators=(",", ":"))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(
+        self,
+        endpoint: str,
+        url: str,
+        params: Optional[Mapping] = None,
+    ) -> Optional[str]:
+        ttl = self.ttls.get(endpoint, 0)
+        if ttl <= 0:
+            return None
+
+        key = self.make_key(url, params)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT created, body FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[0] > ttl:
+                self.misses[endpoint] = self.misses.get(endpoint, 0) + 1
+                return None
+            self._conn.execute(
+                "UPDATE responses SET accessed = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            self.hits[endpoint] = self.hits.get(endpoint, 0) + 1
+            return row[1]
+
+    def set(
+        self,
+        endpoint: str,
+        url: str,
+        body: str,
+        params: Optional[Mapping] = None,
+    ) -> None:
+        if self.ttls.get(endpoint, 0) <= 0:
+            return
+
+        key = self.make_key(url, params)
+        size = len(body.encode("utf-8"))
+        now = time.time()
+        with self._lock:
+            old = self._conn.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, endpoint, created, accessed, size, body) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, endpoint, now, now, size, body),
+            )
+            self._total_bytes += size - (old[0] if old else 0)
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        if self._total_bytes <= self.max_bytes:
+            return
+        rows = self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed ASC"
+        )
+        doomed = []
+        excess = self._total_bytes - self.max_bytes
+        for key, size in rows:
+            if excess <= 0:
+                break
+            doomed.append((key,))
+            excess -= size
+            self._total_bytes -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", doomed)
+        self.logger.debug("HTTP cache evicted %d entries", len(doomed))
+
+    def log_stats(self) -> None:
+        for endpoint in sorted(set(self.hits) | set(self.misses)):
+            hits = self.hits.get(endpoint, 0)
+            misses = self.misses.get(endpoint, 0)
+            self.logger.info(
+                "HTTP cache %s: %d hits, %d misses (%.0f%% hit rate)",
+                endpoint,
+                hits,
+                misses,
+                100.0 * hits / (hits + misses),
+            )
+        self.logger.info(
+            "HTTP cache size: %.1f MB of %.1f MB",
+            self._total_bytes / (1024 * 1024),
+            self.max_bytes / (1024 * 1024),
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,210 @@
+import json
+import logging
+import secrets
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+# (channel_url, channel item JSON, About HTML, reused About text); the
+# last three zlib-compressed, the About fields None when absent
+ArchivedChannel = Tuple[str, bytes, Optional[bytes], Optional[bytes]]
+
+# Each run's channels joined to their latest page row; channels that never
+# reached extraction have no page row and are left out
+_CHANNELS_SQL = """
+    SELECT c.channel_url, c.channel_json, p.about_html, p.about_text
+    FROM channels c
+    JOIN pages p ON p.seq = (
+        SELECT MAX(seq) FROM pages
+        WHERE run_id = c.run_id AND channel_id = c.channel_id
+    )
+    WHERE {where}
+    ORDER BY c.seq
+"""
+
+_LATEST_COPY = """
+    c.seq IN (
+        SELECT MAX(c2.seq) FROM channels c2
+        JOIN pages p2 ON p2.run_id = c2.run_id AND p2.channel_id = c2.channel_id
+        GROUP BY c2.channel_id
+    )
+"""
+
+def _compress(text: str) -> bytes:
+    return zlib.compress(text.encode("utf-8"))
+
+def _connect_read_only(path: Path) -> sqlite3.Connection:
+    if not path.exists():
+        raise ValueError(f"Raw archive not found: {path}")
+    return sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+
+def archive_runs(path: Path) -> List[Tuple[str, float, str, int]]:
+    """(run_id, started_at, about_backend, enriched channels) per archived run."""
+    try:
+        conn = _connect_read_only(path)
+        try:
+            return conn.execute(
+                "SELECT r.run_id, r.started_at, r.about_backend, ("
+                "SELECT COUNT(DISTINCT channel_id) FROM pages p WHERE p.run_id = r.run_id"
+                ") FROM runs r ORDER BY r.started_at"
+            ).fetchall()
+        finally:
+            conn.close()
+    except sqlite3.Error as exc:
+        raise ValueError(f"Cannot read raw archive '{path.name}': {exc}") from None
+
+def iter_archived_channels(
+    path: Path, run_id: Optional[str] = None, batch_size: int = 500
+) -> Iterator[ArchivedChannel]:
+    """
+    Stream enriched channels in the order they were archived: those of
+    run_id, or else the latest archived copy of every channel.
+    """
+    where, params = ("c.run_id = ?", (run_id,)) if run_id is not None else (_LATEST_COPY, ())
+    try:
+        conn = _connect_read_only(path)
+        try:
+            cursor = conn.execute(_CHANNELS_SQL.format(where=where), params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            conn.close()
+    except sqlite3.Error as exc:
+        raise ValueError(f"Cannot read raw archive '{path.name}': {exc}") from None
+
+class RawArchive:
+    """
+    Append-only archive of the raw responses contacts were extracted from.
+
+    Every channels-API item a run fetched is appended in search order, and
+    every enriched channel's About page HTML as it was read (or the About
+    text reused from the channel index) is appended once extraction ran.
+    Rows are never updated; each run's rows carry its run id, and a
+    channel archived by several runs has one row per run. Payloads are
+    zlib-compressed and indexed by run and channel id, so `reprocess` can
+    stream a run (or the latest copy of every channel) back out and
+    re-extract contacts with no network or quota cost.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        run_id: Optional[str] = None,
+        about_backend: str = "fast",
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        self.path = path
+        self.run_id = run_id or time.strftime("%Y%m%d-%H%M%S") + "-" + secrets.token_hex(3)
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self.channels = 0
+        self.pages = 0
+        self.bytes_written = 0
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # Every write is committed, so an interrupted run keeps what it
+        # archived (a resumed run replays those channels from its journal
+        # and does not archive them again); NORMAL skips the fsync per commit
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS runs (
+                run_id TEXT PRIMARY KEY,
+                started_at REAL NOT NULL,
+                about_backend TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS channels (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                run_id TEXT NOT NULL,
+                channel_id TEXT NOT NULL,
+                channel_url TEXT NOT NULL,
+                channel_json BLOB NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS channels_by_id ON channels (channel_id, run_id);
+            CREATE TABLE IF NOT EXISTS pages (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                run_id TEXT NOT NULL,
+                channel_id TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                about_html BLOB,
+                about_text BLOB
+            );
+            CREATE INDEX IF NOT EXISTS pages_by_id ON pages (run_id, channel_id);
+            """
+        )
+        # A resumed run keeps its id, and with it its first start time
+        self._conn.execute(
+            "INSERT OR IGNORE INTO runs (run_id, started_at, about_backend) VALUES (?, ?, ?)",
+            (self.run_id, time.time(), about_backend),
+        )
+        self._conn.commit()
+
+    def record_channels(self, channel_urls: List[str], items: List[dict]) -> None:
+        """Append one channels call's items, with the channel URL of each."""
+        rows = [
+            (
+                self.run_id,
+                item.get("id") or "",
+                url,
+                _compress(json.dumps(item, ensure_ascii=False)),
+            )
+            for url, item in zip(channel_urls, items)
+        ]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO channels (run_id, channel_id, channel_url, channel_json) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self.channels += len(rows)
+            self.bytes_written += sum(len(row[3]) for row in rows)
+            self._conn.commit()
+
+    def record_page(
+        self,
+        channel_id: str,
+        html: Optional[str],
+        about_text: Optional[str] = None,
+    ) -> None:
+        """
+        Append what a channel's contacts were extracted from besides its
+        description: the About HTML, the reused About text, or neither (the
+        page was not fetched or the fetch failed).
+        """
+        if not channel_id:
+            return
+        html_blob = _compress(html) if html else None
+        text_blob = _compress(about_text) if about_text is not None else None
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO pages (run_id, channel_id, fetched_at, about_html, about_text) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (self.run_id, channel_id, time.time(), html_blob, text_blob),
+            )
+            self.pages += 1
+            self.bytes_written += len(html_blob or b"") + len(text_blob or b"")
+            self._conn.commit()
+
+    def log_stats(self) -> None:
+        self.logger.info(
+            "Raw archive: %d channel items and %d About pages archived (%.1f KB "
+            "compressed) as run %s in %s",
+            self.channels,
+            self.pages,
+            self.bytes_written / 1024,
+            self.run_id,
+            self.path,
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.commit()
+            self._conn.close()
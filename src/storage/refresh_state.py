@@ -0,0 +1,132 @@
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+@dataclass
+class ChannelState:
+    """What a refresh last saw for one channel."""
+
+    channel_id: str
+    # Item etag from the channels endpoint
+    etag: str
+    # Hash of the snippet fields contacts are extracted from
+    snippet_hash: str
+    # About page validators, for conditional re-fetches
+    about_etag: str = ""
+    about_last_modified: str = ""
+    # When the About page was last fetched or revalidated, if ever
+    about_checked_at: Optional[float] = None
+    created_at: float = 0.0
+    checked_at: float = 0.0
+
+class RefreshState:
+    """
+    Per-channel validators kept between `refresh` runs.
+
+    Stores each channel's etag and snippet hash from the last channels
+    call, and the ETag / Last-Modified and visible text of its About page,
+    so the next refresh can skip unchanged channels and revalidate About
+    pages with conditional requests. About text is zlib-compressed and
+    only read back when a page comes back 304 Not Modified.
+    """
+
+    def __init__(self, path: Path, logger: Optional[logging.Logger] = None) -> None:
+        self.path = path
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS channels (
+                channel_id TEXT PRIMARY KEY,
+                etag TEXT NOT NULL,
+                snippet_hash TEXT NOT NULL,
+                about_etag TEXT NOT NULL DEFAULT '',
+                about_last_modified TEXT NOT NULL DEFAULT '',
+                about_text BLOB,
+                about_checked_at REAL,
+                created_at REAL NOT NULL,
+                checked_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    def get_many(self, channel_ids: Iterable[str]) -> Dict[str, ChannelState]:
+        ids = list(dict.fromkeys(channel_ids))
+        if not ids:
+            return {}
+        placeholders = ", ".join("?" for _ in ids)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT channel_id, etag, snippet_hash, about_etag, "
+                "about_last_modified, about_checked_at, created_at, checked_at "
+                f"FROM channels WHERE channel_id IN ({placeholders})",
+                ids,
+            ).fetchall()
+        return {row[0]: ChannelState(*row) for row in rows}
+
+    def about_text(self, channel_id: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT about_text FROM channels WHERE channel_id = ?", (channel_id,)
+            ).fetchone()
+        if row is None or row[0] is None:
+            return None
+        return zlib.decompress(row[0]).decode("utf-8")
+
+    def save(self, states: List[ChannelState], about_texts: Dict[str, str]) -> None:
+        """
+        Upsert states. about_texts holds the new About text of channels whose
+        page was re-fetched; everyone else keeps the text already stored.
+        """
+        now = time.time()
+        rows = [
+            (
+                state.channel_id,
+                state.etag,
+                state.snippet_hash,
+                state.about_etag,
+                state.about_last_modified,
+                (
+                    zlib.compress(about_texts[state.channel_id].encode("utf-8"))
+                    if state.channel_id in about_texts
+                    else None
+                ),
+                state.about_checked_at,
+                state.created_at or now,
+                state.checked_at or now,
+            )
+            for state in states
+        ]
+        with self._lock:
+            self._conn.executemany(
+                """
+                INSERT INTO channels (
+                    channel_id, etag, snippet_hash, about_etag, about_last_modified,
+                    about_text, about_checked_at, created_at, checked_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (channel_id) DO UPDATE SET
+                    etag = excluded.etag,
+                    snippet_hash = excluded.snippet_hash,
+                    about_etag = excluded.about_etag,
+                    about_last_modified = excluded.about_last_modified,
+                    about_text = COALESCE(excluded.about_text, channels.about_text),
+                    about_checked_at = excluded.about_checked_at,
+                    checked_at = excluded.checked_at
+                """,
+                rows,
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
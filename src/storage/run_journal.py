@@ -0,0 +1,202 @@
+import json
+import logging
+import secrets
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+def _ends_with_complete(path: Path) -> bool:
+    """True if the journal's last record marks the run complete."""
+    with path.open("rb") as f:
+        f.seek(0, 2)
+        f.seek(max(f.tell() - 64, 0))
+        tail = f.read().rstrip(b"\n").rsplit(b"\n", 1)[-1]
+    try:
+        return json.loads(tail).get("type") == "complete"
+    except ValueError:
+        return False
+
+class RunJournal:
+    """
+    Append-only JSON Lines journal that makes a scrape run resumable.
+
+    Records every search page, channel-detail batch and finished channel
+    (with its extracted contact, or null if it was filtered out). When a
+    run is resumed, recorded work is replayed from the journal instead of
+    hitting the network, so the resumed run yields exactly the contacts an
+    uninterrupted run would have.
+
+    A fresh run only appends to the file, so its memory use does not grow
+    with the run. The replay index is built when a journal is resumed, and
+    each entry is dropped once it has been replayed.
+    """
+
+    def __init__(self, path: Path, logger: Optional[logging.Logger] = None) -> None:
+        self.path = path
+        self.run_id = path.stem
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self.params: Dict[str, Any] = {}
+        self.completed = False
+        self._searches: Dict[str, Tuple[List[str], Optional[str]]] = {}
+        self._details: Dict[str, List[dict]] = {}
+        self._channels: Dict[str, Optional[dict]] = {}
+        self._lock = threading.Lock()
+        self._fh = None
+
+    @classmethod
+    def create(
+        cls,
+        runs_dir: Path,
+        params: Dict[str, Any],
+        logger: Optional[logging.Logger] = None,
+    ) -> "RunJournal":
+        runs_dir.mkdir(parents=True, exist_ok=True)
+        run_id = time.strftime("%Y%m%d-%H%M%S") + "-" + secrets.token_hex(3)
+        journal = cls(runs_dir / f"{run_id}.jsonl", logger)
+        journal.params = params
+        journal._open()
+        journal._append({"type": "start", "params": params})
+        return journal
+
+    @staticmethod
+    def prune_completed(
+        runs_dir: Path,
+        max_age_seconds: float,
+        logger: Optional[logging.Logger] = None,
+    ) -> int:
+        """
+        Delete journals of completed runs last written more than
+        max_age_seconds ago; interrupted runs are kept so they can still be
+        resumed. Returns the number deleted.
+        """
+        if not runs_dir.is_dir():
+            return 0
+        cutoff = time.time() - max_age_seconds
+        pruned = 0
+        for path in runs_dir.glob("*.jsonl"):
+            try:
+                if path.stat().st_mtime > cutoff or not _ends_with_complete(path):
+                    continue
+                path.unlink()
+            except OSError:
+                continue
+            pruned += 1
+        if pruned and logger is not None:
+            logger.info("Removed %d completed run journals from %s", pruned, runs_dir)
+        return pruned
+
+    @classmethod
+    def resume(
+        cls,
+        runs_dir: Path,
+        run_id: str,
+        logger: Optional[logging.Logger] = None,
+    ) -> "RunJournal":
+        path = runs_dir / f"{run_id}.jsonl"
+        if not path.exists():
+            raise FileNotFoundError(f"No journal for run '{run_id}' at {path}")
+        journal = cls(path, logger)
+        journal._load()
+        journal._open()
+        journal.logger.info(
+            "Resuming run %s: %d search pages, %d detail batches, %d channels recorded",
+            run_id,
+            len(journal._searches),
+            len(journal._details),
+            len(journal._channels),
+        )
+        return journal
+
+    def _load(self) -> None:
+        with self.path.open("r", encoding="utf-8") as f:
+            for line_no, line in enumerate(f, 1):
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # A crash can leave a torn final line; everything before it is intact
+                    self.logger.warning(
+                        "Ignoring unreadable journal line %d in %s", line_no, self.path
+                    )
+                    continue
+                kind = record.get("type")
+                if kind == "start":
+                    self.params = record.get("params") or {}
+                elif kind == "search":
+                    self._searches[record["key"]] = (
+                        record["channel_ids"],
+                        record.get("next_page_token"),
+                    )
+                elif kind == "details":
+                    self._details[record["key"]] = record["items"]
+                elif kind == "channel":
+                    self._channels[record["id"]] = record.get("contact")
+                elif kind == "complete":
+                    self.completed = True
+
+    def _open(self) -> None:
+        torn = False
+        if self.path.exists() and self.path.stat().st_size > 0:
+            with self.path.open("rb") as f:
+                f.seek(-1, 2)
+                torn = f.read(1) != b"\n"
+        self._fh = self.path.open("a", encoding="utf-8")
+        if torn:
+            self._fh.write("\n")
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        line = json.dumps(record, ensure_ascii=False)
+        with self._lock:
+            self._fh.write(line + "\n")
+            self._fh.flush()
+
+    @staticmethod
+    def _search_key(keyword: str, batch: int, page_token: Optional[str]) -> str:
+        return json.dumps([keyword, batch, page_token or ""])
+
+    def get_search_page(
+        self, keyword: str, batch: int, page_token: Optional[str]
+    ) -> Optional[Tuple[List[str], Optional[str]]]:
+        return self._searches.pop(self._search_key(keyword, batch, page_token), None)
+
+    def record_search_page(
+        self,
+        keyword: str,
+        batch: int,
+        page_token: Optional[str],
+        channel_ids: List[str],
+        next_page_token: Optional[str],
+    ) -> None:
+        self._append(
+            {
+                "type": "search",
+                "key": self._search_key(keyword, batch, page_token),
+                "channel_ids": channel_ids,
+                "next_page_token": next_page_token,
+            }
+        )
+
+    def get_channel_batch(self, batch_ids: List[str]) -> Optional[List[dict]]:
+        return self._details.pop(",".join(batch_ids), None)
+
+    def record_channel_batch(self, batch_ids: List[str], items: List[dict]) -> None:
+        self._append({"type": "details", "key": ",".join(batch_ids), "items": items})
+
+    def get_channel(self, channel_id: str) -> Tuple[bool, Optional[dict]]:
+        """Return (recorded, contact_dict); contact_dict is None if filtered out."""
+        if channel_id in self._channels:
+            return True, self._channels.pop(channel_id)
+        return False, None
+
+    def record_channel(self, channel_id: str, contact: Optional[dict]) -> None:
+        self._append({"type": "channel", "id": channel_id, "contact": contact})
+
+    def mark_complete(self) -> None:
+        self.completed = True
+        self._append({"type": "complete"})
+
+    def close(self) -> None:
+        with self._lock:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
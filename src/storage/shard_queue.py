@@ -0,0 +1,437 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Shard states
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"
+
+@dataclass
+class Shard:
+    """One claimed unit of work: a run of channel ids from a job's search."""
+
+    job_id: str
+    seq: int
+    channel_ids: List[str]
+    # Search keywords per channel id, for multi-keyword jobs
+    keywords: Optional[Dict[str, Tuple[str, ...]]]
+    attempts: int
+    params: Dict[str, Any]
+
+@dataclass
+class ShardResult:
+    seq: int
+    state: str
+    contacts: List[dict]
+    # Channel ids whose detail batch failed on the worker
+    failed_ids: List[str]
+    error: str
+
+class ShardQueue:
+    """
+    Durable queue of channel-id shards for distributed enrichment.
+
+    One SQLite file holds the jobs, their shards and the workers' partial
+    results, so it can live on storage shared by the coordinator and every
+    worker. It uses SQLite's rollback journal, not WAL: WAL keeps its index
+    in shared memory, which only works for processes on one host. The
+    rollback journal relies on file locks alone, so a network filesystem
+    must provide working POSIX locks (e.g. NFS with lockd); without them,
+    keep the file on one host's local disk.
+
+    Workers claim a shard with a time-limited lease and renew it while
+    they work. A lease that runs out (the worker died or lost the file)
+    puts the shard back to pending, where any worker can claim it; a shard
+    that keeps failing is parked as failed after max_attempts claims so
+    one bad shard cannot stall the job. The coordinator likewise keeps a
+    heartbeat on a job while it searches; a job that is still unsealed
+    after search_timeout seconds without one is treated as abandoned, so
+    idle workers do not wait for its shards forever.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        lease_seconds: float = 300.0,
+        max_attempts: int = 5,
+        search_timeout: float = 600.0,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        if lease_seconds <= 0:
+            raise ValueError("ShardQueue lease_seconds must be positive.")
+        if max_attempts < 1:
+            raise ValueError("ShardQueue max_attempts must be at least 1.")
+        if search_timeout <= 0:
+            raise ValueError("ShardQueue search_timeout must be positive.")
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.search_timeout = search_timeout
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Autocommit mode; multi-statement updates use explicit BEGIN IMMEDIATE
+        # so two workers can never claim the same shard.
+        self._conn = sqlite3.connect(
+            str(self.path), timeout=30, isolation_level=None, check_same_thread=False
+        )
+        # Also switches back a queue file created in WAL mode
+        self._conn.execute("PRAGMA journal_mode=DELETE")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id TEXT PRIMARY KEY,
+                params TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                total_shards INTEGER,
+                heartbeat_at REAL
+            )
+            """
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        if "heartbeat_at" not in columns:
+            # Queue files from before coordinator heartbeats
+            self._conn.execute("ALTER TABLE jobs ADD COLUMN heartbeat_at REAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS shards (
+                job_id TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                channel_ids TEXT NOT NULL,
+                keywords TEXT,
+                state TEXT NOT NULL,
+                owner TEXT,
+                lease_expires REAL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                result BLOB,
+                failed_ids TEXT,
+                error TEXT,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (job_id, seq)
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_shards_state ON shards (state, lease_expires)"
+        )
+
+    # --- coordinator side -------------------------------------------------
+
+    def create_job(self, job_id: str, params: Dict[str, Any]) -> bool:
+        """Register a job. Returns False if it already exists (a restart)."""
+        now = time.time()
+        with self._lock:
+            cur = self._conn.execute(
+                "INSERT OR IGNORE INTO jobs (job_id, params, created_at, heartbeat_at) "
+                "VALUES (?, ?, ?, ?)",
+                (job_id, json.dumps(params), now, now),
+            )
+        return cur.rowcount == 1
+
+    def touch_job(self, job_id: str) -> None:
+        """Coordinator heartbeat: the job's search is still running."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET heartbeat_at = ? WHERE job_id = ?",
+                (time.time(), job_id),
+            )
+
+    def job_params(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT params FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def total_shards(self, job_id: str) -> Optional[int]:
+        """Number of shards once the job is sealed; None while still searching."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT total_shards FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def add_shard(
+        self,
+        job_id: str,
+        seq: int,
+        channel_ids: List[str],
+        keywords: Optional[Dict[str, Tuple[str, ...]]] = None,
+    ) -> None:
+        """
+        Enqueue one shard. Re-adding an existing (job_id, seq) is a no-op,
+        so a restarted coordinator can replay its search safely.
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO shards "
+                "(job_id, seq, channel_ids, keywords, state, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    job_id,
+                    seq,
+                    json.dumps(channel_ids),
+                    json.dumps(keywords) if keywords is not None else None,
+                    PENDING,
+                    time.time(),
+                ),
+            )
+
+    def seal(self, job_id: str, total_shards: int) -> None:
+        """Mark the job's search finished: no shards beyond total_shards come."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET total_shards = ? WHERE job_id = ?",
+                (total_shards, job_id),
+            )
+
+    def progress(self, job_id: str) -> Dict[str, int]:
+        """Shard count per state."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT state, COUNT(*) FROM shards WHERE job_id = ? GROUP BY state",
+                (job_id,),
+            ).fetchall()
+        counts = {state: 0 for state in (PENDING, LEASED, DONE, FAILED)}
+        counts.update(dict(rows))
+        return counts
+
+    def result(self, job_id: str, seq: int) -> Optional[ShardResult]:
+        """The shard's outcome once it is done or failed, else None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT state, result, failed_ids, error FROM shards "
+                "WHERE job_id = ? AND seq = ? AND state IN (?, ?)",
+                (job_id, seq, DONE, FAILED),
+            ).fetchone()
+        if row is None:
+            return None
+        state, blob, failed_ids, error = row
+        contacts = json.loads(zlib.decompress(blob)) if blob else []
+        return ShardResult(
+            seq=seq,
+            state=state,
+            contacts=contacts,
+            failed_ids=json.loads(failed_ids) if failed_ids else [],
+            error=error or "",
+        )
+
+    def iter_job_results(
+        self, job_id: str, poll_interval: float = 2.0
+    ) -> Iterator[ShardResult]:
+        """
+        Yield the job's shard results in shard order, waiting for workers
+        as needed, until every shard of the sealed job is done or failed.
+        Expired leases are re-queued while waiting, so the merge still
+        finishes after a worker dies.
+        """
+        seq = 0
+        while True:
+            total = self.total_shards(job_id)
+            if total is not None and seq >= total:
+                return
+            result = self.result(job_id, seq)
+            if result is not None:
+                yield result
+                seq += 1
+                continue
+            self.requeue_expired()
+            time.sleep(poll_interval)
+
+    # --- worker side ------------------------------------------------------
+
+    def requeue_expired(self) -> int:
+        """Return shards whose lease ran out to pending (or failed)."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                requeued = self._requeue_expired(time.time())
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return requeued
+
+    def _requeue_expired(self, now: float) -> int:
+        expired = self._conn.execute(
+            "SELECT job_id, seq, owner, attempts FROM shards "
+            "WHERE state = ? AND lease_expires < ?",
+            (LEASED, now),
+        ).fetchall()
+        for job_id, seq, owner, attempts in expired:
+            state = FAILED if attempts >= self.max_attempts else PENDING
+            self._conn.execute(
+                "UPDATE shards SET state = ?, owner = NULL, lease_expires = NULL, "
+                "error = ?, updated_at = ? WHERE job_id = ? AND seq = ?",
+                (state, f"lease held by {owner} expired", now, job_id, seq),
+            )
+            self.logger.warning(
+                "Lease on shard %s/%d held by %s expired after %d attempt(s); %s.",
+                job_id,
+                seq,
+                owner,
+                attempts,
+                "giving up" if state == FAILED else "re-queued",
+            )
+        return len(expired)
+
+    def claim(self, worker_id: str, job_id: Optional[str] = None) -> Optional[Shard]:
+        """
+        Lease the oldest pending shard (of job_id, or of any job) to
+        worker_id. Expired leases are re-queued first. Returns None when
+        nothing is claimable right now.
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._requeue_expired(now)
+                query = (
+                    "SELECT s.job_id, s.seq, s.channel_ids, s.keywords, s.attempts, j.params "
+                    "FROM shards s JOIN jobs j ON j.job_id = s.job_id WHERE s.state = ?"
+                )
+                args: Tuple[Any, ...] = (PENDING,)
+                if job_id is not None:
+                    query += " AND s.job_id = ?"
+                    args += (job_id,)
+                row = self._conn.execute(
+                    query + " ORDER BY j.created_at, s.seq LIMIT 1", args
+                ).fetchone()
+                if row is not None:
+                    self._conn.execute(
+                        "UPDATE shards SET state = ?, owner = ?, lease_expires = ?, "
+                        "attempts = attempts + 1, updated_at = ? WHERE job_id = ? AND seq = ?",
+                        (LEASED, worker_id, now + self.lease_seconds, now, row[0], row[1]),
+                    )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        if row is None:
+            return None
+        shard_job, seq, channel_ids, keywords, attempts, params = row
+        return Shard(
+            job_id=shard_job,
+            seq=seq,
+            channel_ids=json.loads(channel_ids),
+            keywords=(
+                {cid: tuple(kws) for cid, kws in json.loads(keywords).items()}
+                if keywords
+                else None
+            ),
+            attempts=attempts + 1,
+            params=json.loads(params),
+        )
+
+    def renew(self, shard: Shard, worker_id: str) -> bool:
+        """Extend worker_id's lease. False means the lease was lost."""
+        with self._lock:
+            cur = self._conn.execute(
+                "UPDATE shards SET lease_expires = ?, updated_at = ? "
+                "WHERE job_id = ? AND seq = ? AND state = ? AND owner = ?",
+                (
+                    time.time() + self.lease_seconds,
+                    time.time(),
+                    shard.job_id,
+                    shard.seq,
+                    LEASED,
+                    worker_id,
+                ),
+            )
+        return cur.rowcount == 1
+
+    def complete(
+        self,
+        shard: Shard,
+        worker_id: str,
+        contacts: List[dict],
+        failed_ids: Optional[List[str]] = None,
+    ) -> bool:
+        """
+        Store a shard's contacts and mark it done. The first completion
+        wins: a worker that finishes after its lease expired still lands
+        its result unless another worker already did. Returns False if the
+        shard was already done.
+        """
+        blob = zlib.compress(json.dumps(contacts, ensure_ascii=False).encode("utf-8"))
+        with self._lock:
+            cur = self._conn.execute(
+                "UPDATE shards SET state = ?, owner = ?, lease_expires = NULL, result = ?, "
+                "failed_ids = ?, error = NULL, updated_at = ? "
+                "WHERE job_id = ? AND seq = ? AND state != ?",
+                (
+                    DONE,
+                    worker_id,
+                    blob,
+                    json.dumps(failed_ids or []),
+                    time.time(),
+                    shard.job_id,
+                    shard.seq,
+                    DONE,
+                ),
+            )
+        return cur.rowcount == 1
+
+    def release(
+        self, shard: Shard, worker_id: str, error: str, count_attempt: bool = True
+    ) -> None:
+        """
+        Give a leased shard back after an error. It goes back to pending,
+        or to failed once it has used max_attempts. With count_attempt
+        False (e.g. quota ran out, not the shard's fault) the claim is not
+        counted against it.
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT attempts FROM shards WHERE job_id = ? AND seq = ? "
+                    "AND state = ? AND owner = ?",
+                    (shard.job_id, shard.seq, LEASED, worker_id),
+                ).fetchone()
+                if row is not None:
+                    attempts = row[0] if count_attempt else row[0] - 1
+                    state = FAILED if attempts >= self.max_attempts else PENDING
+                    self._conn.execute(
+                        "UPDATE shards SET state = ?, owner = NULL, lease_expires = NULL, "
+                        "attempts = ?, error = ?, updated_at = ? WHERE job_id = ? AND seq = ?",
+                        (state, attempts, error, time.time(), shard.job_id, shard.seq),
+                    )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def has_open_work(self, job_id: Optional[str] = None) -> bool:
+        """
+        True while a worker may still get something to do: a job is still
+        searching, or shards are pending or leased (a lease can expire).
+        An unsealed job whose coordinator has sent no heartbeat for
+        search_timeout seconds does not count.
+        """
+        job_filter = " AND job_id = ?" if job_id is not None else ""
+        args: Tuple[Any, ...] = (job_id,) if job_id is not None else ()
+        with self._lock:
+            unsealed = self._conn.execute(
+                "SELECT 1 FROM jobs WHERE total_shards IS NULL "
+                "AND COALESCE(heartbeat_at, created_at) >= ?" + job_filter + " LIMIT 1",
+                (time.time() - self.search_timeout,) + args,
+            ).fetchone()
+            active = self._conn.execute(
+                "SELECT 1 FROM shards WHERE state IN (?, ?)" + job_filter + " LIMIT 1",
+                (PENDING, LEASED) + args,
+            ).fetchone()
+        return unsealed is not None or active is not None
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,211 @@
+import json
+import threading
+import time
+from bisect import bisect_left
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# Upper bounds (seconds) of the latency histogram buckets; the last is +Inf
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+PROMETHEUS_PREFIX = "youtube_scraper"
+
+class Histogram:
+    """
+    Fixed-bucket latency histogram. Memory stays constant however many
+    observations a run makes; quantiles are interpolated within buckets.
+    """
+
+    def __init__(self, bounds: Tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            if seen + bucket_count >= rank and bucket_count:
+                lower = self.bounds[i - 1] if i > 0 else 0.0
+                upper = self.bounds[i] if i < len(self.bounds) else self.max
+                upper = min(upper, self.max)
+                fraction = (rank - seen) / bucket_count
+                return lower + (max(upper, lower) - lower) * fraction
+            seen += bucket_count
+        return self.max
+
+class _StageTimer:
+    __slots__ = ("metrics", "stage", "start")
+
+    def __init__(self, metrics: "RunMetrics", stage: str) -> None:
+        self.metrics = metrics
+        self.stage = stage
+
+    def __enter__(self) -> "_StageTimer":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.metrics.observe(self.stage, time.perf_counter() - self.start)
+
+class RunMetrics:
+    """
+    Counters, byte totals and per-stage latency histograms for one run.
+
+    Counters are keyed by a name and a stage label, e.g.
+    count("bytes", "about", 5120). Stages are timed with
+    ``with metrics.timer("about_parse"): ...``. Everything is thread-safe.
+    """
+
+    enabled = True
+
+    def __init__(self) -> None:
+        self.started_at = time.time()
+        self._started = time.perf_counter()
+        self.counters: Dict[Tuple[str, str], float] = {}
+        self.stages: Dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def count(self, name: str, label: str = "", value: float = 1) -> None:
+        key = (name, label)
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            histogram = self.stages.get(stage)
+            if histogram is None:
+                histogram = self.stages[stage] = Histogram()
+            histogram.observe(seconds)
+
+    def timer(self, stage: str) -> _StageTimer:
+        return _StageTimer(self, stage)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            counters: Dict[str, Dict[str, float]] = {}
+            for (name, label), value in sorted(self.counters.items()):
+                counters.setdefault(name, {})[label or "total"] = value
+            stages = {
+                stage: {
+                    "count": h.count,
+                    "total_seconds": round(h.sum, 6),
+                    "mean_ms": round(h.sum / h.count * 1000, 3) if h.count else 0.0,
+                    "p50_ms": round(h.quantile(0.5) * 1000, 3),
+                    "p95_ms": round(h.quantile(0.95) * 1000, 3),
+                    "max_ms": round(h.max * 1000, 3),
+                }
+                for stage, h in sorted(self.stages.items())
+            }
+        return {
+            "started_at": self.started_at,
+            "elapsed_seconds": round(time.perf_counter() - self._started, 3),
+            "counters": counters,
+            "stages": stages,
+        }
+
+    def prometheus_lines(self) -> List[str]:
+        prefix = PROMETHEUS_PREFIX
+        lines: List[str] = []
+        with self._lock:
+            by_name: Dict[str, List[Tuple[str, float]]] = {}
+            for (name, label), value in sorted(self.counters.items()):
+                by_name.setdefault(name, []).append((label, value))
+            for name, values in by_name.items():
+                metric = f"{prefix}_{name}_total"
+                lines.append(f"# TYPE {metric} counter")
+                for label, value in values:
+                    labels = f'{{stage="{label}"}}' if label else ""
+                    lines.append(f"{metric}{labels} {value:g}")
+
+            metric = f"{prefix}_stage_seconds"
+            if self.stages:
+                lines.append(f"# TYPE {metric} histogram")
+            for stage, h in sorted(self.stages.items()):
+                cumulative = 0
+                for bound, bucket_count in zip(h.bounds, h.counts):
+                    cumulative += bucket_count
+                    lines.append(
+                        f'{metric}_bucket{{stage="{stage}",le="{bound:g}"}} {cumulative}'
+                    )
+                lines.append(f'{metric}_bucket{{stage="{stage}",le="+Inf"}} {h.count}')
+                lines.append(f'{metric}_sum{{stage="{stage}"}} {h.sum:.6f}')
+                lines.append(f'{metric}_count{{stage="{stage}"}} {h.count}')
+
+        lines.append(f"# TYPE {prefix}_run_duration_seconds gauge")
+        lines.append(
+            f"{prefix}_run_duration_seconds {time.perf_counter() - self._started:.3f}"
+        )
+        return lines
+
+    def write_json(self, path: Path) -> Path:
+        _write_atomic(path, json.dumps(self.snapshot(), indent=2) + "\n")
+        return path
+
+    def write_prometheus(self, path: Path) -> Path:
+        # Atomic, so the node_exporter textfile collector never reads half a file
+        _write_atomic(path, "\n".join(self.prometheus_lines()) + "\n")
+        return path
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullTimer":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+_NULL_TIMER = _NullTimer()
+
+class NullMetrics:
+    """
+    Drop-in RunMetrics that records nothing. Used when metrics are off, so
+    instrumented code pays one no-op method call per stage.
+    """
+
+    enabled = False
+
+    def count(self, name: str, label: str = "", value: float = 1) -> None:
+        return None
+
+    def observe(self, stage: str, seconds: float) -> None:
+        return None
+
+    def timer(self, stage: str) -> _NullTimer:
+        return _NULL_TIMER
+
+NULL_METRICS = NullMetrics()
+
+def _write_atomic(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    tmp.replace(path)
+
@@ -0,0 +1,71 @@
+import json
+import multiprocessing
+
+import pytest
+
+from parsers.quota_scheduler import QuotaExhausted, QuotaScheduler
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+needs_flock = pytest.mark.skipif(fcntl is None, reason="no cross-process lock")
+
+def scheduler(path, budget: int) -> QuotaScheduler:
+    return QuotaScheduler(daily_budget=budget, requests_per_second=0, state_path=path)
+
+def charge(path, calls: int) -> None:
+    quota = scheduler(path, 10**6)
+    for _ in range(calls):
+        quota.call("channels", lambda: None)
+
+def charge_until_exhausted(path, results) -> None:
+    quota = scheduler(path, 300)
+    calls = 0
+    try:
+        while True:
+            quota.call("channels", lambda: None)
+            calls += 1
+    except QuotaExhausted:
+        results.put(calls)
+
+def run_processes(target, args, count: int = 4) -> None:
+    processes = [multiprocessing.Process(target=target, args=args) for _ in range(count)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=60)
+        assert process.exitcode == 0
+
+def test_charges_persist_across_schedulers(tmp_path):
+    path = tmp_path / "quota_state.json"
+    quota = scheduler(path, 250)
+    quota.call("search", lambda: None)
+    assert quota.call("channels", lambda: "ok") == "ok"
+    assert json.loads(path.read_text())["used"] == 101
+
+    later = scheduler(path, 250)
+    assert later.remaining == 149
+    later.call("search", lambda: None)
+    with pytest.raises(QuotaExhausted):
+        later.call("search", lambda: None)
+    assert later.used_this_run == 100
+
+@needs_flock
+def test_lock_file_sits_next_to_the_state_file(tmp_path):
+    path = tmp_path / "quota_state.json"
+    scheduler(path, 10).call("channels", lambda: None)
+    assert (tmp_path / "quota_state.json.lock").exists()
+
+@needs_flock
+def test_concurrent_processes_lose_no_charges(tmp_path):
+    path = tmp_path / "quota_state.json"
+    run_processes(charge, (path, 250))
+    assert json.loads(path.read_text())["used"] == 1000
+
+@needs_flock
+def test_concurrent_processes_share_one_budget(tmp_path):
+    results = multiprocessing.Queue()
+    run_processes(charge_until_exhausted, (tmp_path / "quota_state.json", results))
+    assert sum(results.get(timeout=10) for _ in range(4)) == 300
@@ -0,0 +1,112 @@
+import pytest
+from _common import standin_scraper
+from standin_server import StandinConfig, StandinServer, channel_id_for, channel_index_from_id
+
+from outputs.contact_table import ContactTable
+from parsers.refresh import (
+    REMOVED,
+    UNCHANGED,
+    UNCHECKED,
+    UPDATED,
+    DatasetRefresher,
+    channel_id_from_url,
+)
+from storage.refresh_state import RefreshState
+
+CHANNELS = 60
+
+@pytest.fixture
+def standin():
+    config = StandinConfig(total_channels=CHANNELS)
+    with StandinServer(config) as server:
+        yield config, server
+
+@pytest.fixture
+def state(tmp_path):
+    state = RefreshState(tmp_path / "refresh.sqlite")
+    yield state
+    state.close()
+
+def scrape(server) -> ContactTable:
+    scraper = standin_scraper(server, concurrency=4)
+    return ContactTable.from_contacts(scraper.iter_contacts("k", CHANNELS))
+
+def refresh(server, state, table):
+    refresher = DatasetRefresher(standin_scraper(server, concurrency=4), state)
+    rows = [contact.to_dict() for contact in refresher.refresh(table)]
+    outcomes = {change["channel_url"]: change["outcome"] for change in refresher.changes}
+    return rows, outcomes, refresher.stats
+
+def index_of(row) -> int:
+    return channel_index_from_id(channel_id_from_url(row["Channel_url"]))
+
+def test_channel_id_from_url():
+    channel_id = channel_id_for(7)
+    assert len(channel_id) == 24
+    assert channel_id_from_url(channel_id) == channel_id
+    assert channel_id_from_url(f"https://www.youtube.com/channel/{channel_id}/") == channel_id
+    assert channel_id_from_url("https://www.youtube.com/@somecreator") == ""
+    assert channel_id_from_url("https://www.youtube.com/c/SomeCreator") == ""
+    assert channel_id_from_url(f"https://www.youtube.com/channel/{channel_id}x") == ""
+
+def test_unchanged_channels_need_no_about_fetch(standin, state):
+    _, server = standin
+    table = scrape(server)
+    before = [contact.to_dict() for contact in table]
+
+    rows, outcomes, stats = refresh(server, state, table)
+    assert rows == before
+    assert outcomes == {}
+    assert stats.snippet_matches == len(before)
+    assert stats.about_fetches == 0
+
+    rows, _, stats = refresh(server, state, table)
+    assert rows == before
+    assert stats.etag_matches == len(before)
+    assert stats.about_fetches == 0
+
+def test_edited_and_removed_channels(standin, state):
+    config, server = standin
+    table = scrape(server)
+    before = [contact.to_dict() for contact in table]
+    edited, removed = index_of(before[0]), index_of(before[1])
+    config.revisions[edited] = 1
+    config.removed.add(removed)
+
+    rows, outcomes, stats = refresh(server, state, table)
+    assert outcomes == {
+        before[0]["Channel_url"]: UPDATED,
+        before[1]["Channel_url"]: REMOVED,
+    }
+    assert len(rows) == len(before) - 1
+    assert rows[0]["Description"] != before[0]["Description"]
+    assert rows[1:] == before[2:]
+    assert stats.about_fetches == 1
+
+def test_rows_without_a_channel_id_are_kept_unchecked(standin, state):
+    _, server = standin
+    table = scrape(server)
+    rows = [contact.to_dict() for contact in table]
+    rows[0]["Channel_url"] = "https://www.youtube.com/@somecreator"
+    edited = ContactTable()
+    for row in rows:
+        edited.append_row(row)
+
+    refreshed, outcomes, _ = refresh(server, state, edited)
+    assert refreshed == rows
+    assert outcomes == {"https://www.youtube.com/@somecreator": UNCHECKED}
+
+def test_etag_match_does_not_keep_an_older_dataset(standin, state):
+    config, server = standin
+    old = scrape(server)
+    old_rows = [contact.to_dict() for contact in old]
+    edited = index_of(old_rows[0])
+    config.revisions[edited] = 1
+    # The newer copy of the dataset leaves the state at the edited etag
+    refresh(server, state, scrape(server))
+
+    rows, outcomes, stats = refresh(server, state, old)
+    assert outcomes == {old_rows[0]["Channel_url"]: UPDATED}
+    assert rows[0]["Description"] != old_rows[0]["Description"]
+    assert stats.etag_matches == len(old_rows) - 1
+    assert UNCHANGED not in outcomes.values()
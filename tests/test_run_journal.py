@@ -0,0 +1,77 @@
+import os
+import time
+
+from storage.run_journal import RunJournal
+
+def record_run(journal: RunJournal) -> None:
+    journal.record_search_page("cats", 0, None, ["UCa", "UCb"], "NEXT")
+    journal.record_channel_batch(["UCa", "UCb"], [{"id": "UCa"}, {"id": "UCb"}])
+    journal.record_channel("UCa", {"Channel_url": "a", "Email": "a@gmail.com"})
+    journal.record_channel("UCb", None)
+
+def test_resume_replays_recorded_work_once(tmp_path):
+    journal = RunJournal.create(tmp_path, {"keyword": "cats"})
+    record_run(journal)
+    journal.close()
+
+    resumed = RunJournal.resume(tmp_path, journal.run_id)
+    assert resumed.params == {"keyword": "cats"}
+    assert not resumed.completed
+    assert resumed.get_search_page("cats", 0, None) == (["UCa", "UCb"], "NEXT")
+    assert resumed.get_channel_batch(["UCa", "UCb"]) == [{"id": "UCa"}, {"id": "UCb"}]
+    assert resumed.get_channel("UCa") == (True, {"Channel_url": "a", "Email": "a@gmail.com"})
+    assert resumed.get_channel("UCb") == (True, None)
+
+    # Replayed entries are dropped; unrecorded work falls through
+    assert resumed.get_search_page("cats", 0, None) is None
+    assert resumed.get_channel_batch(["UCa", "UCb"]) is None
+    assert resumed.get_channel("UCa") == (False, None)
+    assert resumed.get_search_page("cats", 0, "NEXT") is None
+    resumed.close()
+
+def test_fresh_run_only_appends(tmp_path):
+    journal = RunJournal.create(tmp_path, {})
+    record_run(journal)
+    # Nothing recorded by this run is replayed to it
+    assert journal.get_channel("UCa") == (False, None)
+    assert journal.get_search_page("cats", 0, None) is None
+    journal.close()
+    assert len(journal.path.read_text(encoding="utf-8").splitlines()) == 5
+
+def test_torn_last_line_is_ignored_and_appends_continue(tmp_path):
+    journal = RunJournal.create(tmp_path, {})
+    record_run(journal)
+    journal.close()
+    with journal.path.open("a", encoding="utf-8") as f:
+        f.write('{"type": "channel", "id": "UC')
+
+    resumed = RunJournal.resume(tmp_path, journal.run_id)
+    resumed.record_channel("UCc", None)
+    resumed.mark_complete()
+    resumed.close()
+
+    again = RunJournal.resume(tmp_path, journal.run_id)
+    assert again.completed
+    assert again.get_channel("UCa")[0]
+    assert again.get_channel("UCc") == (True, None)
+    again.close()
+
+def test_prune_completed_keeps_recent_and_interrupted_runs(tmp_path):
+    old_done = RunJournal.create(tmp_path, {})
+    old_done.mark_complete()
+    old_done.close()
+    old_interrupted = RunJournal.create(tmp_path, {})
+    record_run(old_interrupted)
+    old_interrupted.close()
+    recent_done = RunJournal.create(tmp_path, {})
+    recent_done.mark_complete()
+    recent_done.close()
+    week_ago = time.time() - 8 * 86400
+    for journal in (old_done, old_interrupted):
+        os.utime(journal.path, (week_ago, week_ago))
+
+    assert RunJournal.prune_completed(tmp_path, 7 * 86400) == 1
+    assert not old_done.path.exists()
+    assert old_interrupted.path.exists()
+    assert recent_done.path.exists()
+    assert RunJournal.prune_completed(tmp_path / "missing", 0) == 0
@@ -0,0 +1,91 @@
+import time
+
+import pytest
+
+from storage.shard_queue import DONE, FAILED, LEASED, PENDING, ShardQueue
+
+@pytest.fixture
+def queue(tmp_path):
+    queue = ShardQueue(tmp_path / "queue.sqlite", lease_seconds=0.05, max_attempts=2)
+    yield queue
+    queue.close()
+
+def add_job(queue: ShardQueue, shards: int, job_id: str = "job") -> None:
+    queue.create_job(job_id, {"keyword": "k"})
+    for seq in range(shards):
+        queue.add_shard(job_id, seq, [f"UC{seq}"])
+    queue.seal(job_id, shards)
+
+def test_claims_lease_each_shard_once_in_order(queue):
+    add_job(queue, 2)
+    first = queue.claim("w1")
+    second = queue.claim("w2")
+    assert (first.seq, second.seq) == (0, 1)
+    assert first.channel_ids == ["UC0"]
+    assert first.params == {"keyword": "k"}
+    assert queue.claim("w3") is None
+    assert queue.progress("job")[LEASED] == 2
+
+def test_expired_lease_is_requeued_then_failed_after_max_attempts(queue):
+    add_job(queue, 1)
+    first = queue.claim("w1")
+    time.sleep(0.1)
+
+    retry = queue.claim("w2")
+    assert retry is not None and retry.seq == 0 and retry.attempts == 2
+    # w1 lost the shard with its lease
+    assert not queue.renew(first, "w1")
+    time.sleep(0.1)
+    assert queue.requeue_expired() == 1
+    assert queue.progress("job")[FAILED] == 1
+    result = queue.result("job", 0)
+    assert result.state == FAILED
+    assert "w2" in result.error
+    assert not queue.has_open_work("job")
+
+def test_first_completion_wins(queue):
+    add_job(queue, 1)
+    shard = queue.claim("w1")
+    time.sleep(0.1)
+    retry = queue.claim("w2")
+    assert queue.complete(retry, "w2", [{"Email": "b@gmail.com"}], failed_ids=["UCx"])
+    # The original worker finishes late; its result does not replace w2's
+    assert not queue.complete(shard, "w1", [{"Email": "a@gmail.com"}])
+    result = queue.result("job", 0)
+    assert result.state == DONE
+    assert result.contacts == [{"Email": "b@gmail.com"}]
+    assert result.failed_ids == ["UCx"]
+    assert list(queue.iter_job_results("job", poll_interval=0.01)) == [result]
+
+def test_release_without_counting_the_attempt(tmp_path):
+    queue = ShardQueue(tmp_path / "queue.sqlite", max_attempts=1)
+    add_job(queue, 1)
+    queue.release(queue.claim("w1"), "w1", "quota", count_attempt=False)
+    assert queue.progress("job")[PENDING] == 1
+    queue.release(queue.claim("w1"), "w1", "boom")
+    assert queue.progress("job")[FAILED] == 1
+    queue.close()
+
+def test_unsealed_job_counts_as_open_until_its_heartbeat_stops(tmp_path):
+    queue = ShardQueue(tmp_path / "queue.sqlite", search_timeout=0.1)
+    queue.create_job("job", {})
+    assert queue.has_open_work("job")
+    time.sleep(0.15)
+    assert not queue.has_open_work("job")
+    queue.touch_job("job")
+    assert queue.has_open_work("job")
+    queue.close()
+
+def test_restarted_coordinator_replays_its_shards_safely(tmp_path):
+    path = tmp_path / "queue.sqlite"
+    queue = ShardQueue(path)
+    add_job(queue, 2)
+    queue.close()
+
+    restarted = ShardQueue(path)
+    assert not restarted.create_job("job", {"keyword": "other"})
+    restarted.add_shard("job", 0, ["UCother"])
+    assert restarted.job_params("job") == {"keyword": "k"}
+    assert restarted.claim("w1").channel_ids == ["UC0"]
+    assert restarted.total_shards("job") == 2
+    restarted.close()